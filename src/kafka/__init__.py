@@ -1,6 +1,17 @@
 from .acl import Acl
+from .backup import Backup
+from .cache import CachedAdminClient
 from .cluster import Cluster
 from .consumer_group import ConsumerGroup
 from .consumer import Consumer
+from .group_offsets import GroupOffsets
+from .name_index import NameIndex
+from .partition_reassignment import PartitionReassignment
+from .perf import Perf
+from .probe import Probe
 from .producer import Producer
-from .topic import Topic
\ No newline at end of file
+from .query import Query
+from .snapshot import Snapshot
+from .topic import Topic
+from .topic_copy import TopicCopy
+from .topic_watch import TopicWatch
\ No newline at end of file
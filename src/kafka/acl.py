@@ -12,47 +12,246 @@ class Acl(KafkaResource):
         """
         super().__init__(admin_client=admin_client)
 
-    def list(self):
-        raise NotImplemented
-    
-    def create(self, timeout=10):
-        raise NotImplemented
-       
-    def describe(self, resource_type, resource_name, principal=None, permission_type=None, timeout=10):
+    @staticmethod
+    def to_binding(acl):
+        """
+        Convert an ACL dictionary into a Kafka ACL binding.
+
+        Args:
+            acl (dict): The ACL with the `resource_type`, `resource_name`, `principal`, `operation` and
+                `permission_type` keys. The `pattern_type` and `host` keys default to `literal` and `*`.
+
+        Returns:
+            confluent_kafka.admin.AclBinding: The Kafka ACL binding.
+
+        Raises:
+            ValueError: If the ACL is not a dictionary, a key is missing or a value is not a valid name.
+        """
+        if not isinstance(acl, dict):
+            raise ValueError(f"expected a mapping, got {type(acl).__name__}")
+
+        def field(key, default=None):
+            value = acl.get(key, default)
+            if value is None:
+                raise ValueError(f"missing '{key}'")
+            return value
+
+        def member(enum, key, default=None):
+            value = str(field(key, default)).upper()
+            if value not in enum.__members__:
+                raise ValueError(f"invalid '{key}' {value!r}, expected one of {', '.join(enum.__members__)}")
+            return enum[value]
+
+        return AclBinding(
+            member(ResourceType, "resource_type"),
+            field("resource_name"),
+            member(ResourcePatternType, "pattern_type", "literal"),
+            field("principal"),
+            field("host", "*"),
+            member(AclOperation, "operation"),
+            member(AclPermissionType, "permission_type"),
+        )
+
+    @classmethod
+    def _to_bindings(cls, acls):
+        """
+        Convert every ACL dictionary into a Kafka ACL binding before any request is sent.
+
+        Args:
+            acls (list[dict]): The ACLs. See `Acl.to_binding` for the keys.
+
+        Returns:
+            list[confluent_kafka.admin.AclBinding]: The Kafka ACL bindings, in the same order.
+
+        Raises:
+            ValueError: If an ACL is malformed. The message names the index of the entry.
+        """
+        bindings = []
+        for i, acl in enumerate(acls):
+            try:
+                bindings.append(cls.to_binding(acl))
+            except ValueError as e:
+                raise ValueError(f"ACL entry {i}: {e}") from None
+        return bindings
+
+    @staticmethod
+    def to_dict(binding):
+        """
+        Convert a Kafka ACL binding into an ACL dictionary.
+
+        Args:
+            binding (confluent_kafka.admin.AclBinding): The Kafka ACL binding.
+
+        Returns:
+            dict: The ACL dictionary.
+        """
+        return {
+            "resource_type": binding.restype.name,
+            "resource_name": binding.name,
+            "pattern_type": binding.resource_pattern_type.name,
+            "principal": binding.principal,
+            "host": binding.host,
+            "operation": binding.operation.name,
+            "permission_type": binding.permission_type.name,
+        }
+
+    def _describe_bindings(self, timeout=10):
+        """Describe every Kafka ACL binding in the cluster."""
+        acl_binding_filter = AclBindingFilter(
+            ResourceType.ANY,
+            None,
+            ResourcePatternType.ANY,
+            None,
+            None,
+            AclOperation.ANY,
+            AclPermissionType.ANY,
+        )
+        future = self.admin_client.describe_acls(acl_binding_filter, request_timeout=timeout)
+        return future.result()
+
+    def get(self, timeout=10):
+        """
+        Get the Kafka Access Control Lists (ACLs).
+
+        Args:
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            list[dict]: A list of Kafka ACLs.
+
+        Raises:
+            KafkaError: If there is an error during the process.
+        """
+        return [self.to_dict(b) for b in self._describe_bindings(timeout=timeout)]
+
+    def create(self, acls, batch_size=100, timeout=10):
+        """
+        Create many Kafka Access Control Lists (ACLs) in batches.
+
+        The existing bindings are described once up front and any requested binding that already
+        exists is skipped, so re-applying the same file is a no-op.
+
+        Args:
+            acls (list[dict]): The ACLs to be created. See `Acl.to_binding` for the keys.
+            batch_size (int, optional): The maximum number of bindings per `create_acls` request.
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            list[dict]: The ACLs with an additional `result` key set to `created`, `unchanged` or the error.
+
+        Raises:
+            ValueError: If an ACL is malformed.
+            KafkaError: If there is an error while describing the existing ACLs.
+        """
+        bindings = self._to_bindings(acls)
+        existing = set(self._describe_bindings(timeout=timeout))
+
+        results = {}
+        pending = []
+        for binding in bindings:
+            if binding in results:
+                continue
+            if binding in existing:
+                results[binding] = "unchanged"
+            else:
+                results[binding] = None
+                pending.append(binding)
+
+        for i in range(0, len(pending), batch_size):
+            future = self.admin_client.create_acls(pending[i : i + batch_size], request_timeout=timeout)
+            for binding, f in future.items():
+                try:
+                    f.result()
+                    results[binding] = "created"
+                except Exception as e:
+                    results[binding] = str(e)
+
+        return [dict(self.to_dict(b), result=r) for b, r in results.items()]
+
+    def describe(self, resource_type="any", resource_name=None, principal=None, permission_type="any", timeout=10):
         """
         Describe the Kafka Access Control Lists (ACLs).
 
         Args:
-            resource_type (kafka.admin.acl.ResourceType): The Kafka resource type.
-            resource_name (str): The Kafka resource name.
+            resource_type (str, optional): The Kafka resource type.
+            resource_name (str, optional): The Kafka resource name.
             principal (str, optional): The principal for the ACL.
             permission_type (str, optional): The permission type for the ACL.
             timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
 
         Returns:
-            None
-        """
-        # acl_binding_filter = AclBindingFilter(
-        #     resource_type,
-        #     resource_name,
-        #     ResourcePatternType.LITERAL,
-        #     principal,
-        #     "*",
-        #     permission_type,
-        #     None
-        # )
-
-        # future = self.admin_client.describe_acls(acl_binding_filter, request_timeout=timeout)
-
-        # acl_bindings = future.result()
-        # acls = []
-        # for acl_binding in acl_bindings:
-        #     print(acl_binding)
-        # return acls
-        pass
-        
+            list[dict]: A list of the matching Kafka ACLs.
+
+        Raises:
+            KafkaError: If there is an error during the process.
+        """
+        acl_binding_filter = AclBindingFilter(
+            ResourceType[resource_type.upper()],
+            resource_name,
+            ResourcePatternType.ANY,
+            principal,
+            None,
+            AclOperation.ANY,
+            AclPermissionType[permission_type.upper()],
+        )
+
+        future = self.admin_client.describe_acls(acl_binding_filter, request_timeout=timeout)
+        return [self.to_dict(b) for b in future.result()]
+
     def alter(self):
         raise NotImplemented
 
-    def delete(self):
-        raise NotImplemented
\ No newline at end of file
+    def delete(self, acls, batch_size=100, timeout=10):
+        """
+        Delete many Kafka Access Control Lists (ACLs) in batches.
+
+        Each ACL is matched exactly. ACLs that do not exist are skipped without sending a request.
+
+        Args:
+            acls (list[dict]): The ACLs to be deleted. See `Acl.to_binding` for the keys.
+            batch_size (int, optional): The maximum number of filters per `delete_acls` request.
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            list[dict]: The ACLs with an additional `result` key set to `deleted`, `absent` or the error.
+
+        Raises:
+            ValueError: If an ACL is malformed.
+            KafkaError: If there is an error while describing the existing ACLs.
+        """
+        bindings = self._to_bindings(acls)
+        existing = set(self._describe_bindings(timeout=timeout))
+
+        results = {}
+        pending = {}
+        for binding in bindings:
+            if binding in results:
+                continue
+            if binding not in existing:
+                results[binding] = "absent"
+            else:
+                results[binding] = None
+                pending[binding] = AclBindingFilter(
+                    binding.restype,
+                    binding.name,
+                    binding.resource_pattern_type,
+                    binding.principal,
+                    binding.host,
+                    binding.operation,
+                    binding.permission_type,
+                )
+
+        bindings = list(pending.keys())
+        for i in range(0, len(bindings), batch_size):
+            chunk = bindings[i : i + batch_size]
+            future = self.admin_client.delete_acls([pending[b] for b in chunk], request_timeout=timeout)
+            by_filter = {pending[b]: b for b in chunk}
+            for acl_binding_filter, f in future.items():
+                binding = by_filter[acl_binding_filter]
+                try:
+                    f.result()
+                    results[binding] = "deleted"
+                except Exception as e:
+                    results[binding] = str(e)
+
+        return [dict(self.to_dict(b), result=r) for b, r in results.items()]
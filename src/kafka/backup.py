@@ -0,0 +1,282 @@
+from confluent_kafka import KafkaError, KafkaException
+
+import gzip
+import json
+import os
+import queue
+import struct
+import threading
+
+from .consumer import Consumer
+from .producer import Producer
+
+RECORD = struct.Struct(">qqiiH")
+HEADER = struct.Struct(">Hi")
+
+
+def write_record(f, offset, timestamp, key, value, headers):
+    """
+    Write a message to a segment file.
+
+    Args:
+        f (file): The segment file opened in binary mode.
+        offset (int): The message offset.
+        timestamp (int): The message timestamp in milliseconds.
+        key (bytes): The message key.
+        value (bytes): The message value.
+        headers (list): The message headers as `(name, value)` pairs.
+
+    Returns:
+        int: The number of bytes written.
+    """
+    headers = headers or []
+    data = [RECORD.pack(offset, timestamp, -1 if key is None else len(key), -1 if value is None else len(value), len(headers))]
+    data.append(key or b"")
+    data.append(value or b"")
+    for name, header_value in headers:
+        name = name.encode()
+        data.append(HEADER.pack(len(name), -1 if header_value is None else len(header_value)))
+        data.append(name)
+        data.append(header_value or b"")
+
+    data = b"".join(data)
+    f.write(data)
+    return len(data)
+
+
+def read_records(path):
+    """
+    Read the messages of a segment file.
+
+    Args:
+        path (str): The path of the segment file.
+
+    Yields:
+        tuple: The offset, timestamp, key, value and headers of every message.
+    """
+    with gzip.open(path, "rb") as f:
+        while True:
+            data = f.read(RECORD.size)
+            if not data:
+                return
+            offset, timestamp, key_size, value_size, header_count = RECORD.unpack(data)
+            key = f.read(key_size) if key_size >= 0 else None
+            value = f.read(value_size) if value_size >= 0 else None
+            headers = []
+            for _ in range(header_count):
+                name_size, header_size = HEADER.unpack(f.read(HEADER.size))
+                name = f.read(name_size).decode()
+                headers.append((name, f.read(header_size) if header_size >= 0 else None))
+            yield offset, timestamp, key, value, headers or None
+
+
+class Backup():
+    def __init__(self, admin_client, bootstrap_servers=None):
+        """
+        The Kafka Topic backup class.
+
+        A backup is a directory with an `index.json` file and a sub-directory per partition holding
+        gzip compressed segment files. The index records the offset and timestamp range of every
+        segment, so a time range is restored by only decompressing the segments that overlap it.
+
+        Args:
+            admin_client (kafka.admin.client.AsyncAdminClient): The Kafka AdminClient instance.
+            bootstrap_servers (str, optional): The bootstrap servers used by the consumers and the producer.
+        """
+        self.admin_client = admin_client
+        self.bootstrap_servers = bootstrap_servers
+
+    def backup(self, topic, path, partitions=None, start=None, end=None, segment_bytes=64 * 1024 * 1024, workers=4, batch_size=1000, timeout=10):
+        """
+        Back up the messages of a Kafka Topic to a directory.
+
+        The partitions are consumed by parallel workers up to their latest offsets at the start of
+        the backup. Each worker rolls over to a new segment file once `segment_bytes` of
+        uncompressed data were written to the current one.
+
+        Args:
+            topic (str): The topic name.
+            path (str): The backup directory. It is created when it does not exist.
+            partitions (list[int], optional): The partitions. If None, all partitions are backed up.
+            start (int, optional): The start timestamp in milliseconds.
+            end (int, optional): The end timestamp in milliseconds.
+            segment_bytes (int, optional): The maximum uncompressed size of a segment file.
+            workers (int, optional): The number of parallel workers.
+            batch_size (int, optional): The maximum number of messages per consume call.
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            dict: The backup index.
+
+        Raises:
+            KafkaError: If there is an error during the process.
+        """
+        consumer = Consumer(self.admin_client, self.bootstrap_servers)
+        ranges = consumer.get_ranges(topic, partitions=partitions, start=start, end=end, timeout=timeout)
+
+        work = queue.Queue()
+        for partition, offsets in ranges.items():
+            work.put((partition, offsets))
+
+        segments = {}
+        errors = []
+        stop = threading.Event()
+
+        def write_partition(kafka_consumer, partition, low, high):
+            directory = os.path.join(path, str(partition))
+            os.makedirs(directory, exist_ok=True)
+            results = []
+            segment = None
+            f = None
+
+            def close_segment():
+                if f is not None:
+                    f.close()
+                    results.append(segment)
+
+            for batch in consumer.read_ranges(kafka_consumer, topic, {partition: (low, high)}, batch_size=batch_size, stop=stop):
+                for m in batch:
+                    if f is None or segment["bytes"] >= segment_bytes:
+                        close_segment()
+                        name = f"{m.offset():020d}.seg.gz"
+                        f = gzip.open(os.path.join(directory, name), "wb", compresslevel=6)
+                        segment = {
+                            "file": f"{partition}/{name}",
+                            "start_offset": m.offset(),
+                            "end_offset": m.offset(),
+                            "start_timestamp": None,
+                            "end_timestamp": None,
+                            "messages": 0,
+                            "bytes": 0,
+                        }
+
+                    timestamp = m.timestamp()[1]
+                    segment["bytes"] += write_record(f, m.offset(), timestamp, m.key(), m.value(), m.headers())
+                    segment["end_offset"] = m.offset()
+                    segment["messages"] += 1
+                    # Timestamps are not guaranteed to increase with offsets, so the range is tracked.
+                    if segment["start_timestamp"] is None or timestamp < segment["start_timestamp"]:
+                        segment["start_timestamp"] = timestamp
+                    if segment["end_timestamp"] is None or timestamp > segment["end_timestamp"]:
+                        segment["end_timestamp"] = timestamp
+
+            close_segment()
+            return results
+
+        def worker():
+            kafka_consumer = consumer._consumer()
+            try:
+                while not stop.is_set():
+                    try:
+                        partition, (low, high) = work.get_nowait()
+                    except queue.Empty:
+                        return
+                    segments[partition] = write_partition(kafka_consumer, partition, low, high)
+            except Exception as e:
+                errors.append(e)
+                stop.set()
+            finally:
+                kafka_consumer.close()
+
+        threads = [threading.Thread(target=worker, daemon=True) for _ in range(max(1, min(workers, len(ranges))))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if errors:
+            raise errors[0]
+
+        index = {
+            "version": 1,
+            "topic": topic,
+            "partitions": {str(p): segments.get(p, []) for p in sorted(ranges)},
+        }
+        os.makedirs(path, exist_ok=True)
+        with open(os.path.join(path, "index.json"), "w") as f:
+            json.dump(index, f, indent=2)
+
+        return index
+
+    @staticmethod
+    def load_index(path):
+        """
+        Load the index of a backup.
+
+        Args:
+            path (str): The backup directory.
+
+        Returns:
+            dict: The backup index.
+        """
+        with open(os.path.join(path, "index.json")) as f:
+            return json.load(f)
+
+    def restore(self, path, topic=None, partitions=None, start=None, end=None, keep_partitions=True, producer_config=None, timeout=10):
+        """
+        Restore a backup to a Kafka Topic.
+
+        Only the segments whose timestamp range overlaps `[start, end)` are decompressed, and the
+        messages are replayed through a batching producer with their key, headers and timestamp.
+
+        Args:
+            path (str): The backup directory.
+            topic (str, optional): The target topic name. If None, the backed up topic name is used.
+            partitions (list[int], optional): The partitions to restore. If None, all partitions are restored.
+            start (int, optional): The start timestamp in milliseconds.
+            end (int, optional): The end timestamp in milliseconds.
+            keep_partitions (bool, optional): Whether to produce every message to its original partition.
+            producer_config (dict, optional): Additional producer configuration.
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            dict: The number of `segments` read and `messages` restored.
+
+        Raises:
+            KafkaError: If there is an error during the process.
+        """
+        index = self.load_index(path)
+        topic = topic or index["topic"]
+
+        selected = []
+        for partition, partition_segments in index["partitions"].items():
+            partition = int(partition)
+            if partitions and partition not in partitions:
+                continue
+            for segment in partition_segments:
+                if start is not None and segment["end_timestamp"] < start:
+                    continue
+                if end is not None and segment["start_timestamp"] >= end:
+                    continue
+                selected.append((partition, segment))
+
+        if keep_partitions and selected:
+            metadata = self.admin_client.list_topics(topic, timeout=timeout).topics.get(topic)
+            available = len(metadata.partitions) if metadata is not None else 0
+            needed = max(p for p, _ in selected) + 1
+            if available < needed:
+                raise KafkaException(KafkaError(
+                    KafkaError.INVALID_PARTITIONS,
+                    f"The topic '{topic}' has {available} partitions but the backup needs {needed}.",
+                ))
+
+        producer = Producer(self.admin_client, self.bootstrap_servers, config=producer_config)
+        messages = 0
+        for partition, segment in selected:
+            for offset, timestamp, key, value, headers in read_records(os.path.join(path, segment["file"])):
+                if start is not None and timestamp < start:
+                    continue
+                if end is not None and timestamp >= end:
+                    continue
+                producer.produce(
+                    topic,
+                    value=value,
+                    key=key,
+                    partition=partition if keep_partitions else None,
+                    timestamp=timestamp if timestamp > 0 else None,
+                    headers=headers,
+                )
+                messages += 1
+        producer.flush()
+
+        return {"segments": len(selected), "messages": messages}
@@ -0,0 +1,199 @@
+from collections import OrderedDict
+
+import threading
+import time
+
+
+class CachedAdminClient():
+    # The admin operations that only read the cluster state. Every other operation may change it
+    # and so invalidates the cache.
+    READS = (
+        "cluster_id",
+        "describe_acls",
+        "describe_cluster",
+        "describe_configs",
+        "describe_consumer_groups",
+        "describe_topics",
+        "describe_user_scram_credentials",
+        "list_consumer_group_offsets",
+        "list_consumer_groups",
+        "list_groups",
+        "list_offsets",
+        "poll",
+    )
+
+    def __init__(self, admin_client, ttl=5):
+        """
+        The caching Kafka AdminClient wrapper class.
+
+        It behaves like the wrapped AdminClient, except that `list_topics` results are reused for
+        `ttl` seconds, so a series of commands shares one metadata request. Any admin operation that
+        is not a known read clears the cache.
+
+        Args:
+            admin_client (kafka.admin.client.AsyncAdminClient): The Kafka AdminClient instance.
+            ttl (float, optional): The number of seconds a metadata result is reused for.
+        """
+        self.admin_client = admin_client
+        self.ttl = ttl
+        self.metadata = {}
+        self.lock = threading.Lock()
+
+    def __getattr__(self, name):
+        attribute = getattr(self.admin_client, name)
+        if callable(attribute) and name not in self.READS:
+            def mutation(*args, **kwargs):
+                self.invalidate()
+                return attribute(*args, **kwargs)
+            return mutation
+        return attribute
+
+    def invalidate(self):
+        """Clear the cached metadata."""
+        with self.lock:
+            self.metadata.clear()
+
+    def list_topics(self, topic=None, timeout=-1):
+        """
+        Get the cluster metadata, reusing a result younger than the TTL.
+
+        Args:
+            topic (str, optional): The topic to get the metadata of. If None, all topics are included.
+            timeout (float, optional): The time (in seconds) to wait for the metadata request.
+
+        Returns:
+            confluent_kafka.admin.ClusterMetadata: The cluster metadata.
+        """
+        now = time.monotonic()
+        with self.lock:
+            cached = self.metadata.get(topic)
+        if cached is not None and now - cached[0] < self.ttl:
+            return cached[1]
+
+        metadata = self.admin_client.list_topics(topic, timeout=timeout)
+        with self.lock:
+            self.metadata[topic] = (now, metadata)
+        return metadata
+
+
+class TTLCache():
+    def __init__(self, ttl=10, refresh_ahead=0.8, idle=None, max_size=1024):
+        """
+        The coalescing TTL cache class.
+
+        Concurrent `get` calls for a missing key share one call of the loader. An entry older than
+        `refresh_ahead` of its TTL is still returned but refreshed in the background, so entries
+        that keep being read never expire in front of a caller. Entries not read for `idle` seconds
+        are dropped instead of refreshed, and at most `max_size` entries are kept, dropping the least
+        recently read first. A load started before an invalidation is not stored.
+
+        Args:
+            ttl (float, optional): The number of seconds an entry is fresh for.
+            refresh_ahead (float, optional): The fraction of the TTL after which an entry is refreshed in the background.
+            idle (float, optional): The number of seconds after which an unread entry is dropped. Defaults to ten TTLs.
+            max_size (int, optional): The maximum number of entries.
+        """
+        self.ttl = ttl
+        self.refresh_ahead = refresh_ahead
+        self.idle = idle or ttl * 10
+        self.max_size = max_size
+        # Ordered from the least to the most recently read entry.
+        self.entries = OrderedDict()
+        self.pending = {}
+        self.generation = 0
+        self.lock = threading.Lock()
+
+    def _evict(self, now):
+        # The least recently read entries come first, so only the dropped entries are visited.
+        while self.entries:
+            key, entry = next(iter(self.entries.items()))
+            if now - entry["read"] <= self.idle and len(self.entries) <= self.max_size:
+                break
+            del self.entries[key]
+
+    def _load(self, key, loader, event):
+        # Only the caller that registered the pending event runs the loader, the others wait for it.
+        try:
+            event.value = loader()
+            with self.lock:
+                if event.generation == self.generation:
+                    now = time.monotonic()
+                    previous = self.entries.get(key)
+                    self.entries[key] = {"value": event.value, "loaded": now, "read": previous["read"] if previous else now}
+                    self._evict(now)
+        except Exception as e:
+            event.error = e
+        finally:
+            with self.lock:
+                if self.pending.get(key) is event:
+                    del self.pending[key]
+            event.set()
+
+    def _pending(self, key):
+        event = self.pending[key] = threading.Event()
+        event.value = None
+        event.error = None
+        event.generation = self.generation
+        return event
+
+    def get(self, key, loader, ttl=None):
+        """
+        Get a cached value, loading it when it is missing or expired.
+
+        Args:
+            key (hashable): The cache key.
+            loader (callable): The function that loads the value.
+            ttl (float, optional): The TTL of this entry. Defaults to the cache TTL.
+
+        Returns:
+            object: The value.
+
+        Raises:
+            Exception: The exception raised by the loader.
+        """
+        ttl = ttl or self.ttl
+        now = time.monotonic()
+
+        with self.lock:
+            self._evict(now)
+            entry = self.entries.get(key)
+            if entry is not None and now - entry["loaded"] < ttl:
+                entry["read"] = now
+                self.entries.move_to_end(key)
+                if now - entry["loaded"] >= ttl * self.refresh_ahead and key not in self.pending:
+                    event = self._pending(key)
+                    threading.Thread(target=self._load, args=(key, loader, event), daemon=True).start()
+                return entry["value"]
+
+            event = self.pending.get(key)
+            owner = event is None
+            if owner:
+                event = self._pending(key)
+
+        if owner:
+            self._load(key, loader, event)
+        else:
+            event.wait()
+
+        if event.error is not None:
+            raise event.error
+        return event.value
+
+    def invalidate(self, key=None):
+        """
+        Drop a cached value. Loads that are in flight are not stored.
+
+        Args:
+            key (hashable, optional): The cache key. If None, every value is dropped.
+
+        Returns:
+            None
+        """
+        with self.lock:
+            self.generation += 1
+            if key is None:
+                self.entries.clear()
+                self.pending.clear()
+            else:
+                self.entries.pop(key, None)
+                self.pending.pop(key, None)
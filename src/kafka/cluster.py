@@ -1,8 +1,22 @@
+from collections import Counter
 from confluent_kafka import KafkaException
 from confluent_kafka.admin import ConfigResource
 from .kafka_resource import KafkaResource
 from .consumer_group import ConsumerGroup
 
+# The broker configs whose value is expected to differ between brokers.
+IDENTITY_CONFIGS = (
+    "broker.id",
+    "node.id",
+    "broker.rack",
+    "listeners",
+    "advertised.listeners",
+    "listener.security.protocol.map",
+    "log.dir",
+    "log.dirs",
+    "metadata.log.dir",
+)
+
 class Cluster(KafkaResource):
     def __init__(self, admin_client):
         """
@@ -38,6 +52,26 @@ class Cluster(KafkaResource):
 
         return brokers
     
+    def get_racks(self, timeout=10):
+        """
+        Get the rack of each Kafka Broker.
+
+        Args:
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            dict: The rack for each broker id, or an empty dict when the racks are unknown.
+
+        Raises:
+            KafkaError: If there is an error during the process.
+        """
+        if not hasattr(self.admin_client, "describe_cluster"):
+            return {}
+
+        future = self.admin_client.describe_cluster(request_timeout=timeout)
+        racks = {node.id: node.rack for node in future.result().nodes if node.rack}
+        return racks
+
     def get_default_configs(self, timeout=10):
         """
         Get the Kafka cluster default configuration.
@@ -60,6 +94,55 @@ class Cluster(KafkaResource):
         
         return results
     
+    def describe_configs(self, brokers=None, drift=False, ignore=IDENTITY_CONFIGS, timeout=10):
+        """
+        Describe the configuration of each Kafka Broker.
+
+        Args:
+            brokers (list[int], optional): The broker ids to describe. If None, all brokers are described.
+            drift (bool, optional): Whether to only return the configs whose value differs between brokers.
+            ignore (Iterable[str], optional): The configs left out of the drift report. Defaults to the
+                configs that identify a single broker, such as `broker.id` and `listeners`.
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            dict: The value and source of each config for each broker id under `configs`, and the error
+                of each broker whose configs cannot be described under `errors`.
+
+        Raises:
+            KafkaError: If the brokers cannot be listed.
+        """
+        if not brokers:
+            brokers = list(self.admin_client.list_topics(timeout=timeout).brokers.keys())
+        # Only one broker resource is allowed per request, so one request is sent per broker and
+        # every request is kept in flight before the results are read.
+        futures = {}
+        for b in brokers:
+            futures.update(self.admin_client.describe_configs([ConfigResource("broker", str(b))], request_timeout=timeout))
+        configs = {}
+        errors = {}
+        for res, f in futures.items():
+            broker_id = int(res.name)
+            try:
+                entries = f.result().values()
+            except KafkaException as e:
+                errors[broker_id] = str(e)
+                continue
+            for config in entries:
+                configs.setdefault(config.name, {})[broker_id] = {
+                    "value": config.value,
+                    "source": config.source.name if hasattr(config.source, "name") else str(config.source),
+                }
+        if drift:
+            # Brokers that failed are left out of the comparison so their configs do not count as missing.
+            described = len(brokers) - len(errors)
+            ignore = set(ignore or ())
+            configs = {
+                name: values for name, values in configs.items()
+                if name not in ignore and (len(values) < described or len({v["value"] for v in values.values()}) > 1)
+            }
+        return {"configs": configs, "errors": errors}
+
     def create(self):
         raise NotImplemented
 
@@ -90,7 +173,7 @@ class Cluster(KafkaResource):
                 partitions.append(partition)
 
                 for broker in partition.replicas:
-                    replicas.append(replicas)
+                    replicas.append(broker)
         
         
         group = ConsumerGroup(self.admin_client)
@@ -104,6 +187,72 @@ class Cluster(KafkaResource):
 
         return results
         
+    def describe_brokers(self, timeout=10):
+        """
+        Describe the partition load of each Kafka Broker.
+
+        The leader, replica, under-replicated and offline partition counts are computed in a single
+        pass over one metadata snapshot.
+
+        Args:
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            list[dict]: The load for each Kafka Broker, including the skew against the mean in percent.
+
+        Raises:
+            KafkaError: If there is an error during the describe process.
+        """
+        metadata = self.admin_client.list_topics(timeout=timeout)
+
+        leaders = Counter()
+        replicas = Counter()
+        under_replicated = Counter()
+        offline = Counter()
+
+        for topic in metadata.topics.values():
+            for partition in topic.partitions.values():
+                if partition.leader >= 0:
+                    leaders[partition.leader] += 1
+                is_offline = partition.leader < 0
+                is_under_replicated = len(partition.isrs) < len(partition.replicas)
+                for broker in partition.replicas:
+                    replicas[broker] += 1
+                    if is_under_replicated:
+                        under_replicated[broker] += 1
+                    if is_offline:
+                        offline[broker] += 1
+
+        # Brokers that host replicas but are missing from the metadata are down.
+        broker_ids = sorted(set(metadata.brokers.keys()) | set(replicas.keys()))
+        mean_leaders = sum(leaders.values()) / len(broker_ids) if broker_ids else 0
+        mean_replicas = sum(replicas.values()) / len(broker_ids) if broker_ids else 0
+
+        def skew(count, mean):
+            return round((count - mean) / mean * 100, 1) if mean else 0.0
+
+        results = []
+        for broker_id in broker_ids:
+            broker_metadata = metadata.brokers.get(broker_id)
+            if broker_metadata is None:
+                broker_type = "offline"
+            else:
+                broker_type = "controller" if broker_id == metadata.controller_id else "worker"
+
+            results.append({
+                "name": broker_id,
+                "type": broker_type,
+                "endpoint": f"{broker_metadata.host}:{broker_metadata.port}" if broker_metadata else "-",
+                "leaders": leaders[broker_id],
+                "replicas": replicas[broker_id],
+                "under_replicated": under_replicated[broker_id],
+                "offline": offline[broker_id],
+                "leader_skew": skew(leaders[broker_id], mean_leaders),
+                "replica_skew": skew(replicas[broker_id], mean_replicas),
+            })
+
+        return results
+
     def alter(self):
         raise NotImplemented
 
@@ -0,0 +1,193 @@
+import json
+import os
+
+from .decoder import DecodedMessage, to_json_default
+
+METADATA_COLUMNS = ("_partition", "_offset", "_timestamp", "_key")
+
+
+def to_columns(messages, fields=None):
+    """
+    Decode a batch of messages into columns.
+
+    JSON object payloads, and the decoded values of `DecodedMessage` objects, are spread into one
+    column per top-level field. Any other payload is kept in a `value` column as a string. The
+    partition, offset, timestamp and key of every message are stored in the `_partition`,
+    `_offset`, `_timestamp` and `_key` columns.
+
+    Args:
+        messages (list[confluent_kafka.Message]): The messages.
+        fields (list[str], optional): The payload fields. If None, the fields are taken from the batch
+            in the order they first appear. Otherwise missing fields are null and other fields are dropped.
+
+    Returns:
+        dict: The values of each column.
+    """
+    columns = {name: [] for name in METADATA_COLUMNS}
+    rows = []
+    for m in messages:
+        columns["_partition"].append(m.partition())
+        columns["_offset"].append(m.offset())
+        columns["_timestamp"].append(m.timestamp()[1])
+        key = m.key()
+        columns["_key"].append(key.decode("utf-8", errors="replace") if key is not None else None)
+
+        if isinstance(m, DecodedMessage):
+            row = m.decoded
+            if not isinstance(row, dict):
+                row = {"value": m.value().decode("utf-8", errors="replace")}
+        else:
+            value = m.value()
+            try:
+                row = json.loads(value) if value is not None else {}
+            except ValueError:
+                row = None
+            if not isinstance(row, dict):
+                row = {"value": value.decode("utf-8", errors="replace")}
+        rows.append(row)
+
+    if fields is None:
+        fields = list(dict.fromkeys(name for row in rows for name in row if name not in columns))
+
+    for name in fields:
+        columns[name] = [row.get(name) for row in rows]
+
+    return columns
+
+
+class ColumnarWriter():
+    def __init__(self, path, format="parquet", compression="zstd"):
+        """
+        The columnar file writer class, which writes batches of messages to Parquet or Arrow IPC files.
+
+        The fields and types of every batch are unified with the ones written so far. A file has a
+        single schema, so when a field first appears or a type is promoted, such as null to int64,
+        int64 to double or a struct gaining a subfield, the following batches are written to a new
+        part file next to `path`, e.g. `out-1.parquet`. Fields missing from a batch are null. A field whose values have
+        types that cannot be unified, such as int64 and string, is written as JSON strings from then
+        on. Every batch is written as its own row group (or record batch), so memory use is bounded
+        by the batch size.
+
+        Args:
+            path (str): The path of the output file.
+            format (str, optional): The file format, `parquet` or `arrow`.
+            compression (str, optional): The compression codec.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError("pyarrow is required for Parquet and Arrow output, install kafkactl with the 'arrow' extra.")
+
+        self.pa = pyarrow
+        self.path = path
+        self.format = format.lower()
+        self.compression = compression
+        self.schema = None
+        self.fields = []
+        self.encoded = set()
+        self.paths = []
+        self.writer = None
+        self.rows = 0
+
+    def _column(self, name, values):
+        pa = self.pa
+        if name == "_timestamp":
+            return pa.array(values, pa.int64()).cast(pa.timestamp("ms"))
+        if name == "_key":
+            return pa.array(values, pa.string())
+
+        if name not in self.encoded:
+            try:
+                return pa.array(values)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                # The values of this batch alone have conflicting types.
+                self.encoded.add(name)
+
+        return pa.array([json.dumps(v, default=to_json_default) if v is not None else None for v in values], pa.string())
+
+    def _unify(self, schema):
+        """Unify the schema of a batch with the schema written so far, marking conflicting fields as JSON encoded."""
+        pa = self.pa
+        if self.schema is None:
+            return schema
+
+        fields = []
+        for field in schema:
+            if field.name not in self.schema.names:
+                fields.append(field)
+                continue
+            current = self.schema.field(field.name)
+            try:
+                fields.append(pa.unify_schemas([pa.schema([current]), pa.schema([field])], promote_options="permissive").field(0))
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                self.encoded.add(field.name)
+                fields.append(pa.field(field.name, pa.string()))
+        return pa.schema(fields)
+
+    def _open(self, schema):
+        """Close the current file and open the next part with a new schema."""
+        if self.writer is not None:
+            self.writer.close()
+
+        root, ext = os.path.splitext(self.path)
+        path = f"{root}-{len(self.paths)}{ext}" if self.paths else self.path
+        self.paths.append(path)
+        self.schema = schema
+
+        if self.format == "parquet":
+            import pyarrow.parquet as pq
+            self.writer = pq.ParquetWriter(path, schema, compression=self.compression)
+        else:
+            import pyarrow.ipc as ipc
+            options = ipc.IpcWriteOptions(compression=self.compression)
+            self.writer = ipc.new_file(path, schema, options=options)
+
+    def write(self, messages):
+        """
+        Write a batch of messages.
+
+        Args:
+            messages (list[confluent_kafka.Message]): The messages.
+
+        Returns:
+            None
+        """
+        columns = to_columns(messages)
+        # New fields are added after the ones written so far, which stay in every batch as nulls.
+        self.fields += [name for name in columns if name not in METADATA_COLUMNS and name not in self.fields]
+        columns = {name: columns.get(name, [None] * len(messages)) for name in (*METADATA_COLUMNS, *self.fields)}
+
+        # A field found to conflict is encoded as JSON, which changes the batch, so the batch is
+        # rebuilt until no new conflict is found.
+        while True:
+            encoded = set(self.encoded)
+            table = self.pa.table({name: self._column(name, values) for name, values in columns.items()})
+            schema = self._unify(table.schema)
+            if self.encoded == encoded:
+                break
+
+        if self.schema is None or not schema.equals(self.schema):
+            self._open(schema)
+
+        self.writer.write_table(table.cast(self.schema))
+        self.rows += table.num_rows
+
+    def close(self):
+        """
+        Close the output file.
+
+        Returns:
+            int: The number of rows written.
+        """
+        if self.writer is not None:
+            self.writer.close()
+        return self.rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
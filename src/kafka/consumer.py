@@ -1,13 +1,317 @@
+from confluent_kafka import Consumer as KafkaConsumer, TopicPartition, OFFSET_END
+from confluent_kafka.admin import OffsetSpec
+from .decoder import DecodedMessage
+from .topic import Topic
+
+import queue
+import re
+import threading
+
+
+def compile_matcher(key=None, value=None, headers=None, fixed_strings=False):
+    """
+    Compile the key, value and header patterns into a single message predicate.
+
+    The patterns are compiled once and applied to the raw message bytes, so messages are never
+    decoded just to be rejected. A message matches when every given pattern matches.
+
+    Args:
+        key (str, optional): The pattern for the message key.
+        value (str, optional): The pattern for the message value.
+        headers (dict, optional): The pattern for each header name.
+        fixed_strings (bool, optional): Whether the patterns are literal strings instead of regular expressions.
+
+    Returns:
+        callable: A function that takes a `confluent_kafka.Message` and returns whether it matches.
+    """
+    def compile_pattern(pattern):
+        data = pattern.encode()
+        if fixed_strings:
+            return lambda b: b is not None and data in b
+        search = re.compile(data).search
+        return lambda b: b is not None and search(b) is not None
+
+    checks = []
+    if key is not None:
+        match_key = compile_pattern(key)
+        checks.append(lambda m: match_key(m.key()))
+    if value is not None:
+        match_value = compile_pattern(value)
+        checks.append(lambda m: match_value(m.value()))
+    for name, pattern in (headers or {}).items():
+        match_header = compile_pattern(pattern)
+        checks.append(lambda m, name=name, match=match_header: any(k == name and match(v) for k, v in (m.headers() or [])))
+
+    return lambda m: all(check(m) for check in checks)
+
+
+def to_dict(message):
+    """
+    Convert a Kafka message into a dictionary, decoding the key, value and headers as UTF-8.
+
+    The value of a `DecodedMessage` is its decoded value instead.
+
+    Args:
+        message (confluent_kafka.Message): The Kafka message.
+
+    Returns:
+        dict: The message.
+    """
+    def decode(data):
+        return data.decode("utf-8", errors="replace") if data is not None else None
+
+    return {
+        "topic": message.topic(),
+        "partition": message.partition(),
+        "offset": message.offset(),
+        "timestamp": message.timestamp()[1],
+        "key": decode(message.key()),
+        "value": message.decoded if isinstance(message, DecodedMessage) else decode(message.value()),
+        "headers": {k: decode(v) for k, v in (message.headers() or [])},
+    }
+
 
 class Consumer():
-    def __init__(self, admin_client):
+    def __init__(self, admin_client, bootstrap_servers=None):
         """
         The Kafka Consumer wrapper class.
 
         Args:
             admin_client (kafka.admin.client.AsyncAdminClient): The Kafka AdminClient instance.
+            bootstrap_servers (str, optional): The bootstrap servers used by the consumers.
         """
         self.admin_client = admin_client
+        self.bootstrap_servers = bootstrap_servers
+
+    def _consumer(self, **config):
+        """Create a consumer that is only ever assigned partitions and never commits offsets."""
+        return KafkaConsumer({
+            "bootstrap.servers": self.bootstrap_servers,
+            "group.id": "kafkactl",
+            "enable.auto.commit": False,
+            "enable.partition.eof": False,
+            **config,
+        })
+
+    def get_ranges(self, topic, partitions=None, start=None, end=None, timeout=10):
+        """
+        Convert a time range into the offset range of each partition of a Kafka Topic.
+
+        Args:
+            topic (str): The topic name.
+            partitions (list[int], optional): The partitions. If None, all partitions are used.
+            start (int, optional): The start timestamp in milliseconds. If None, the earliest offset is used.
+            end (int, optional): The end timestamp in milliseconds. If None, the latest offset is used.
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            dict: The `(start, end)` offsets, end exclusive, of each partition with messages in range.
+
+        Raises:
+            KafkaError: If there is an error during the process.
+        """
+        if not partitions:
+            partitions = list(self.admin_client.list_topics(topic, timeout=timeout).topics[topic].partitions.keys())
+        tps = [(topic, p) for p in sorted(partitions)]
+
+        t = Topic(self.admin_client)
+        earliest = t.list_offsets(tps, OffsetSpec.earliest(), timeout=timeout)
+        latest = t.list_offsets(tps, OffsetSpec.latest(), timeout=timeout)
+
+        def offsets_for_times(timestamp):
+            # A single offsets_for_times call covers every partition.
+            consumer = self._consumer()
+            try:
+                found = consumer.offsets_for_times([TopicPartition(topic, p, timestamp) for _, p in tps], timeout=timeout)
+            finally:
+                consumer.close()
+            return {(tp.topic, tp.partition): tp.offset for tp in found}
+
+        starts = offsets_for_times(start) if start is not None else earliest
+        ends = offsets_for_times(end) if end is not None else latest
+
+        results = {}
+        for tp in tps:
+            # A negative offset means there is no message at or after the timestamp.
+            low = starts.get(tp, -1)
+            high = ends.get(tp, -1)
+            if high < 0 or high == OFFSET_END:
+                high = latest.get(tp, -1)
+            if low < 0 or low >= high:
+                continue
+            results[tp[1]] = (max(low, earliest.get(tp, 0)), high)
+
+        return results
+
+    def read_ranges(self, consumer, topic, ranges, batch_size=1000, stop=None):
+        """
+        Read the messages of a Kafka Topic within an offset range per partition.
+
+        The consumer is assigned every partition at the start of its range and each partition is
+        paused once its end offset is reached. Transaction markers and compaction can leave gaps
+        before the end offset, so the positions are checked whenever no message arrives.
+
+        Args:
+            consumer (confluent_kafka.Consumer): The consumer, see `Consumer._consumer`.
+            topic (str): The topic name.
+            ranges (dict): The `(low, high)` offset range of each partition, where `high` is exclusive.
+            batch_size (int, optional): The maximum number of messages per consume call.
+            stop (threading.Event, optional): An event that stops the reading once set.
+
+        Yields:
+            list[confluent_kafka.Message]: The batches of messages in range.
+        """
+        remaining = dict(ranges)
+        if not remaining:
+            return
+
+        consumer.assign([TopicPartition(topic, p, low) for p, (low, high) in remaining.items()])
+        try:
+            while remaining and (stop is None or not stop.is_set()):
+                messages = consumer.consume(batch_size, timeout=1)
+                if not messages:
+                    for tp in consumer.position([TopicPartition(topic, p) for p in list(remaining)]):
+                        if tp.offset >= remaining[tp.partition][1]:
+                            del remaining[tp.partition]
+                    continue
+
+                batch = []
+                for m in messages:
+                    if m.error() or m.partition() not in remaining:
+                        continue
+                    high = remaining[m.partition()][1]
+                    if m.offset() < high:
+                        batch.append(m)
+                    if m.offset() >= high - 1:
+                        del remaining[m.partition()]
+                        consumer.pause([TopicPartition(topic, m.partition())])
+
+                if batch:
+                    yield batch
+        finally:
+            consumer.unassign()
+
+    def grep(self, topic, matcher, partitions=None, start=None, end=None, max_matches=None, workers=4, batch_size=500, decoder=None, timeout=10):
+        """
+        Search the messages of a Kafka Topic in a time range.
+
+        The partitions are scanned by parallel workers, each with its own consumer. Every worker
+        applies the compiled matcher to the raw messages and only the matches are decoded. The
+        workers stop as soon as `max_matches` matches were found.
+
+        Args:
+            topic (str): The topic name.
+            matcher (callable): The message predicate, see `compile_matcher`.
+            partitions (list[int], optional): The partitions. If None, all partitions are searched.
+            start (int, optional): The start timestamp in milliseconds.
+            end (int, optional): The end timestamp in milliseconds.
+            max_matches (int, optional): The maximum number of matches. If None, all matches are returned.
+            workers (int, optional): The number of parallel workers.
+            batch_size (int, optional): The maximum number of messages per consume call.
+            decoder (kafka.decoder.Decoder, optional): The value decoder. The patterns are then matched against the decoded values as JSON.
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Yields:
+            dict: The matching messages, as soon as they are found.
+
+        Raises:
+            KafkaError: If there is an error during the process.
+        """
+        ranges = self.get_ranges(topic, partitions=partitions, start=start, end=end, timeout=timeout)
+
+        work = queue.Queue()
+        for partition, offsets in ranges.items():
+            work.put((partition, offsets))
+
+        matches = queue.Queue(maxsize=1000)
+        stop = threading.Event()
+        done = object()
+
+        def put(item):
+            while not stop.is_set():
+                try:
+                    matches.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    pass
+
+        def worker():
+            consumer = self._consumer()
+            try:
+                while not stop.is_set():
+                    try:
+                        partition, (low, high) = work.get_nowait()
+                    except queue.Empty:
+                        return
+
+                    for batch in self.read_ranges(consumer, topic, {partition: (low, high)}, batch_size=batch_size, stop=stop):
+                        if decoder is not None:
+                            batch = decoder.decode_batch(batch)
+                        for m in batch:
+                            if matcher(m):
+                                put(to_dict(m))
+            except Exception as e:
+                put(e)
+            finally:
+                consumer.close()
+                put(done)
+
+        threads = [threading.Thread(target=worker, daemon=True) for _ in range(max(1, min(workers, len(ranges))))]
+        for thread in threads:
+            thread.start()
+
+        found = 0
+        running = len(threads)
+        try:
+            while running and (max_matches is None or found < max_matches):
+                item = matches.get()
+                if item is done:
+                    running -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    found += 1
+                    yield item
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+    def consume(self, topic, partitions=None, start=None, end=None, max_messages=None, batch_size=1000, decoder=None, timeout=10):
+        """
+        Consume the messages of a Kafka Topic in a time range.
+
+        A single consumer reads every partition in range, see `Consumer.read_ranges`.
+
+        Args:
+            topic (str): The topic name.
+            partitions (list[int], optional): The partitions. If None, all partitions are consumed.
+            start (int, optional): The start timestamp in milliseconds.
+            end (int, optional): The end timestamp in milliseconds.
+            max_messages (int, optional): The maximum number of messages. If None, all messages in range are consumed.
+            batch_size (int, optional): The maximum number of messages per consume call.
+            decoder (kafka.decoder.Decoder, optional): The value decoder applied to every batch.
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Yields:
+            list[confluent_kafka.Message]: The batches of consumed messages.
+
+        Raises:
+            KafkaError: If there is an error during the process.
+        """
+        ranges = self.get_ranges(topic, partitions=partitions, start=start, end=end, timeout=timeout)
+        if not ranges or max_messages == 0:
+            return
 
-    def consume(self):
-        raise NotImplemented
\ No newline at end of file
+        consumer = self._consumer()
+        try:
+            count = 0
+            for batch in self.read_ranges(consumer, topic, ranges, batch_size=batch_size):
+                if max_messages is not None:
+                    batch = batch[:max_messages - count]
+                count += len(batch)
+                yield decoder.decode_batch(batch) if decoder is not None else batch
+                if max_messages is not None and count >= max_messages:
+                    break
+        finally:
+            consumer.close()
@@ -1,5 +1,11 @@
-from confluent_kafka import ConsumerGroupState, Consumer, OFFSET_INVALID
+from confluent_kafka import ConsumerGroupState, ConsumerGroupTopicPartitions, Consumer, KafkaException, OFFSET_INVALID
+from confluent_kafka.admin import OffsetSpec
 from .kafka_resource import KafkaResource
+from collections import deque
+
+import heapq
+import re
+import time
 
 
 class ConsumerGroup(KafkaResource):
@@ -59,6 +65,110 @@ class ConsumerGroup(KafkaResource):
     def create(self, bootstrap_servers, group):
         raise NotImplemented
 
+    def get_committed_offsets(self, groups, batch_size=100, timeout=10):
+        """
+        Get the committed offsets of many Kafka Consumer Groups.
+
+        One `list_consumer_group_offsets` request is sent per group, with up to `batch_size` of them
+        in flight at the same time.
+
+        Args:
+            groups (list[str]): The consumer group names.
+            batch_size (int, optional): The maximum number of concurrent requests.
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            dict: The committed offset for each topic and partition pair of each group. Groups whose
+                offsets cannot be listed, and partitions with an error, are left out.
+        """
+        results = {}
+        for i in range(0, len(groups), batch_size):
+            futures = {}
+            for group in groups[i : i + batch_size]:
+                request = [ConsumerGroupTopicPartitions(group)]
+                futures.update(self.admin_client.list_consumer_group_offsets(request, request_timeout=timeout))
+
+            for group_id, f in futures.items():
+                try:
+                    topic_partitions = f.result().topic_partitions
+                except KafkaException:
+                    continue
+                results[group_id] = {
+                    (tp.topic, tp.partition): tp.offset for tp in topic_partitions if tp.offset >= 0 and not tp.error
+                }
+
+        return results
+
+    def get_lag(self, top=10, by="group", batch_size=100, timeout=10):
+        """
+        Get the Kafka Consumer Groups, or group partitions, with the highest lag across the cluster.
+
+        The groups are processed `batch_size` at a time. The log end offset of each partition is
+        fetched once and shared by every group, and only the `top` worst entries are kept in a
+        bounded heap, so memory does not grow with the number of groups.
+
+        Args:
+            top (int, optional): The number of entries to return.
+            by (str, optional): Whether to rank whole groups (`group`) or single group partitions (`partition`).
+            batch_size (int, optional): The maximum number of groups per batch of requests.
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            list[dict]: The entries with the highest lag, in descending order.
+
+        Raises:
+            KafkaError: If there is an error during the process.
+        """
+        # Imported here because the topic module depends on this one through the cluster module.
+        from .topic import Topic
+
+        topic = Topic(self.admin_client)
+        states = [state.name for state in ConsumerGroupState if state != ConsumerGroupState.UNKNOWN]
+        groups = [group["name"] for group in self.get(states=states, timeout=timeout)]
+
+        log_end_offsets = {}
+        heap = []
+        counter = 0
+
+        def push(lag, entry):
+            nonlocal counter
+            # The counter breaks ties so that the entries themselves are never compared.
+            item = (lag, counter, entry)
+            counter += 1
+            if len(heap) < top:
+                heapq.heappush(heap, item)
+            elif lag > heap[0][0]:
+                heapq.heapreplace(heap, item)
+
+        for i in range(0, len(groups), batch_size):
+            committed = self.get_committed_offsets(groups[i : i + batch_size], batch_size=batch_size, timeout=timeout)
+
+            missing = list({tp for offsets in committed.values() for tp in offsets if tp not in log_end_offsets})
+            log_end_offsets.update(topic.list_offsets(missing, OffsetSpec.latest(), timeout=timeout))
+            # Partitions whose log end offset cannot be listed are not asked for again.
+            for tp in missing:
+                log_end_offsets.setdefault(tp, -1)
+
+            for group_id, offsets in committed.items():
+                total = 0
+                for (topic_name, partition), offset in offsets.items():
+                    log_end_offset = log_end_offsets.get((topic_name, partition), -1)
+                    lag = max(log_end_offset - offset, 0) if log_end_offset >= 0 else 0
+                    total += lag
+                    if by == "partition":
+                        push(lag, {
+                            "group": group_id,
+                            "topic": topic_name,
+                            "partition": partition,
+                            "current_offset": offset,
+                            "log_end_offset": log_end_offset,
+                            "lag": lag,
+                        })
+                if by == "group":
+                    push(total, {"group": group_id, "partitions": len(offsets), "lag": total})
+
+        return [entry for lag, _, entry in sorted(heap, key=lambda item: (-item[0], item[1]))]
+
     def get_offsets(self, bootstrap_servers, group, topics, timeout=10):
         """
         Consumer Kafka Consumer Group Offsets.
@@ -211,4 +321,104 @@ class ConsumerGroup(KafkaResource):
         future = self.admin_client.delete_consumer_groups([group], request_timeout=timeout)
 
         for group_id, f in future.items():
-            f.result()
\ No newline at end of file
+            f.result()
+
+    def get_idle(self, groups, older_than, timeout=10):
+        """
+        Get the Kafka Consumer Groups that consumed nothing produced in the last `older_than` seconds.
+
+        Kafka keeps no last commit time of a group, so a group counts as active when any of its
+        committed offsets is past the first offset produced after the cutoff. A group without
+        committed offsets is idle.
+
+        Args:
+            groups (list[str]): The consumer group names.
+            older_than (float): The idle time in seconds.
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            set[str]: The idle consumer group names.
+
+        Raises:
+            KafkaError: If there is an error during the process.
+        """
+        # Imported here because the topic module depends on this one through the cluster module.
+        from .topic import Topic
+
+        cutoff = int((time.time() - older_than) * 1000)
+        committed = self.get_committed_offsets(groups, timeout=timeout)
+
+        partitions = list({tp for offsets in committed.values() for tp in offsets})
+        at_cutoff = Topic(self.admin_client).list_offsets(partitions, OffsetSpec.for_timestamp(cutoff), timeout=timeout)
+
+        idle = set()
+        for group_id, offsets in committed.items():
+            # A negative offset means nothing was produced to the partition after the cutoff.
+            if not any(0 <= at_cutoff.get(tp, -1) < offset for tp, offset in offsets.items()):
+                idle.add(group_id)
+
+        return idle
+
+    def delete_many(self, pattern=None, states=None, older_than=None, dry_run=False, batch_size=100, max_in_flight=4, timeout=30):
+        """
+        Delete the Kafka Consumer Groups that match a name pattern, a state and an idle time.
+
+        The groups are listed once with a single `list_consumer_groups` request and filtered locally.
+        The matching groups are deleted with `delete_consumer_groups` requests of up to `batch_size`
+        groups, with up to `max_in_flight` of them in flight at the same time.
+
+        Args:
+            pattern (str, optional): A regular expression the whole group name must match. If None, every name matches.
+            states (list[str], optional): Only delete consumer groups which are currently in these states.
+                Defaults to `EMPTY`. An empty list matches every state.
+            older_than (float, optional): Only delete consumer groups idle for this many seconds. See `ConsumerGroup.get_idle`.
+            dry_run (bool, optional): Only report the groups that would be deleted.
+            batch_size (int, optional): The maximum number of groups per `delete_consumer_groups` request.
+            max_in_flight (int, optional): The maximum number of concurrent `delete_consumer_groups` requests.
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            list[dict]: The matching groups with their `name`, `state` and a `result` set to `deleted`,
+                `would delete` or the error.
+
+        Raises:
+            KafkaError: If there is an error while listing the groups.
+        """
+        regex = re.compile(pattern) if pattern is not None else None
+        if states is None:
+            states = ["EMPTY"]
+        states = {state.upper() for state in states} if states else None
+
+        groups = self.admin_client.list_consumer_groups(request_timeout=timeout).result()
+        matches = {
+            group.group_id: group.state.name for group in groups.valid
+            if (regex is None or regex.fullmatch(group.group_id)) and (states is None or group.state.name in states)
+        }
+
+        if older_than is not None and matches:
+            idle = self.get_idle(sorted(matches), older_than, timeout=timeout)
+            matches = {name: state for name, state in matches.items() if name in idle}
+
+        names = sorted(matches)
+        results = {name: "would delete" if dry_run else None for name in names}
+
+        if not dry_run:
+            pending = deque()
+
+            def collect(futures):
+                for group_id, f in futures.items():
+                    try:
+                        f.result()
+                        results[group_id] = "deleted"
+                    except Exception as e:
+                        results[group_id] = str(e)
+
+            for i in range(0, len(names), batch_size):
+                pending.append(self.admin_client.delete_consumer_groups(names[i : i + batch_size], request_timeout=timeout))
+                if len(pending) >= max_in_flight:
+                    collect(pending.popleft())
+
+            while pending:
+                collect(pending.popleft())
+
+        return [{"name": name, "state": matches[name], "result": results[name]} for name in names]
@@ -0,0 +1,403 @@
+from collections import OrderedDict
+
+import base64
+import io
+import json
+import os
+import shutil
+import struct
+import subprocess
+import tempfile
+import warnings
+
+try:
+    from google.protobuf.message import DecodeError as ProtobufDecodeError
+except ImportError:
+    ProtobufDecodeError = ValueError
+
+MAGIC_BYTE = 0
+
+# The errors raised by the decoders for values that do not match their schema.
+DECODE_ERRORS = (ValueError, KeyError, IndexError, EOFError, struct.error, ProtobufDecodeError)
+
+
+def read_varint(data, pos):
+    """
+    Read an unsigned base 128 varint.
+
+    Args:
+        data (bytes): The data.
+        pos (int): The position of the varint.
+
+    Returns:
+        tuple: The value and the position after the varint.
+    """
+    result = 0
+    shift = 0
+    while True:
+        b = data[pos]
+        pos += 1
+        result |= (b & 0x7f) << shift
+        if not b & 0x80:
+            return result, pos
+        shift += 7
+
+
+def read_zigzag(data, pos):
+    """Read a zigzag encoded signed varint, see `read_varint`."""
+    value, pos = read_varint(data, pos)
+    return (value >> 1) ^ -(value & 1), pos
+
+
+def split_wire_format(data, schema_type):
+    """
+    Split a message in the schema registry wire format into its schema id and payload.
+
+    The wire format is a zero magic byte and a 4 byte big-endian schema id. Protobuf payloads are
+    also prefixed by the indexes of the message type in the schema, as a zigzag varint count and
+    that many zigzag varints, where a single zero byte stands for the first message type.
+
+    Args:
+        data (bytes): The message.
+        schema_type (str, optional): The schema type, `AVRO`, `PROTOBUF` or `JSON`.
+
+    Returns:
+        tuple: The schema id, the message type indexes and the payload, or None if the message is not in the wire format.
+    """
+    if not data or len(data) < 5 or data[0] != MAGIC_BYTE:
+        return None
+
+    schema_id = struct.unpack(">I", data[1:5])[0]
+    pos = 5
+    indexes = []
+    if schema_type == "PROTOBUF":
+        count, pos = read_zigzag(data, pos)
+        for _ in range(count):
+            index, pos = read_zigzag(data, pos)
+            indexes.append(index)
+
+    return schema_id, indexes or [0], data[pos:]
+
+
+def decode_protobuf_fields(data):
+    """
+    Decode a Protobuf message without its schema.
+
+    Length-delimited fields are decoded as nested messages when possible, then as UTF-8 text and
+    otherwise kept as base64. Repeated fields become lists.
+
+    Args:
+        data (bytes): The Protobuf payload.
+
+    Returns:
+        dict: The values by field number.
+    """
+    fields = {}
+    pos = 0
+    while pos < len(data):
+        tag, pos = read_varint(data, pos)
+        number, wire_type = tag >> 3, tag & 7
+        if wire_type == 0:
+            value, pos = read_varint(data, pos)
+        elif wire_type == 1:
+            value = struct.unpack("<q", data[pos:pos + 8])[0]
+            pos += 8
+        elif wire_type == 5:
+            value = struct.unpack("<i", data[pos:pos + 4])[0]
+            pos += 4
+        elif wire_type == 2:
+            size, pos = read_varint(data, pos)
+            raw = data[pos:pos + size]
+            pos += size
+            try:
+                value = decode_protobuf_fields(raw) if raw else ""
+            except (IndexError, ValueError, struct.error):
+                try:
+                    value = raw.decode("utf-8")
+                except UnicodeDecodeError:
+                    value = base64.b64encode(raw).decode()
+        else:
+            raise ValueError(f"Unsupported Protobuf wire type {wire_type}.")
+
+        key = str(number)
+        if key in fields:
+            if not isinstance(fields[key], list):
+                fields[key] = [fields[key]]
+            fields[key].append(value)
+        else:
+            fields[key] = value
+
+    if pos != len(data):
+        raise ValueError("Truncated Protobuf message.")
+    return fields
+
+
+def compile_avro(schema):
+    """Compile an Avro schema into a decoder function."""
+    try:
+        import fastavro
+    except ImportError:
+        raise ImportError("fastavro is required for Avro decoding, install kafkactl with the 'avro' extra.")
+
+    parsed = fastavro.parse_schema(json.loads(schema) if isinstance(schema, str) else schema)
+    return lambda payload, indexes: fastavro.schemaless_reader(io.BytesIO(payload), parsed)
+
+
+def compile_json(schema):
+    """Compile a JSON Schema into a decoder function. The payload is plain JSON, so the schema is not needed to decode it."""
+    return lambda payload, indexes: json.loads(payload)
+
+
+def compile_protobuf(schema=None, descriptor_set=None, message_type=None):
+    """
+    Compile a Protobuf schema into a decoder function.
+
+    The message types are taken from a serialized `FileDescriptorSet`, or compiled from the `.proto`
+    text with `protoc` when it is installed. Without either, the payload is decoded without its schema.
+
+    Args:
+        schema (str, optional): The `.proto` text.
+        descriptor_set (bytes, optional): A serialized `FileDescriptorSet`, e.g. from `protoc --descriptor_set_out`.
+        message_type (str, optional): The full message type name. If None, the message type indexes of the wire format are used.
+
+    Returns:
+        callable: A function that takes the payload and the message type indexes and returns the decoded message.
+    """
+    if descriptor_set is None and schema is not None and shutil.which("protoc"):
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, "schema.proto"), "w") as f:
+                f.write(schema)
+            try:
+                subprocess.run(
+                    ["protoc", f"--proto_path={directory}", "--descriptor_set_out=schema.desc", "schema.proto"],
+                    cwd=directory, check=True, capture_output=True,
+                )
+                with open(os.path.join(directory, "schema.desc"), "rb") as f:
+                    descriptor_set = f.read()
+            except subprocess.CalledProcessError:
+                # Imports of other schemas cannot be resolved here, fall back to decoding without the schema.
+                descriptor_set = None
+
+    if descriptor_set is None:
+        return lambda payload, indexes: decode_protobuf_fields(payload)
+
+    try:
+        from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
+        from google.protobuf.json_format import MessageToDict
+    except ImportError:
+        raise ImportError("protobuf is required for Protobuf decoding, install kafkactl with the 'protobuf' extra.")
+
+    file_set = descriptor_pb2.FileDescriptorSet.FromString(descriptor_set)
+    pool = descriptor_pool.DescriptorPool()
+    for file_proto in file_set.file:
+        pool.Add(file_proto)
+    # The schema file itself is the last one, after its dependencies.
+    file_descriptor = pool.FindFileByName(file_set.file[-1].name)
+
+    classes = {}
+
+    def message_class(indexes):
+        key = message_type or tuple(indexes)
+        if key not in classes:
+            if message_type:
+                descriptor = pool.FindMessageTypeByName(message_type)
+            else:
+                descriptor = list(file_descriptor.message_types_by_name.values())[indexes[0]]
+                for index in indexes[1:]:
+                    descriptor = descriptor.nested_types[index]
+            classes[key] = message_factory.GetMessageClass(descriptor)
+        return classes[key]
+
+    return lambda payload, indexes: MessageToDict(message_class(indexes).FromString(payload), preserving_proto_field_name=True)
+
+
+def compile_decoder(schema_type, schema=None, descriptor_set=None, message_type=None):
+    """
+    Compile a schema into a decoder function.
+
+    Args:
+        schema_type (str): The schema type, `AVRO`, `PROTOBUF` or `JSON`.
+        schema (str, optional): The schema text.
+        descriptor_set (bytes, optional): A serialized Protobuf `FileDescriptorSet`.
+        message_type (str, optional): The full Protobuf message type name.
+
+    Returns:
+        callable: A function that takes the payload and the message type indexes and returns the decoded value.
+
+    Raises:
+        ValueError: If the schema type is not supported.
+    """
+    schema_type = schema_type.upper()
+    if schema_type == "AVRO":
+        return compile_avro(schema)
+    if schema_type == "JSON":
+        return compile_json(schema)
+    if schema_type == "PROTOBUF":
+        return compile_protobuf(schema, descriptor_set, message_type)
+    raise ValueError(f"Unsupported schema type '{schema_type}'.")
+
+
+def load_registry_cache(path):
+    """
+    Load a schema registry cache file.
+
+    The file holds either the output of the registry `GET /schemas` endpoint, a list of objects
+    with `id`, `schemaType` and `schema` fields, or an object of such entries keyed by schema id.
+    A missing `schemaType` means Avro, as in the registry.
+
+    Args:
+        path (str): The path of the cache file.
+
+    Returns:
+        dict: The `(schema_type, schema)` of every schema id.
+    """
+    with open(path) as f:
+        entries = json.load(f)
+
+    if isinstance(entries, dict):
+        entries = [{"id": int(schema_id), **entry} for schema_id, entry in entries.items()]
+
+    return {int(e["id"]): (e.get("schemaType", "AVRO").upper(), e["schema"]) for e in entries}
+
+
+def to_json_default(value):
+    """Encode the values that `json.dumps` cannot, such as bytes, decimals and datetimes."""
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode()
+    return str(value)
+
+
+class DecodedMessage():
+    def __init__(self, message, decoded):
+        """
+        A Kafka message with a decoded value.
+
+        It behaves like the wrapped `confluent_kafka.Message`, except that `value` returns the
+        decoded value as JSON, so the matchers and writers for JSON messages work unchanged.
+
+        Args:
+            message (confluent_kafka.Message): The message.
+            decoded (object): The decoded value.
+        """
+        self.message = message
+        self.decoded = decoded
+        self._value = None
+
+    def __getattr__(self, name):
+        return getattr(self.message, name)
+
+    def value(self):
+        if self._value is None:
+            self._value = json.dumps(self.decoded, default=to_json_default).encode()
+        return self._value
+
+
+class Decoder():
+    def __init__(self, schema_type=None, schema_file=None, registry_cache=None, message_type=None, cache_size=128):
+        """
+        The message value decoder class.
+
+        Messages in the schema registry wire format are decoded with the schema of their schema id
+        from the registry cache file. Other messages are decoded with the local schema file. The
+        decoders are compiled once per schema id and the `cache_size` most recently used are kept.
+
+        Args:
+            schema_type (str, optional): The local schema type, `AVRO`, `PROTOBUF` or `JSON`. If None, it is
+                inferred from the schema file extension, `.avsc`, `.proto`, `.desc` or `.json`.
+            schema_file (str, optional): The path of the local schema, or of a Protobuf `FileDescriptorSet` for `.desc` files.
+            registry_cache (str, optional): The path of the schema registry cache file, see `load_registry_cache`.
+            message_type (str, optional): The full Protobuf message type name of the local schema.
+            cache_size (int, optional): The maximum number of compiled decoders kept.
+
+        Raises:
+            ValueError: If the schema type cannot be inferred or is not supported.
+        """
+        self.schemas = load_registry_cache(registry_cache) if registry_cache else {}
+        self.cache_size = cache_size
+        self.decoders = OrderedDict()
+        self.local = None
+        self.local_type = None
+        self.failures = 0
+
+        if schema_file:
+            extension = os.path.splitext(schema_file)[1].lower()
+            inferred = {".avsc": "AVRO", ".proto": "PROTOBUF", ".desc": "PROTOBUF", ".json": "JSON"}.get(extension)
+            self.local_type = (schema_type or inferred or "").upper()
+            if not self.local_type:
+                raise ValueError(f"Cannot infer the schema type of '{schema_file}', set it explicitly.")
+
+            if extension == ".desc":
+                with open(schema_file, "rb") as f:
+                    self.local = compile_decoder(self.local_type, descriptor_set=f.read(), message_type=message_type)
+            else:
+                with open(schema_file) as f:
+                    self.local = compile_decoder(self.local_type, schema=f.read(), message_type=message_type)
+
+    def _registry_decoder(self, schema_id):
+        if schema_id in self.decoders:
+            self.decoders.move_to_end(schema_id)
+            return self.decoders[schema_id]
+
+        schema_type, schema = self.schemas[schema_id]
+        decoder = (schema_type, compile_decoder(schema_type, schema=schema))
+        self.decoders[schema_id] = decoder
+        if len(self.decoders) > self.cache_size:
+            self.decoders.popitem(last=False)
+        return decoder
+
+    def decode(self, data):
+        """
+        Decode a message value.
+
+        Args:
+            data (bytes): The message value.
+
+        Returns:
+            object: The decoded value.
+
+        Raises:
+            ValueError: If there is no schema for the value or it cannot be decoded.
+        """
+        if data is None:
+            return None
+
+        if self.schemas and data[:1] == bytes([MAGIC_BYTE]):
+            schema_id = struct.unpack(">I", data[1:5])[0]
+            if schema_id in self.schemas:
+                schema_type, decoder = self._registry_decoder(schema_id)
+                _, indexes, payload = split_wire_format(data, schema_type)
+                return decoder(payload, indexes)
+
+        if self.local is None:
+            raise ValueError("There is no schema for the message.")
+
+        split = split_wire_format(data, self.local_type)
+        if split is not None:
+            # The local schema also applies to wire format messages of unknown schema ids.
+            _, indexes, payload = split
+            return self.local(payload, indexes)
+        return self.local(data, [0])
+
+    def decode_batch(self, messages):
+        """
+        Decode the values of a batch of messages.
+
+        A message that cannot be decoded is returned unchanged and counted in `failures`, with a
+        warning on the first one. Errors that are not decode errors are raised.
+
+        Args:
+            messages (list[confluent_kafka.Message]): The messages.
+
+        Returns:
+            list: The `DecodedMessage` of every decoded message and the other messages.
+        """
+        results = []
+        for m in messages:
+            try:
+                results.append(DecodedMessage(m, self.decode(m.value())))
+            except DECODE_ERRORS as e:
+                self.failures += 1
+                if self.failures == 1:
+                    warnings.warn(f"Cannot decode a message value, it is returned undecoded: {e}", stacklevel=2)
+                results.append(m)
+        return results
@@ -0,0 +1,299 @@
+from confluent_kafka import ConsumerGroupTopicPartitions, KafkaError, KafkaException, TopicPartition
+from confluent_kafka.admin import OffsetSpec
+from collections import deque
+
+import gzip
+import json
+import re
+import time
+
+from .consumer import Consumer
+from .consumer_group import ConsumerGroup
+from .topic import Topic
+
+
+def rounds(entries):
+    """
+    Split per partition values into rounds that hold every partition at most once.
+
+    A consumer can only be assigned, or look up, one offset per partition at a time, so the values
+    of many groups on the same partition are handled in consecutive rounds.
+
+    Args:
+        entries (iterable[tuple[str, int, int]]): The topic, partition and value triples.
+
+    Returns:
+        list[dict]: The value of each topic and partition pair, for every round.
+    """
+    results = []
+    for topic, partition, value in sorted(set(entries)):
+        for r in results:
+            if (topic, partition) not in r:
+                r[(topic, partition)] = value
+                break
+        else:
+            results.append({(topic, partition): value})
+    return results
+
+
+class GroupOffsets():
+    def __init__(self, admin_client, bootstrap_servers=None):
+        """
+        The Kafka Consumer Group committed offsets export and import class.
+
+        An export file is a gzip compressed JSON document with the committed offsets of each group,
+        grouped by topic as `[partition, offset, timestamp]` entries. The timestamp is the one of the
+        next message the group would consume, or None when the group is at the end of the partition,
+        so the offsets can be translated to another cluster that holds the same messages.
+
+        Args:
+            admin_client (kafka.admin.client.AsyncAdminClient): The Kafka AdminClient instance.
+            bootstrap_servers (str, optional): The bootstrap servers used by the consumers.
+        """
+        self.admin_client = admin_client
+        self.bootstrap_servers = bootstrap_servers
+
+    def list_groups(self, pattern=None, timeout=10):
+        """
+        List the names of the Kafka Consumer Groups in every state with a single request.
+
+        Args:
+            pattern (str, optional): A regular expression the whole group name must match.
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            list[str]: The sorted consumer group names.
+        """
+        regex = re.compile(pattern) if pattern is not None else None
+        groups = self.admin_client.list_consumer_groups(request_timeout=timeout).result()
+        return sorted(g.group_id for g in groups.valid if regex is None or regex.fullmatch(g.group_id))
+
+    def message_timestamps(self, offsets, latest, timeout=10):
+        """
+        Get the timestamp of the message at each of many partition offsets.
+
+        Args:
+            offsets (iterable[tuple[str, int, int]]): The topic, partition and offset triples.
+            latest (dict): The log end offset of each topic and partition pair.
+            timeout (int, optional): The time (in seconds) to wait for each round of messages.
+
+        Returns:
+            dict: The timestamp in milliseconds of each topic, partition and offset triple, or None
+                when only transaction markers are left before the log end offset.
+
+        Raises:
+            KafkaException: If a message is not received in time.
+        """
+        results = {}
+        consumer = Consumer(self.admin_client, self.bootstrap_servers)._consumer(**{"auto.offset.reset": "earliest"})
+        try:
+            for r in rounds(offsets):
+                consumer.assign([TopicPartition(t, p, offset) for (t, p), offset in r.items()])
+                pending = dict(r)
+                deadline = time.monotonic() + timeout
+
+                while pending:
+                    if time.monotonic() > deadline:
+                        raise KafkaException(KafkaError(KafkaError._TIMED_OUT, f"No message received from {len(pending)} partitions."))
+
+                    messages = consumer.consume(1000, timeout=1)
+                    if not messages:
+                        for tp in consumer.position([TopicPartition(t, p) for t, p in pending]):
+                            if tp.offset >= latest.get((tp.topic, tp.partition), 0):
+                                results[(tp.topic, tp.partition, pending.pop((tp.topic, tp.partition)))] = None
+                        continue
+
+                    for m in messages:
+                        key = (m.topic(), m.partition())
+                        if m.error() or key not in pending:
+                            continue
+                        results[(key[0], key[1], pending.pop(key))] = m.timestamp()[1]
+                        consumer.pause([TopicPartition(*key)])
+        finally:
+            consumer.close()
+
+        return results
+
+    def export(self, path, groups=None, pattern=None, timestamps=True, batch_size=100, timeout=10):
+        """
+        Export the committed offsets of many Kafka Consumer Groups to a gzip compressed file.
+
+        The committed offsets are read with batches of concurrent `list_consumer_group_offsets`
+        requests and the timestamps with one consumer, one round per distinct offset of a partition.
+
+        Args:
+            path (str): The path of the export file.
+            groups (list[str], optional): The consumer group names. If None, every group is exported.
+            pattern (str, optional): A regular expression the whole group name must match, when `groups` is None.
+            timestamps (bool, optional): Whether to store the timestamps needed to translate the offsets.
+            batch_size (int, optional): The maximum number of concurrent `list_consumer_group_offsets` requests.
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            dict: The number of groups and group partitions exported.
+
+        Raises:
+            KafkaError: If there is an error during the process.
+        """
+        if groups is None:
+            groups = self.list_groups(pattern=pattern, timeout=timeout)
+
+        committed = ConsumerGroup(self.admin_client).get_committed_offsets(list(groups), batch_size=batch_size, timeout=timeout)
+
+        found = {}
+        if timestamps:
+            partitions = list({tp for offsets in committed.values() for tp in offsets})
+            latest = Topic(self.admin_client).list_offsets(partitions, OffsetSpec.latest(), timeout=timeout)
+            pending = {
+                (t, p, offset) for offsets in committed.values() for (t, p), offset in offsets.items()
+                if offset < latest.get((t, p), -1)
+            }
+            found = self.message_timestamps(pending, latest, timeout=timeout)
+
+        data = {}
+        for group_id, offsets in sorted(committed.items()):
+            topics = data[group_id] = {}
+            for (t, p), offset in sorted(offsets.items()):
+                entry = [p, offset, found.get((t, p, offset))] if timestamps else [p, offset]
+                topics.setdefault(t, []).append(entry)
+
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump({"version": 1, "created": int(time.time() * 1000), "groups": data}, f, separators=(",", ":"))
+
+        return {"groups": len(data), "partitions": sum(len(e) for topics in data.values() for e in topics.values())}
+
+    @staticmethod
+    def load(path):
+        """
+        Load an export file.
+
+        Args:
+            path (str): The path of the export file.
+
+        Returns:
+            dict: The export.
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return json.load(f)
+
+    def translate(self, entries, timeout=10):
+        """
+        Translate exported offsets to the offsets of the same messages in this cluster by timestamp.
+
+        Args:
+            entries (iterable[tuple[str, int, int]]): The topic, partition and timestamp triples. A
+                None timestamp stands for the end of the partition.
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            dict: The offset of each topic, partition and timestamp triple.
+
+        Raises:
+            KafkaError: If there is an error during the process.
+        """
+        entries = set(entries)
+        partitions = list({(t, p) for t, p, _ in entries})
+        latest = Topic(self.admin_client).list_offsets(partitions, OffsetSpec.latest(), timeout=timeout)
+        missing = sorted(f"{t}:{p}" for t, p in partitions if (t, p) not in latest)
+        if missing:
+            raise KafkaException(KafkaError(KafkaError.UNKNOWN_TOPIC_OR_PART, f"Cannot list the log end offset of {', '.join(missing)}."))
+
+        results = {(t, p, None): latest[(t, p)] for t, p, ts in entries if ts is None}
+        consumer = Consumer(self.admin_client, self.bootstrap_servers)._consumer()
+        try:
+            for r in rounds((t, p, ts) for t, p, ts in entries if ts is not None):
+                request = [TopicPartition(t, p, ts) for (t, p), ts in r.items()]
+                for tp in consumer.offsets_for_times(request, timeout=timeout):
+                    # A negative offset means there is no message at or after the timestamp.
+                    offset = tp.offset if tp.offset >= 0 else latest[(tp.topic, tp.partition)]
+                    results[(tp.topic, tp.partition, r[(tp.topic, tp.partition)])] = offset
+        finally:
+            consumer.close()
+
+        return results
+
+    def restore(self, path, groups=None, translate=False, dry_run=False, max_in_flight=4, timeout=10):
+        """
+        Import the committed offsets of many Kafka Consumer Groups from an export file.
+
+        One `alter_consumer_group_offsets` request is sent per group, with up to `max_in_flight` of
+        them in flight at the same time. Partitions that do not exist in this cluster are skipped.
+        The groups must not have active members.
+
+        Args:
+            path (str): The path of the export file.
+            groups (list[str], optional): The consumer group names. If None, every group in the file is imported.
+            translate (bool, optional): Whether to look up the offsets by the exported timestamps, for another cluster.
+            dry_run (bool, optional): Only report the offsets that would be committed.
+            max_in_flight (int, optional): The maximum number of concurrent `alter_consumer_group_offsets` requests.
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            list[dict]: The `group`, the number of `partitions` and `skipped` partitions, the `offsets`
+                and a `result` set to `altered`, `would alter` or the error, for every group.
+
+        Raises:
+            ValueError: If the offsets are translated and the file has no timestamps.
+            KafkaError: If there is an error while reading the metadata or translating the offsets.
+        """
+        data = self.load(path)["groups"]
+        if groups is not None:
+            data = {g: data[g] for g in groups if g in data}
+
+        metadata = self.admin_client.list_topics(timeout=timeout)
+        existing = {(t, p) for t, topic in metadata.topics.items() for p in topic.partitions}
+
+        entries = {}
+        skipped = {}
+        for group_id, topics in data.items():
+            entries[group_id] = []
+            skipped[group_id] = 0
+            for t, partitions in topics.items():
+                for entry in partitions:
+                    if (t, entry[0]) not in existing:
+                        skipped[group_id] += 1
+                        continue
+                    if translate and len(entry) < 3:
+                        raise ValueError(f"The file {path} has no timestamps to translate the offsets with.")
+                    entries[group_id].append((t, *entry))
+
+        if translate:
+            translated = self.translate({(t, p, ts) for e in entries.values() for t, p, _, ts in e}, timeout=timeout)
+            offsets = {g: {(t, p): translated[(t, p, ts)] for t, p, _, ts in e} for g, e in entries.items()}
+        else:
+            offsets = {g: {(e[0], e[1]): e[2] for e in group_entries} for g, group_entries in entries.items()}
+
+        results = {g: "would alter" if dry_run else "no partitions" for g in offsets}
+
+        if not dry_run:
+            pending = deque()
+
+            def collect(futures):
+                for group_id, f in futures.items():
+                    try:
+                        f.result()
+                        results[group_id] = "altered"
+                    except Exception as e:
+                        results[group_id] = str(e)
+
+            for group_id, group_offsets in offsets.items():
+                if not group_offsets:
+                    continue
+                request = ConsumerGroupTopicPartitions(group_id, [TopicPartition(t, p, o) for (t, p), o in sorted(group_offsets.items())])
+                pending.append(self.admin_client.alter_consumer_group_offsets([request], request_timeout=timeout))
+                if len(pending) >= max_in_flight:
+                    collect(pending.popleft())
+
+            while pending:
+                collect(pending.popleft())
+
+        return [
+            {
+                "group": g,
+                "partitions": len(offsets[g]),
+                "skipped": skipped[g],
+                "offsets": {f"{t}:{p}": o for (t, p), o in sorted(offsets[g].items())},
+                "result": results[g],
+            }
+            for g in offsets
+        ]
@@ -0,0 +1,134 @@
+import os
+import tempfile
+import time
+
+
+class NameIndex():
+    KINDS = ("topics", "groups", "brokers")
+
+    def __init__(self, directory):
+        """
+        The on-disk resource name index class.
+
+        Every kind of name is kept in its own file of sorted names, one per line, so a prefix
+        search is a binary search over the file and never talks to the cluster.
+
+        Args:
+            directory (str): The index directory, one per cluster.
+        """
+        self.directory = directory
+
+    def path(self, kind):
+        return os.path.join(self.directory, f"{kind}.idx")
+
+    def age(self, kind):
+        """
+        Get the age of an index file.
+
+        Args:
+            kind (str): The kind of names, `topics`, `groups` or `brokers`.
+
+        Returns:
+            float: The number of seconds since the index was written, or None if it does not exist.
+        """
+        try:
+            return time.time() - os.path.getmtime(self.path(kind))
+        except OSError:
+            return None
+
+    def write(self, kind, names):
+        """
+        Replace an index file atomically.
+
+        Args:
+            kind (str): The kind of names.
+            names (iterable[str]): The names.
+
+        Returns:
+            int: The number of names written.
+        """
+        names = sorted(set(str(n) for n in names))
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=f".{kind}.")
+        with os.fdopen(fd, "w") as f:
+            f.write("".join(f"{n}\n" for n in names))
+        os.replace(tmp, self.path(kind))
+        return len(names)
+
+    def search(self, kind, prefix="", limit=1000):
+        """
+        Find the names that start with a prefix.
+
+        The first match is found by a binary search over the byte offsets of the file, each step
+        realigned to the start of a line, so only the matching lines and a few lines per step are
+        read, however large the index is. UTF-8 preserves the order of the names, so the sorted
+        file can be searched as bytes.
+
+        Args:
+            kind (str): The kind of names.
+            prefix (str, optional): The name prefix.
+            limit (int, optional): The maximum number of names returned.
+
+        Returns:
+            list[str]: The matching names in sorted order.
+        """
+        key = prefix.encode()
+        try:
+            f = open(self.path(kind), "rb")
+        except OSError:
+            return []
+
+        with f:
+            def line_start(offset):
+                # The first line that starts at or after the offset.
+                if offset == 0:
+                    return 0
+                f.seek(offset - 1)
+                f.readline()
+                return f.tell()
+
+            # Every line before `lo` is lower than the prefix, and the first match starts at the
+            # first line at or after some offset in [lo, hi].
+            lo, hi = 0, os.fstat(f.fileno()).st_size
+            while lo < hi:
+                mid = (lo + hi) // 2
+                start = line_start(mid)
+                f.seek(start)
+                line = f.readline()
+                if not line or line.rstrip(b"\n") >= key:
+                    hi = mid
+                else:
+                    lo = start + len(line)
+
+            f.seek(lo)
+            results = []
+            for line in f:
+                name = line.rstrip(b"\n")
+                if not name.startswith(key) or len(results) >= limit:
+                    break
+                results.append(name.decode())
+            return results
+
+    def refresh(self, admin_client, timeout=10):
+        """
+        Rebuild every index file from the cluster.
+
+        Args:
+            admin_client (kafka.admin.client.AsyncAdminClient): The Kafka AdminClient instance.
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            dict: The number of names written for each kind.
+
+        Raises:
+            KafkaError: If there is an error during the process.
+        """
+        metadata = admin_client.list_topics(timeout=timeout)
+        # Groups in every state, since empty groups are the ones that get deleted.
+        groups = admin_client.list_consumer_groups(request_timeout=timeout).result()
+
+        return {
+            "topics": self.write("topics", metadata.topics.keys()),
+            "groups": self.write("groups", (g.group_id for g in groups.valid)),
+            "brokers": self.write("brokers", metadata.brokers.keys()),
+        }
@@ -0,0 +1,441 @@
+from confluent_kafka.admin import NewPartitions
+from collections import deque
+
+import heapq
+import re
+
+from .cluster import Cluster
+from .topic import Topic
+
+
+def balance_replicas(replicas, brokers, racks=None, names=None):
+    """
+    Move the fewest replicas needed to even out the replica count across brokers.
+
+    Replicas hosted on brokers outside of `brokers` are moved first. Afterwards a replica is moved
+    from the most loaded broker to the least loaded broker until the counts differ by at most one.
+    Brokers are kept in lazy min/max heaps and the partitions each broker hosts are indexed by the
+    racks of their other replicas, so a partition that may move to a broker is found without a scan.
+
+    Args:
+        replicas (list[list[int]]): The replica list for each partition. Modified in place.
+        brokers (list[int]): The brokers that should host the replicas.
+        racks (dict, optional): The rack for each broker. A replica is only moved to a broker in a
+            rack that the partition does not use yet, unless it stays within its own rack.
+        names (list[str], optional): The name of each partition, used in errors.
+
+    Returns:
+        int: The number of replicas moved.
+
+    Raises:
+        ValueError: If replicas on brokers outside of `brokers` cannot be moved without breaking the rack constraints.
+    """
+    racks = racks or {}
+    targets = set(brokers)
+    counts = {b: 0 for b in brokers}
+    index = {b: {} for b in brokers}
+    evictions = []
+
+    def used(p, src):
+        return frozenset(racks.get(b) for b in replicas[p] if b != src)
+
+    def add(p, b):
+        index[b].setdefault(used(p, b), []).append(p)
+
+    for p, replica_list in enumerate(replicas):
+        for b in replica_list:
+            if b in targets:
+                counts[b] += 1
+                add(p, b)
+            else:
+                evictions.append((p, b))
+
+    def allowed(rack_set, src, dst):
+        rack = racks.get(dst)
+        return rack is None or rack == racks.get(src) or rack not in rack_set
+
+    def move(p, src, dst):
+        replica_list = replicas[p]
+        replica_list[replica_list.index(src)] = dst
+        counts[dst] += 1
+        if src in counts:
+            counts[src] -= 1
+        # The other replicas of the partition only need a new index entry when a rack changed.
+        for b in replica_list:
+            if b in index and (b == dst or racks.get(src) != racks.get(dst)):
+                add(p, b)
+
+    def take(src, dst):
+        # Index entries are dropped lazily, once the partition has left the broker or its racks changed.
+        for rack_set, hosted in index[src].items():
+            if not allowed(rack_set, src, dst):
+                continue
+            skipped = []
+            found = None
+            while hosted:
+                p = hosted.pop()
+                if src not in replicas[p] or used(p, src) != rack_set:
+                    continue
+                if dst in replicas[p]:
+                    skipped.append(p)
+                    continue
+                found = p
+                break
+            hosted.extend(skipped)
+            if found is not None:
+                return found
+        return None
+
+    moves = 0
+
+    # Evict the replicas from brokers that are not in the target set.
+    min_heap = [(c, b) for b, c in counts.items()]
+    heapq.heapify(min_heap)
+    unplaced = []
+    for p, src in evictions:
+        rack_set = used(p, src)
+        rejected = []
+        while min_heap:
+            c, dst = heapq.heappop(min_heap)
+            if c != counts[dst]:
+                continue
+            if dst not in replicas[p] and allowed(rack_set, src, dst):
+                move(p, src, dst)
+                moves += 1
+                heapq.heappush(min_heap, (counts[dst], dst))
+                break
+            rejected.append((c, dst))
+        else:
+            unplaced.append(names[p] if names else str(p))
+        for entry in rejected:
+            heapq.heappush(min_heap, entry)
+
+    if unplaced:
+        raise ValueError(
+            f"{len(unplaced)} replicas cannot be moved off the brokers outside of {sorted(targets)} "
+            f"without breaking the rack constraints: {', '.join(unplaced)}."
+        )
+
+    # Level the replica counts between the most and least loaded brokers.
+    min_heap = [(c, b) for b, c in counts.items()]
+    max_heap = [(-c, b) for b, c in counts.items()]
+    heapq.heapify(min_heap)
+    heapq.heapify(max_heap)
+    exhausted = set()
+
+    while max_heap:
+        c, src = heapq.heappop(max_heap)
+        if -c != counts[src] or src in exhausted:
+            continue
+
+        moved = False
+        rejected = []
+        while min_heap and not moved:
+            c, dst = heapq.heappop(min_heap)
+            if c != counts[dst]:
+                continue
+            if counts[src] - counts[dst] <= 1:
+                rejected.append((c, dst))
+                break
+
+            p = take(src, dst)
+            if p is not None:
+                move(p, src, dst)
+                moves += 1
+                moved = True
+                heapq.heappush(min_heap, (counts[dst], dst))
+            else:
+                rejected.append((c, dst))
+
+        for entry in rejected:
+            heapq.heappush(min_heap, entry)
+
+        if moved:
+            heapq.heappush(max_heap, (-counts[src], src))
+        else:
+            exhausted.add(src)
+
+    return moves
+
+
+def balance_leaders(replicas, brokers):
+    """
+    Reorder the replica lists so that the preferred leaders are spread evenly across brokers.
+
+    The preferred leader is the first replica. Only the order of each replica list changes, so no
+    data is moved between brokers.
+
+    Args:
+        replicas (list[list[int]]): The replica list for each partition. Modified in place.
+        brokers (list[int]): The brokers that should lead the partitions.
+
+    Returns:
+        int: The number of preferred leaders changed.
+    """
+    counts = {b: 0 for b in brokers}
+    index = {b: deque() for b in brokers}
+    for p, replica_list in enumerate(replicas):
+        if replica_list and replica_list[0] in counts:
+            counts[replica_list[0]] += 1
+            index[replica_list[0]].append(p)
+
+    max_heap = [(-c, b) for b, c in counts.items()]
+    heapq.heapify(max_heap)
+    changes = 0
+
+    while max_heap:
+        c, src = heapq.heappop(max_heap)
+        if -c != counts[src]:
+            continue
+
+        # Partitions that cannot move now stay in the queue, for when the counts have changed.
+        led = index[src]
+        checked = 0
+        while led and checked < len(led):
+            p = led.popleft()
+            replica_list = replicas[p]
+            if replica_list[0] != src:
+                continue
+
+            i = min(range(1, len(replica_list)), key=lambda i: counts.get(replica_list[i], counts[src]), default=None)
+            if i is None or counts.get(replica_list[i], counts[src]) > counts[src] - 2:
+                led.append(p)
+                checked += 1
+                continue
+
+            dst = replica_list[i]
+            replica_list[0], replica_list[i] = dst, src
+            counts[src] -= 1
+            counts[dst] += 1
+            index[dst].append(p)
+            changes += 1
+            heapq.heappush(max_heap, (-counts[dst], dst))
+            heapq.heappush(max_heap, (-counts[src], src))
+            break
+
+    return changes
+
+
+def place_partitions(replicas, count, brokers, replica_counts, leader_counts, racks=None):
+    """
+    Place the replicas of new partitions of a topic so that the broker load evens out.
+
+    Every new partition is led by the broker that leads the fewest partitions of the topic, then of
+    the cluster, and its followers are the brokers with the fewest replicas of the topic, then of
+    the cluster. Followers are picked from racks the partition does not use yet when possible.
+
+    Args:
+        replicas (list[list[int]]): The replica list for each current partition of the topic.
+        count (int): The number of partitions to add.
+        brokers (list[int]): The brokers that should host the replicas.
+        replica_counts (dict): The number of replicas on each broker across the cluster. Updated in place.
+        leader_counts (dict): The number of preferred leaders on each broker across the cluster. Updated in place.
+        racks (dict, optional): The rack for each broker.
+
+    Returns:
+        list[list[int]]: The replica list for each new partition.
+
+    Raises:
+        ValueError: If the replication factor is larger than the number of brokers.
+    """
+    racks = racks or {}
+    replication_factor = len(replicas[0]) if replicas else 1
+    if replication_factor > len(brokers):
+        raise ValueError(f"The replication factor {replication_factor} is larger than the {len(brokers)} brokers.")
+
+    topic_replicas = {b: 0 for b in brokers}
+    topic_leaders = {b: 0 for b in brokers}
+    for replica_list in replicas:
+        for b in replica_list:
+            if b in topic_replicas:
+                topic_replicas[b] += 1
+        if replica_list and replica_list[0] in topic_leaders:
+            topic_leaders[replica_list[0]] += 1
+
+    def load(b):
+        return (topic_replicas[b], replica_counts.get(b, 0), b)
+
+    results = []
+    for _ in range(count):
+        leader = min(brokers, key=lambda b: (topic_leaders[b], leader_counts.get(b, 0)) + load(b))
+        replica_list = [leader]
+        while len(replica_list) < replication_factor:
+            used = {racks.get(b) for b in replica_list}
+            candidates = [b for b in brokers if b not in replica_list]
+            spread = [b for b in candidates if racks.get(b) is None or racks.get(b) not in used]
+            replica_list.append(min(spread or candidates, key=load))
+
+        topic_leaders[leader] += 1
+        leader_counts[leader] = leader_counts.get(leader, 0) + 1
+        for b in replica_list:
+            topic_replicas[b] += 1
+            replica_counts[b] = replica_counts.get(b, 0) + 1
+        results.append(replica_list)
+
+    return results
+
+
+class PartitionReassignment():
+    def __init__(self, admin_client):
+        """
+        The Kafka Partition Reassignment planner class.
+
+        Args:
+            admin_client (kafka.admin.client.AsyncAdminClient): The Kafka AdminClient instance.
+        """
+        self.admin_client = admin_client
+
+    def plan(self, topics=None, brokers=None, leaders=True, batch_size=0, timeout=10):
+        """
+        Plan a balanced partition reassignment that moves as few replicas as possible.
+
+        Args:
+            topics (list, optional): List of topics to balance. If None, all topics are balanced.
+            brokers (list[int], optional): The brokers to balance across. If None, all brokers are used.
+            leaders (bool, optional): Whether to also balance the preferred leaders.
+            batch_size (int, optional): The maximum number of partitions per reassignment. If 0, a single
+                reassignment is returned.
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            dict: The `current` assignment for rollback and the proposed `reassignments`, each in the
+                standard Kafka reassignment JSON format.
+
+        Raises:
+            ValueError: If replicas on other brokers cannot be moved without breaking the rack constraints.
+            KafkaError: If there is an error during the process.
+        """
+        cluster = Cluster(self.admin_client)
+        if not brokers:
+            brokers = sorted(b["name"] for b in cluster.get(timeout=timeout))
+        racks = cluster.get_racks(timeout=timeout)
+
+        keys = []
+        current = []
+        for topic_name, metadata in Topic(self.admin_client).describe(topics, timeout=timeout).items():
+            for partition in metadata["availability"]:
+                keys.append((topic_name, partition["id"]))
+                current.append(partition["replicas"])
+
+        proposed = [list(r) for r in current]
+        balance_replicas(
+            proposed, brokers, racks={b: racks.get(b) for b in brokers} if racks else None, names=[f"{t}:{p}" for t, p in keys]
+        )
+        if leaders:
+            balance_leaders(proposed, brokers)
+
+        # Interleave the moves by new preferred leader so that every batch spreads the
+        # replication traffic over as many brokers as possible.
+        by_leader = {}
+        for p in range(len(keys)):
+            if proposed[p] != current[p]:
+                by_leader.setdefault(proposed[p][0], []).append(p)
+        changed = []
+        queues = list(by_leader.values())
+        for i in range(max((len(q) for q in queues), default=0)):
+            changed.extend(q[i] for q in queues if i < len(q))
+
+        def reassignment(partitions, assignment):
+            return {
+                "version": 1,
+                "partitions": [
+                    {
+                        "topic": keys[p][0],
+                        "partition": keys[p][1],
+                        "replicas": assignment[p],
+                        "log_dirs": ["any"] * len(assignment[p]),
+                    }
+                    for p in partitions
+                ],
+            }
+
+        size = batch_size or len(changed) or 1
+        return {
+            "current": reassignment(changed, current),
+            "reassignments": [reassignment(changed[i : i + size], proposed) for i in range(0, len(changed), size)],
+        }
+
+    def add_partitions(self, partitions, topics=None, pattern=None, brokers=None, batch_size=50, dry_run=False, timeout=10):
+        """
+        Increase the partition count of many Kafka Topics with balanced replica placement.
+
+        The current placement of every topic is read from a single metadata request and the new
+        partitions are placed with `place_partitions`, topic by topic, so that each topic sees the
+        placement of the ones before it. The explicit assignments are sent in `create_partitions`
+        requests of up to `batch_size` topics.
+
+        Adding partitions changes the partition that the default partitioner picks for a key, so
+        the messages of a key are no longer ordered across the change.
+
+        Args:
+            partitions (int): The new total partition count.
+            topics (list[str], optional): The topic names. If None, the topics are selected by `pattern`.
+            pattern (str, optional): A regular expression the whole topic name must match.
+            brokers (list[int], optional): The brokers to place the new replicas on. If None, all brokers are used.
+            batch_size (int, optional): The maximum number of topics per `create_partitions` request.
+            dry_run (bool, optional): Only validate the requests on the brokers.
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            list[dict]: The `topic`, its current and new partition count, the `assignment` of the new
+                partitions and a `result` set to `created`, `validated`, `unchanged` or the error, for every topic.
+
+        Raises:
+            ValueError: If neither topics nor a pattern is given.
+            KafkaError: If there is an error while reading the metadata.
+        """
+        if topics is None and pattern is None:
+            raise ValueError("Either topics or a pattern is required.")
+
+        cluster = Cluster(self.admin_client)
+        if not brokers:
+            brokers = sorted(b["name"] for b in cluster.get(timeout=timeout))
+        racks = cluster.get_racks(timeout=timeout)
+
+        metadata = Topic(self.admin_client).describe(timeout=timeout)
+        replica_counts = {}
+        leader_counts = {}
+        for topic in metadata.values():
+            for p in topic["availability"]:
+                for b in p["replicas"]:
+                    replica_counts[b] = replica_counts.get(b, 0) + 1
+                if p["replicas"]:
+                    leader_counts[p["replicas"][0]] = leader_counts.get(p["replicas"][0], 0) + 1
+
+        if topics is None:
+            regex = re.compile(pattern)
+            topics = sorted(t for t in metadata if regex.fullmatch(t))
+
+        results = {}
+        requests = []
+        for topic_name in topics:
+            if topic_name not in metadata:
+                results[topic_name] = {"topic": topic_name, "partitions": 0, "new_partitions": partitions, "assignment": [], "result": "does not exist"}
+                continue
+
+            current = sorted(metadata[topic_name]["availability"], key=lambda p: p["id"])
+            result = results[topic_name] = {"topic": topic_name, "partitions": len(current), "new_partitions": partitions, "assignment": [], "result": "unchanged"}
+            if partitions <= len(current):
+                continue
+
+            try:
+                result["assignment"] = place_partitions(
+                    [p["replicas"] for p in current], partitions - len(current), brokers, replica_counts, leader_counts, racks=racks
+                )
+            except ValueError as e:
+                result["result"] = str(e)
+                continue
+            requests.append(NewPartitions(topic_name, partitions, replica_assignment=result["assignment"]))
+
+        for i in range(0, len(requests), batch_size):
+            future = self.admin_client.create_partitions(
+                requests[i : i + batch_size], validate_only=dry_run, operation_timeout=timeout, request_timeout=timeout
+            )
+            for topic_name, f in future.items():
+                try:
+                    f.result()
+                    results[topic_name]["result"] = "validated" if dry_run else "created"
+                except Exception as e:
+                    results[topic_name]["result"] = str(e)
+
+        return list(results.values())
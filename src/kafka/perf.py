@@ -0,0 +1,274 @@
+from confluent_kafka import TopicPartition, OFFSET_BEGINNING, OFFSET_END
+
+import math
+import os
+import time
+
+from .consumer import Consumer
+from .producer import Producer, TokenBucket
+
+
+class Histogram():
+    def __init__(self, precision=0.01, max_value=3600 * 1000 * 1000):
+        """
+        The log-bucketed latency histogram class.
+
+        Each bucket is `precision` wider than the previous one, so every percentile is within
+        `precision` of the exact value while the memory use is fixed, e.g. about 2200 buckets for
+        one microsecond to one hour at 1%.
+
+        Args:
+            precision (float, optional): The relative width of a bucket.
+            max_value (int, optional): The largest value in microseconds. Larger values are clamped.
+        """
+        self.base = math.log1p(precision)
+        self.counts = [0] * (int(math.log(max_value) / self.base) + 1)
+        self.reset()
+
+    def reset(self):
+        """Remove all recorded values."""
+        self.counts = [0] * len(self.counts)
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def record(self, value):
+        """
+        Record a value.
+
+        Args:
+            value (float): The value in microseconds.
+
+        Returns:
+            None
+        """
+        index = min(int(math.log(value) / self.base), len(self.counts) - 1) if value >= 1 else 0
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other):
+        """
+        Add the values of another histogram with the same precision.
+
+        Args:
+            other (Histogram): The other histogram.
+
+        Returns:
+            None
+        """
+        for i, c in enumerate(other.counts):
+            self.counts[i] += c
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        self.max = max(self.max, other.max)
+
+    def percentile(self, p):
+        """
+        Get a percentile of the recorded values.
+
+        Args:
+            p (float): The percentile, between 0 and 100.
+
+        Returns:
+            float: The percentile in microseconds, or None if no values were recorded.
+        """
+        if not self.count:
+            return None
+
+        target = max(1, math.ceil(p / 100 * self.count))
+        cumulative = 0
+        for i, c in enumerate(self.counts):
+            cumulative += c
+            if cumulative >= target:
+                if i == len(self.counts) - 1:
+                    # The last bucket also holds the clamped values.
+                    return self.max
+                # The middle of the bucket, clamped to the observed range.
+                value = math.exp((i + 0.5) * self.base) if i else self.min
+                return min(max(value, self.min), self.max)
+
+        return self.max
+
+    def summary(self):
+        """
+        Summarize the recorded values in milliseconds.
+
+        Returns:
+            dict: The `count`, `mean`, `p50`, `p99`, `p999` and `max` of the recorded values.
+        """
+        def ms(value):
+            return round(value / 1000, 3) if value is not None else None
+
+        return {
+            "count": self.count,
+            "mean": ms(self.total / self.count) if self.count else None,
+            "p50": ms(self.percentile(50)),
+            "p99": ms(self.percentile(99)),
+            "p999": ms(self.percentile(99.9)),
+            "max": ms(self.max) if self.count else None,
+        }
+
+
+class Perf():
+    def __init__(self, admin_client, bootstrap_servers=None):
+        """
+        The Kafka load generator class.
+
+        Args:
+            admin_client (kafka.admin.client.AsyncAdminClient): The Kafka AdminClient instance.
+            bootstrap_servers (str, optional): The bootstrap servers used by the producer and the consumer.
+        """
+        self.admin_client = admin_client
+        self.bootstrap_servers = bootstrap_servers
+
+    @staticmethod
+    def _report(start, histogram, size, final=False):
+        elapsed = time.perf_counter() - start
+        results = {"elapsed": round(elapsed, 3), **histogram.summary()}
+        results["rate"] = round(histogram.count / elapsed, 1) if elapsed > 0 else 0.0
+        results["mb_per_sec"] = round(size / elapsed / 1024 / 1024, 3) if elapsed > 0 else 0.0
+        results["final"] = final
+        return results
+
+    def produce(self, topic, messages=None, duration=None, record_size=100, key_cardinality=0, rate=None, interval=5, producer_config=None):
+        """
+        Produce synthetic messages to a Kafka Topic and measure the delivery latency.
+
+        The values are taken from a small pool of random payloads so generating them costs
+        nothing, and the keys cycle through `key_cardinality` distinct keys.
+
+        Args:
+            topic (str): The topic name.
+            messages (int, optional): The number of messages. If None, messages are produced until `duration` elapsed.
+            duration (float, optional): The number of seconds to produce for.
+            record_size (int, optional): The value size in bytes.
+            key_cardinality (int, optional): The number of distinct keys. If 0, messages have no key.
+            rate (float, optional): The target number of messages per second. If None, messages are produced as fast as possible.
+            interval (float, optional): The number of seconds between reports.
+            producer_config (dict, optional): Additional producer configuration.
+
+        Yields:
+            dict: The statistics of every interval, then the statistics of the whole run with `final` set.
+
+        Raises:
+            ValueError: If neither `messages` nor `duration` is set.
+            KafkaException: If a message could not be delivered.
+        """
+        if messages is None and duration is None:
+            raise ValueError("Either the number of messages or the duration is required.")
+
+        values = [os.urandom(record_size) for _ in range(16)]
+        keys = [f"key-{i}".encode() for i in range(key_cardinality)]
+
+        total = Histogram()
+        current = Histogram()
+        sizes = {"total": 0, "current": 0}
+
+        def on_delivery(err, msg):
+            if err is None:
+                latency = msg.latency()
+                if latency is not None:
+                    current.record(latency * 1000 * 1000)
+                sizes["current"] += len(msg.value())
+
+        producer = Producer(self.admin_client, self.bootstrap_servers, config=producer_config)
+        bucket = TokenBucket(rate) if rate else None
+
+        start = time.perf_counter()
+        interval_start = start
+        sent = 0
+        while (messages is None or sent < messages) and (duration is None or time.perf_counter() - start < duration):
+            if bucket is not None:
+                bucket.take()
+            producer.produce(
+                topic,
+                value=values[sent % len(values)],
+                key=keys[sent % len(keys)] if keys else None,
+                on_delivery=on_delivery,
+            )
+            sent += 1
+
+            if time.perf_counter() - interval_start >= interval:
+                yield self._report(interval_start, current, sizes["current"])
+                total.merge(current)
+                current.reset()
+                sizes["total"] += sizes["current"]
+                sizes["current"] = 0
+                interval_start = time.perf_counter()
+
+        producer.flush()
+        total.merge(current)
+        sizes["total"] += sizes["current"]
+        yield self._report(start, total, sizes["total"], final=True)
+
+    def consume(self, topic, messages=None, duration=None, from_beginning=False, batch_size=1000, interval=5):
+        """
+        Consume the messages of a Kafka Topic and measure the end-to-end latency.
+
+        The latency of a message is the time between its timestamp and its consumption, so it is
+        meaningful for messages produced while consuming, e.g. by `produce`.
+
+        Args:
+            topic (str): The topic name.
+            messages (int, optional): The number of messages. If None, messages are consumed until `duration` elapsed.
+            duration (float, optional): The number of seconds to consume for.
+            from_beginning (bool, optional): Whether to start from the earliest offsets instead of the latest.
+            batch_size (int, optional): The maximum number of messages per consume call.
+            interval (float, optional): The number of seconds between reports.
+
+        Yields:
+            dict: The statistics of every interval, then the statistics of the whole run with `final` set.
+
+        Raises:
+            ValueError: If neither `messages` nor `duration` is set.
+            KafkaError: If there is an error during the process.
+        """
+        if messages is None and duration is None:
+            raise ValueError("Either the number of messages or the duration is required.")
+
+        partitions = self.admin_client.list_topics(topic, timeout=10).topics[topic].partitions
+        offset = OFFSET_BEGINNING if from_beginning else OFFSET_END
+
+        total = Histogram()
+        current = Histogram()
+        total_size = 0
+        current_size = 0
+
+        consumer = Consumer(self.admin_client, self.bootstrap_servers)._consumer()
+        try:
+            consumer.assign([TopicPartition(topic, p, offset) for p in partitions])
+
+            start = time.perf_counter()
+            interval_start = start
+            received = 0
+            while (messages is None or received < messages) and (duration is None or time.perf_counter() - start < duration):
+                batch = consumer.consume(batch_size, timeout=min(0.5, interval))
+                now = time.time() * 1000
+                for m in batch:
+                    if m.error():
+                        continue
+                    current.record(max(now - m.timestamp()[1], 0) * 1000)
+                    current_size += len(m.value() or b"")
+                    received += 1
+
+                if time.perf_counter() - interval_start >= interval:
+                    yield self._report(interval_start, current, current_size)
+                    total.merge(current)
+                    current.reset()
+                    total_size += current_size
+                    current_size = 0
+                    interval_start = time.perf_counter()
+        finally:
+            consumer.close()
+
+        total.merge(current)
+        total_size += current_size
+        yield self._report(start, total, total_size, final=True)
@@ -0,0 +1,135 @@
+from confluent_kafka import KafkaException, TopicPartition, OFFSET_END
+from confluent_kafka.admin import OffsetSpec
+
+import threading
+import time
+import uuid
+
+from .consumer import Consumer
+from .perf import Histogram
+from .producer import Producer
+from .topic import Topic
+
+
+class Probe():
+    def __init__(self, admin_client, bootstrap_servers=None):
+        """
+        The Kafka latency probe class.
+
+        Args:
+            admin_client (kafka.admin.client.AsyncAdminClient): The Kafka AdminClient instance.
+            bootstrap_servers (str, optional): The bootstrap servers used by the producer and the consumer.
+        """
+        self.admin_client = admin_client
+        self.bootstrap_servers = bootstrap_servers
+
+    def e2e(self, topic, count=10, interval=0.1, timeout=10):
+        """
+        Measure the produce to consume latency of every partition of a Kafka Topic.
+
+        The consumer is assigned every partition at its latest offset before the first probe is
+        sent, so it never joins a group. Every round sends one probe message, stamped with the send
+        time and a run id, to each partition. Other messages on the topic are ignored.
+
+        Args:
+            topic (str): The topic name.
+            count (int, optional): The number of probes per partition.
+            interval (float, optional): The number of seconds between rounds.
+            timeout (int, optional): The time (in seconds) to wait for the last probes and for admin operations.
+
+        Returns:
+            dict: The latency summary, in milliseconds, of every partition and of every leader broker,
+                with the number of probes `sent`, `failed` to be delivered and `received`.
+
+        Raises:
+            KafkaError: If there is an error during the process.
+        """
+        t = Topic(self.admin_client)
+        partitions = t.describe([topic], timeout=timeout)[topic]["availability"]
+        leaders = {p["id"]: p["leader"] for p in partitions}
+        latest = t.list_offsets([(topic, p) for p in leaders], OffsetSpec.latest(), timeout=timeout)
+
+        prefix = f"kafkactl-probe:{uuid.uuid4().hex}:".encode()
+        histograms = {p: Histogram() for p in leaders}
+        sent = {p: 0 for p in leaders}
+        # Partitions without a leader cannot be probed, they are reported with no probes sent.
+        online = [p for p, leader in leaders.items() if leader >= 0]
+        expected = count * len(online)
+        failed = {p: 0 for p in leaders}
+        done = threading.Event()
+        stop = threading.Event()
+        errors = []
+
+        consumer = Consumer(self.admin_client, self.bootstrap_servers)._consumer(**{"fetch.wait.max.ms": 10})
+        consumer.assign([TopicPartition(topic, p, latest.get((topic, p), OFFSET_END)) for p in online])
+
+        def consume():
+            seen = 0
+            try:
+                while seen < expected and not stop.is_set():
+                    for m in consumer.consume(100, timeout=0.1):
+                        value = m.value()
+                        if m.error() or not value or not value.startswith(prefix):
+                            continue
+                        latency = (time.time_ns() - int(value[len(prefix):])) / 1000
+                        histograms[m.partition()].record(max(latency, 0))
+                        seen += 1
+            except Exception as e:
+                errors.append(e)
+            finally:
+                done.set()
+
+        thread = threading.Thread(target=consume, daemon=True)
+        thread.start()
+
+        def on_delivery(err, msg):
+            if err is not None:
+                failed[msg.partition()] += 1
+
+        producer = Producer(self.admin_client, self.bootstrap_servers, config={"linger.ms": 0, "acks": "all"})
+        try:
+            for i in range(count):
+                for p in online:
+                    producer.produce(topic, value=prefix + str(time.time_ns()).encode(), partition=p, on_delivery=on_delivery)
+                    sent[p] += 1
+                if i < count - 1:
+                    time.sleep(interval)
+            try:
+                producer.flush(timeout)
+            except KafkaException:
+                # Failed probes are reported per partition instead.
+                pass
+            done.wait(timeout)
+        finally:
+            stop.set()
+            thread.join()
+            consumer.close()
+
+        if errors:
+            raise errors[0]
+
+        def summary(histogram):
+            results = histogram.summary()
+            results["received"] = results.pop("count")
+            return results
+
+        brokers = {}
+        for p, histogram in histograms.items():
+            brokers.setdefault(leaders[p], Histogram()).merge(histogram)
+
+        return {
+            "partitions": [
+                {"partition": p, "leader": leaders[p], "sent": sent[p], "failed": failed[p], **summary(histograms[p])}
+                for p in sorted(leaders)
+            ],
+            "brokers": [
+                {
+                    "broker": b,
+                    "partitions": sum(1 for leader in leaders.values() if leader == b),
+                    "sent": sum(sent[p] for p, leader in leaders.items() if leader == b),
+                    "failed": sum(failed[p] for p, leader in leaders.items() if leader == b),
+                    **summary(histogram),
+                }
+                for b, histogram in sorted(brokers.items())
+            ],
+        }
@@ -1,12 +1,262 @@
+from confluent_kafka import KafkaException, Producer as KafkaProducer
+
+import json
+import time
+
+
+def sleep_until(deadline):
+    """
+    Sleep until a `time.perf_counter` deadline.
+
+    `time.sleep` can overshoot by a millisecond or more, so it is only used for the bulk of the wait
+    and the last millisecond is spent spinning on the high-resolution clock.
+
+    Args:
+        deadline (float): The `time.perf_counter` value to wait for.
+
+    Returns:
+        None
+    """
+    remaining = deadline - time.perf_counter()
+    if remaining > 0.002:
+        time.sleep(remaining - 0.001)
+    while time.perf_counter() < deadline:
+        pass
+
+
+class TokenBucket():
+    def __init__(self, rate, burst=None):
+        """
+        The token bucket rate limiter class.
+
+        Args:
+            rate (float): The number of tokens added per second.
+            burst (float, optional): The bucket capacity. If None, it holds one second worth of tokens.
+        """
+        self.rate = rate
+        self.burst = burst or max(rate, 1)
+        self.tokens = self.burst
+        self.updated = time.perf_counter()
+
+    def take(self, n=1):
+        """
+        Take tokens from the bucket, waiting until enough tokens are available.
+
+        Args:
+            n (int, optional): The number of tokens.
+
+        Returns:
+            None
+        """
+        now = time.perf_counter()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= n
+        if self.tokens < 0:
+            # Going into debt keeps the long term rate exact without a retry loop.
+            sleep_until(now - self.tokens / self.rate)
+
+
 class Producer():
-    def __init__(self, admin_client):
+    def __init__(self, admin_client, bootstrap_servers=None, config=None):
         """
         The Kafka Producer wrapper class.
 
+        Messages are batched by the underlying producer. When its local queue is full, `produce`
+        serves delivery reports until there is room again, so the number of in-flight messages
+        stays bounded by `queue.buffering.max.messages`.
+
         Args:
             admin_client (kafka.admin.client.AsyncAdminClient): The Kafka AdminClient instance.
+            bootstrap_servers (str, optional): The bootstrap servers used by the producer.
+            config (dict, optional): Additional producer configuration, e.g. `linger.ms` or `compression.type`.
         """
         self.admin_client = admin_client
+        self.bootstrap_servers = bootstrap_servers
+        self.config = {
+            "linger.ms": 50,
+            "batch.num.messages": 10000,
+            "queue.buffering.max.messages": 100000,
+            "compression.type": "lz4",
+            **(config or {}),
+        }
+        self.producer = None
+        self.delivered = 0
+        self.errors = []
+
+    def _on_delivery(self, err, msg):
+        if err is not None:
+            if len(self.errors) < 100:
+                self.errors.append(err)
+        else:
+            self.delivered += 1
+
+    def produce(self, topic, value=None, key=None, partition=None, timestamp=None, headers=None, on_delivery=None):
+        """
+        Produce a message to a Kafka Topic.
+
+        Args:
+            topic (str): The topic name.
+            value (bytes, optional): The message value.
+            key (bytes, optional): The message key.
+            partition (int, optional): The partition. If None, the partitioner picks one from the key.
+            timestamp (int, optional): The message timestamp in milliseconds. If None, the current time is used.
+            headers (list, optional): The message headers as `(name, value)` pairs.
+            on_delivery (callable, optional): An additional delivery report callback.
+
+        Returns:
+            None
+        """
+        if self.producer is None:
+            self.producer = KafkaProducer({"bootstrap.servers": self.bootstrap_servers, **self.config})
+
+        kwargs = {"value": value, "key": key, "headers": headers}
+        if partition is not None:
+            kwargs["partition"] = partition
+        if timestamp:
+            kwargs["timestamp"] = timestamp
+
+        if on_delivery is None:
+            callback = self._on_delivery
+        else:
+            def callback(err, msg):
+                self._on_delivery(err, msg)
+                on_delivery(err, msg)
+
+        while True:
+            try:
+                self.producer.produce(topic, on_delivery=callback, **kwargs)
+                break
+            except BufferError:
+                # The local queue is full, wait for some in-flight messages to be delivered.
+                self.producer.poll(0.1)
+
+        self.producer.poll(0)
+
+    def flush(self, timeout=30):
+        """
+        Wait for all in-flight messages to be delivered.
+
+        Args:
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            int: The number of messages delivered so far.
+
+        Raises:
+            KafkaException: If a message could not be delivered or the flush timed out.
+        """
+        if self.producer is not None:
+            remaining = self.producer.flush(timeout)
+            if remaining:
+                raise KafkaException(f"{remaining} messages were not delivered within {timeout} seconds.")
+
+        if self.errors:
+            raise KafkaException(self.errors[0])
+
+        return self.delivered
+
+    def replay(self, topic, records, speed=1.0, max_rate=None, batch_size=500, keep_partitions=False, keep_timestamps=False):
+        """
+        Replay recorded messages to a Kafka Topic, keeping their inter-arrival pattern.
+
+        Every record is scheduled at its recorded time offset from the first record divided by
+        `speed` on the high-resolution clock. The records that are due are sent together in
+        batches of up to `batch_size`, and a token bucket caps the send rate at `max_rate`.
+
+        Args:
+            topic (str): The topic name.
+            records (iterable[dict]): The records, as written by `consume topic`, with `timestamp`, `key`, `value`, `headers` and `partition` fields.
+                A value that is not a string, such as a value decoded with `--value-schema`, is sent as JSON.
+            speed (float, optional): The replay speed factor. If 0 or None, the records are sent as fast as possible.
+            max_rate (float, optional): The maximum number of messages per second.
+            batch_size (int, optional): The maximum number of messages sent per batch.
+            keep_partitions (bool, optional): Whether to produce every message to its recorded partition.
+            keep_timestamps (bool, optional): Whether to keep the recorded timestamps instead of the send time.
+
+        Returns:
+            dict: The number of `messages`, the `elapsed` seconds, the `target_rate` and achieved `rate` in
+                messages per second, the rate `drift` in percent and the mean and max `lag_ms` behind schedule.
+
+        Raises:
+            KafkaException: If a message could not be delivered.
+        """
+        def encode(data):
+            if data is None or isinstance(data, bytes):
+                return data
+            if isinstance(data, str):
+                return data.encode()
+            # Values decoded with a schema are recorded as JSON, so they are replayed as JSON.
+            return json.dumps(data).encode()
+
+        bucket = TokenBucket(max_rate) if max_rate else None
+        first_timestamp = None
+        last_timestamp = None
+        messages = 0
+        total_lag = 0.0
+        max_lag = 0.0
+        batch = []
+
+        def send(batch):
+            if bucket is not None:
+                bucket.take(len(batch))
+            for record in batch:
+                headers = record.get("headers") or None
+                if isinstance(headers, dict):
+                    headers = [(k, encode(v)) for k, v in headers.items()]
+                self.produce(
+                    topic,
+                    value=encode(record.get("value")),
+                    key=encode(record.get("key")),
+                    partition=record.get("partition") if keep_partitions else None,
+                    timestamp=record.get("timestamp") if keep_timestamps else None,
+                    headers=headers,
+                )
+
+        start = time.perf_counter()
+        for record in records:
+            timestamp = record.get("timestamp") or 0
+            if first_timestamp is None:
+                first_timestamp = timestamp
+            last_timestamp = timestamp
+
+            if speed:
+                due = start + max(0, timestamp - first_timestamp) / 1000 / speed
+                now = time.perf_counter()
+                if due > now:
+                    # Send what is already due before waiting for the next record.
+                    if batch:
+                        send(batch)
+                        batch = []
+                    sleep_until(due)
+                    now = time.perf_counter()
+                lag = now - due
+                total_lag += lag
+                max_lag = max(max_lag, lag)
+
+            batch.append(record)
+            messages += 1
+            if len(batch) >= batch_size:
+                send(batch)
+                batch = []
+
+        if batch:
+            send(batch)
+        self.flush()
+
+        elapsed = time.perf_counter() - start
+        span = (last_timestamp - first_timestamp) / 1000 / speed if speed and messages > 1 else 0
+        target_rate = messages / span if span > 0 else None
+        if max_rate and (target_rate is None or target_rate > max_rate):
+            target_rate = max_rate
+        rate = messages / elapsed if elapsed > 0 else 0.0
 
-    def produce(self):
-        raise NotImplemented
\ No newline at end of file
+        return {
+            "messages": messages,
+            "elapsed": round(elapsed, 3),
+            "target_rate": round(target_rate, 1) if target_rate else None,
+            "rate": round(rate, 1),
+            "drift": round((rate - target_rate) / target_rate * 100, 2) if target_rate else None,
+            "mean_lag_ms": round(total_lag / messages * 1000, 3) if messages and speed else None,
+            "max_lag_ms": round(max_lag * 1000, 3) if speed else None,
+        }
@@ -0,0 +1,409 @@
+import operator
+import re
+
+from .consumer_group import ConsumerGroup
+from .topic import Topic
+
+TABLES = {
+    "topics": ["name", "partitions", "replication_factor", "under_replicated", "offline", "internal"],
+    "partitions": ["topic", "partition", "leader", "replicas", "isrs", "replication_factor", "in_sync", "offline"],
+    "groups": ["name", "state", "members", "partitions"],
+}
+
+OPERATORS = {
+    "=": operator.eq,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+TOKEN = re.compile(r"""\s*(?:(\(|\)|,)|(==|!=|<=|>=|=|<|>|~)|'([^']*)'|"([^"]*)"|([^\s(),=!<>~'"]+))""")
+
+
+def coerce(value):
+    """Convert a numeric or boolean string into a number or bool, leaving anything else unchanged."""
+    if not isinstance(value, str):
+        return value
+    if value in ("true", "false"):
+        return value == "true"
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def tokenize(text):
+    """
+    Split a query into tokens.
+
+    Args:
+        text (str): The query.
+
+    Returns:
+        list[tuple[str, object]]: The `punct`, `op`, `str` and `word` tokens.
+
+    Raises:
+        ValueError: If the query contains an invalid character.
+    """
+    tokens = []
+    pos = 0
+    text = text.rstrip()
+    while pos < len(text):
+        match = TOKEN.match(text, pos)
+        if not match:
+            raise ValueError(f"Unexpected character {text[pos]!r} at position {pos}.")
+        punct, op, single, double, word = match.groups()
+        if punct:
+            tokens.append(("punct", punct))
+        elif op:
+            tokens.append(("op", op))
+        elif single is not None or double is not None:
+            tokens.append(("str", single if single is not None else double))
+        else:
+            tokens.append(("word", word))
+        pos = match.end()
+    return tokens
+
+
+def compile_predicate(tokens):
+    """
+    Compile a `where` expression into a column-wise predicate.
+
+    The grammar is `expr := and_expr ("or" and_expr)*`, `and_expr := not_expr ("and" not_expr)*`,
+    `not_expr := "not" not_expr | "(" expr ")" | COLUMN OP VALUE` where OP is one of
+    `= == != < <= > >=` or `~` for a regular expression search. An unquoted VALUE that names a
+    column compares the two columns.
+
+    Args:
+        tokens (list[tuple[str, object]]): The tokens of the expression.
+
+    Returns:
+        tuple[callable, set[str]]: A function mapping the table columns to a list of booleans, one
+            per row, and the names of the columns the expression references.
+
+    Raises:
+        ValueError: If the expression is invalid.
+    """
+    pos = 0
+    columns = set()
+
+    def peek():
+        return tokens[pos] if pos < len(tokens) else (None, None)
+
+    def take():
+        nonlocal pos
+        token = peek()
+        if token[0] is None:
+            raise ValueError("Unexpected end of the where expression.")
+        pos += 1
+        return token
+
+    def is_word(token, word):
+        return token[0] == "word" and token[1].lower() == word
+
+    def parse_or():
+        left = parse_and()
+        while is_word(peek(), "or"):
+            take()
+            right = parse_and()
+            left = (lambda a, b: lambda cols, n: [x or y for x, y in zip(a(cols, n), b(cols, n))])(left, right)
+        return left
+
+    def parse_and():
+        left = parse_not()
+        while is_word(peek(), "and"):
+            take()
+            right = parse_not()
+            left = (lambda a, b: lambda cols, n: [x and y for x, y in zip(a(cols, n), b(cols, n))])(left, right)
+        return left
+
+    def parse_not():
+        token = peek()
+        if is_word(token, "not"):
+            take()
+            inner = parse_not()
+            return lambda cols, n: [not x for x in inner(cols, n)]
+        if token == ("punct", "("):
+            take()
+            inner = parse_or()
+            if take() != ("punct", ")"):
+                raise ValueError("Expected ')' in the where expression.")
+            return inner
+        return parse_comparison()
+
+    def parse_comparison():
+        kind, column = take()
+        if kind != "word":
+            raise ValueError(f"Expected a column name but got {column!r}.")
+        kind, op = take()
+        if kind != "op":
+            raise ValueError(f"Expected an operator after {column!r} but got {op!r}.")
+        kind, value = take()
+        if kind not in ("word", "str"):
+            raise ValueError(f"Expected a value after {column!r} {op} but got {value!r}.")
+        columns.add(column)
+
+        if op == "~":
+            try:
+                pattern = re.compile(value)
+            except re.error as e:
+                raise ValueError(f"Invalid regular expression {value!r} after {column!r} ~: {e}.")
+            return lambda cols, n: [v is not None and pattern.search(str(v)) is not None for v in cols.get(column, [None] * n)]
+
+        compare = OPERATORS[op]
+        name = value if kind == "word" else None
+        value = coerce(value) if kind == "word" else value
+
+        def predicate(cols, n):
+            # An unquoted value that names a column is compared row by row with that column.
+            others = cols[name] if name in cols else [value] * n
+            mask = []
+            for v, other in zip(cols.get(column, [None] * n), others):
+                try:
+                    mask.append(v is not None and other is not None and compare(v, other))
+                except TypeError:
+                    mask.append(compare(str(v), str(other)))
+            return mask
+
+        return predicate
+
+    predicate = parse_or()
+    if pos != len(tokens):
+        raise ValueError(f"Unexpected token {tokens[pos][1]!r} in the where expression.")
+    return predicate, columns
+
+
+def parse(text):
+    """
+    Parse a query of the form `TABLE [where EXPR] [select COLUMN, ...] [sort [-]COLUMN, ...] [limit N]`.
+
+    Args:
+        text (str): The query.
+
+    Returns:
+        dict: The `table`, compiled `predicate`, `select`, `sort` and `limit` of the query, along
+            with the set of referenced `columns`.
+
+    Raises:
+        ValueError: If the query is invalid.
+    """
+    tokens = tokenize(text)
+    if not tokens or tokens[0][0] != "word" or tokens[0][1].lower() not in TABLES:
+        raise ValueError(f"A query must start with one of: {', '.join(TABLES)}.")
+
+    clauses = {}
+    current = None
+    for token in tokens[1:]:
+        if token[0] == "word" and token[1].lower() in ("where", "select", "sort", "limit") and token[1].lower() not in clauses:
+            current = token[1].lower()
+            clauses[current] = []
+        elif current is None:
+            raise ValueError(f"Unexpected token {token[1]!r}, expected where, select, sort or limit.")
+        else:
+            clauses[current].append(token)
+
+    for clause, clause_tokens in clauses.items():
+        if not clause_tokens:
+            raise ValueError(f"The {clause} clause is empty.")
+
+    query = {"table": tokens[0][1].lower(), "predicate": None, "select": [], "sort": [], "limit": None, "columns": set()}
+
+    if "where" in clauses:
+        query["predicate"], query["columns"] = compile_predicate(clauses["where"])
+    query["select"] = [t[1] for t in clauses.get("select", []) if t != ("punct", ",")]
+    query["sort"] = [t[1] for t in clauses.get("sort", []) if t != ("punct", ",")]
+    if "limit" in clauses:
+        limit = clauses["limit"]
+        if len(limit) != 1 or not re.fullmatch(r"\d+", str(limit[0][1])):
+            raise ValueError(f"The limit must be a non-negative integer, got {' '.join(str(t[1]) for t in limit)!r}.")
+        query["limit"] = int(limit[0][1])
+
+    query["columns"] |= set(query["select"]) | {c.lstrip("-") for c in query["sort"]}
+    return query
+
+
+class Query():
+    def __init__(self, admin_client=None, snapshot=None):
+        """
+        The Kafka Cluster query engine class.
+
+        Queries are evaluated over an in-memory columnar model of the cluster that is built from the
+        live metadata, or from a saved snapshot when one is given.
+
+        Args:
+            admin_client (kafka.admin.client.AsyncAdminClient, optional): The Kafka AdminClient instance.
+            snapshot (dict, optional): A snapshot taken with `kafka.Snapshot`.
+        """
+        self.admin_client = admin_client
+        self.snapshot = snapshot
+        self.tables = {}
+
+    def _rows(self, table, with_configs, timeout):
+        """Build the rows of a table from the snapshot or from the live cluster."""
+        if self.snapshot is not None:
+            return self._snapshot_rows(table)
+
+        rows = []
+        if table in ("topics", "partitions"):
+            topic = Topic(self.admin_client)
+            topics = topic.describe(timeout=timeout)
+            configs = topic.get_configs(timeout=timeout) if table == "topics" and with_configs and topics else {}
+            for name, metadata in topics.items():
+                partitions = [
+                    [p["id"], p["leader"], p["replicas"], p["isrs"]] for p in metadata["availability"]
+                ]
+                rows.extend(self._topic_rows(table, name, partitions, configs.get(name, {})))
+
+        if table == "groups":
+            groups = ConsumerGroup(self.admin_client).describe(timeout=timeout)
+            for name, metadata in groups.items():
+                rows.append({
+                    "name": name,
+                    "state": metadata["state"],
+                    "members": len(metadata["members"]),
+                    "partitions": sum(len(m["assignments"]) for m in metadata["members"]),
+                })
+
+        return rows
+
+    def _snapshot_rows(self, table):
+        """Build the rows of a table from the snapshot."""
+        rows = []
+        if table in ("topics", "partitions"):
+            defaults = self.snapshot.get("topic_defaults", {})
+            for name, partitions in self.snapshot["topics"].items():
+                configs = dict(defaults, **self.snapshot["configs"].get(name, {}))
+                rows.extend(self._topic_rows(table, name, partitions, configs))
+
+        if table == "groups":
+            for name, group in self.snapshot["groups"].items():
+                rows.append({
+                    "name": name,
+                    "state": group["state"],
+                    "members": None,
+                    "partitions": len(group["offsets"]),
+                })
+
+        return rows
+
+    @staticmethod
+    def _topic_rows(table, name, partitions, configs):
+        """Build the topic or partition rows of a topic from its `[id, leader, replicas, isrs]` partitions."""
+        if table == "partitions":
+            return [
+                {
+                    "topic": name,
+                    "partition": pid,
+                    "leader": leader,
+                    "replicas": replicas,
+                    "isrs": isrs,
+                    "replication_factor": len(replicas),
+                    "in_sync": len(isrs),
+                    "offline": leader < 0,
+                }
+                for pid, leader, replicas, isrs in partitions
+            ]
+
+        row = {
+            "name": name,
+            "partitions": len(partitions),
+            "replication_factor": max((len(p[2]) for p in partitions), default=0),
+            "under_replicated": sum(1 for p in partitions if len(p[3]) < len(p[2])),
+            "offline": sum(1 for p in partitions if p[1] < 0),
+            "internal": name.startswith("__") or name.startswith("_confluent"),
+        }
+        for key, value in configs.items():
+            row[key] = None if value == "-" else coerce(value)
+        return [row]
+
+    def load(self, table, with_configs=True, timeout=10):
+        """
+        Load a table into the columnar model, unless it is already loaded.
+
+        Args:
+            table (str): The table name, one of `topics`, `partitions` or `groups`.
+            with_configs (bool, optional): Whether to load the topic configs into the `topics` table.
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            dict: The `columns` of the table and the number of `rows`.
+
+        Raises:
+            KafkaError: If there is an error during the process.
+        """
+        loaded = self.tables.get(table)
+        if loaded is not None and (loaded["with_configs"] or not with_configs):
+            return loaded
+
+        rows = self._rows(table, with_configs, timeout)
+        names = list(TABLES[table])
+        for row in rows:
+            for key in row:
+                if key not in names:
+                    names.append(key)
+
+        self.tables[table] = {
+            "columns": {name: [row.get(name) for row in rows] for name in names},
+            "rows": len(rows),
+            "with_configs": with_configs,
+        }
+        return self.tables[table]
+
+    def execute(self, text, timeout=10):
+        """
+        Execute a query.
+
+        Args:
+            text (str): The query. See `kafka.query.parse` for the syntax.
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            tuple[list[str], list[list]]: The selected column names and the matching rows.
+
+        Raises:
+            ValueError: If the query is invalid.
+            KafkaError: If there is an error during the process.
+        """
+        query = parse(text)
+        table = query["table"]
+
+        # The topic configs are only fetched when the query references a column that is not built in.
+        with_configs = table == "topics" and any(c not in TABLES[table] for c in query["columns"])
+        model = self.load(table, with_configs=with_configs, timeout=timeout)
+        columns, n = model["columns"], model["rows"]
+
+        if query["predicate"]:
+            selected = [i for i, keep in enumerate(query["predicate"](columns, n)) if keep]
+        else:
+            selected = list(range(n))
+
+        # Apply the sort keys from last to first, relying on the stability of the sort. Missing
+        # values always sort last and numbers sort before strings.
+        for key in reversed(query["sort"]):
+            name = key.lstrip("-")
+            descending = key.startswith("-")
+            values = columns.get(name, [None] * n)
+
+            def sort_key(i):
+                v = values[i]
+                if v is None:
+                    return (not descending, 0, 0)
+                if isinstance(v, (int, float)):
+                    return (descending, 0, v)
+                return (descending, 1, str(v))
+
+            selected.sort(key=sort_key, reverse=descending)
+
+        if query["limit"] is not None:
+            selected = selected[: query["limit"]]
+
+        select = query["select"] or list(TABLES[table])
+        projected = [columns.get(name, [None] * n) for name in select]
+        return select, [[values[i] for values in projected] for i in selected]
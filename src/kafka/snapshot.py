@@ -0,0 +1,220 @@
+from confluent_kafka import ConsumerGroupState
+
+import gzip
+import hashlib
+import json
+import time
+
+from .consumer_group import ConsumerGroup
+from .topic import Topic
+
+
+def entity_hash(entity):
+    """
+    Hash a snapshot entity.
+
+    Args:
+        entity (object): A JSON serializable snapshot entity.
+
+    Returns:
+        str: The hex digest of the canonical JSON encoding of the entity.
+    """
+    data = json.dumps(entity, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class Snapshot():
+    def __init__(self, admin_client):
+        """
+        The Kafka Cluster state snapshot class.
+
+        Args:
+            admin_client (kafka.admin.client.AsyncAdminClient): The Kafka AdminClient instance.
+        """
+        self.admin_client = admin_client
+
+    def take(self, timeout=10):
+        """
+        Take a snapshot of the Kafka Cluster state.
+
+        The snapshot holds the partition placement of every topic, the default and overridden topic
+        configs and the committed offsets of every consumer group, along with a hash for each topic,
+        config override set and group.
+
+        Args:
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            dict: The snapshot.
+
+        Raises:
+            KafkaError: If there is an error during the process.
+        """
+        metadata = self.admin_client.list_topics(timeout=timeout)
+
+        topics = {}
+        for topic_name, topic in metadata.topics.items():
+            topics[topic_name] = [
+                [p.id, p.leader, list(p.replicas), list(p.isrs)]
+                for p in sorted(topic.partitions.values(), key=lambda p: p.id)
+            ]
+
+        # The default topic configs are the same for every topic, so they are only stored once.
+        configs = {}
+        topic_defaults = {}
+        topic = Topic(self.admin_client)
+        for topic_name, entries in topic.describe_configs(list(topics.keys()), timeout=timeout).items():
+            configs[topic_name] = {}
+            for name, entry in entries.items():
+                if entry.is_default:
+                    topic_defaults[name] = entry.value
+                else:
+                    configs[topic_name][name] = entry.value
+
+        groups = {}
+        consumer_group = ConsumerGroup(self.admin_client)
+        # Every group with committed offsets is saved, not only the stable and empty ones.
+        all_states = [state.name for state in ConsumerGroupState if state != ConsumerGroupState.UNKNOWN]
+        states = {g["name"]: g["state"] for g in consumer_group.get(states=all_states, timeout=timeout)}
+        for group_id, offsets in consumer_group.get_committed_offsets(list(states.keys()), timeout=timeout).items():
+            groups[group_id] = {
+                "state": states[group_id],
+                "offsets": {f"{t}:{p}": offset for (t, p), offset in sorted(offsets.items())},
+            }
+
+        return {
+            "version": 1,
+            "created": int(time.time() * 1000),
+            "brokers": sorted(metadata.brokers.keys()),
+            "topics": topics,
+            "topic_defaults": topic_defaults,
+            "configs": configs,
+            "groups": groups,
+            "hashes": {
+                section: {name: entity_hash(entity) for name, entity in entities.items()}
+                for section, entities in (("topics", topics), ("configs", configs), ("groups", groups))
+            },
+        }
+
+    def save(self, path, timeout=10):
+        """
+        Save a snapshot of the Kafka Cluster state to a gzip compressed file.
+
+        Args:
+            path (str): The path of the snapshot file.
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            dict: The number of topics, partitions, configs and groups saved.
+
+        Raises:
+            KafkaError: If there is an error during the process.
+        """
+        snapshot = self.take(timeout=timeout)
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(snapshot, f, separators=(",", ":"))
+
+        return {
+            "topics": len(snapshot["topics"]),
+            "partitions": sum(len(p) for p in snapshot["topics"].values()),
+            "configs": len(snapshot["configs"]),
+            "groups": len(snapshot["groups"]),
+        }
+
+    @staticmethod
+    def load(path):
+        """
+        Load a snapshot from a gzip compressed file.
+
+        Args:
+            path (str): The path of the snapshot file.
+
+        Returns:
+            dict: The snapshot.
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return json.load(f)
+
+    @staticmethod
+    def diff(old, new):
+        """
+        Compare two snapshots.
+
+        Only the entities whose hashes differ are compared in detail, so unchanged topics, configs
+        and groups cost a single dictionary lookup. The brokers and the default topic configs are
+        compared directly.
+
+        Args:
+            old (dict): The older snapshot.
+            new (dict): The newer snapshot.
+
+        Returns:
+            list[dict]: The `added`, `removed` and `changed` entities with the details of each change.
+        """
+        results = []
+
+        def partition_details(old_partitions, new_partitions):
+            old_by_id = {p[0]: p for p in old_partitions}
+            new_by_id = {p[0]: p for p in new_partitions}
+            details = []
+            for pid in sorted(old_by_id.keys() | new_by_id.keys()):
+                a, b = old_by_id.get(pid), new_by_id.get(pid)
+                if a is None:
+                    details.append(f"partition {pid} added")
+                elif b is None:
+                    details.append(f"partition {pid} removed")
+                else:
+                    for i, field in ((1, "leader"), (2, "replicas"), (3, "isrs")):
+                        if a[i] != b[i]:
+                            details.append(f"partition {pid} {field} {a[i]} -> {b[i]}")
+            return details
+
+        def dict_details(old_values, new_values):
+            details = []
+            for key in sorted(old_values.keys() | new_values.keys()):
+                a, b = old_values.get(key, "-"), new_values.get(key, "-")
+                if a != b:
+                    details.append(f"{key} {a} -> {b}")
+            return details
+
+        def group_details(old_group, new_group):
+            details = dict_details(old_group["offsets"], new_group["offsets"])
+            if old_group["state"] != new_group["state"]:
+                details.insert(0, f"state {old_group['state']} -> {new_group['state']}")
+            return details
+
+        old_brokers, new_brokers = set(old.get("brokers", [])), set(new.get("brokers", []))
+        for broker in sorted(old_brokers ^ new_brokers):
+            change = "added" if broker in new_brokers else "removed"
+            results.append({"section": "brokers", "name": str(broker), "change": change, "details": []})
+
+        old_defaults, new_defaults = old.get("topic_defaults", {}), new.get("topic_defaults", {})
+        for name in sorted(old_defaults.keys() | new_defaults.keys()):
+            if old_defaults.get(name) == new_defaults.get(name):
+                continue
+            change = "added" if name not in old_defaults else "removed" if name not in new_defaults else "changed"
+            details = [f"{old_defaults.get(name, '-')} -> {new_defaults.get(name, '-')}"]
+            results.append({"section": "topic_defaults", "name": name, "change": change, "details": details})
+
+        sections = (("topics", partition_details), ("configs", dict_details), ("groups", group_details))
+        for section, details in sections:
+            old_hashes = old.get("hashes", {}).get(section, {})
+            new_hashes = new.get("hashes", {}).get(section, {})
+
+            for name in sorted(old_hashes.keys() | new_hashes.keys()):
+                old_hash, new_hash = old_hashes.get(name), new_hashes.get(name)
+                if old_hash == new_hash:
+                    continue
+                if old_hash is None:
+                    results.append({"section": section, "name": name, "change": "added", "details": []})
+                elif new_hash is None:
+                    results.append({"section": section, "name": name, "change": "removed", "details": []})
+                else:
+                    results.append({
+                        "section": section,
+                        "name": name,
+                        "change": "changed",
+                        "details": details(old[section][name], new[section][name]),
+                    })
+
+        return results
@@ -1,5 +1,10 @@
-from confluent_kafka.admin import NewTopic, ConfigResource
-from confluent_kafka import KafkaException, KafkaError
+from confluent_kafka.admin import NewTopic, ConfigResource, OffsetSpec
+from confluent_kafka import KafkaException, KafkaError, TopicPartition
+
+from collections import deque
+
+import heapq
+import time
 
 from .kafka_resource import KafkaResource
 from .cluster import Cluster
@@ -13,7 +18,8 @@ class Topic(KafkaResource):
             admin_client (kafka.admin.client.AsyncAdminClient): The Kafka AdminClient instance.
         """
         super().__init__(admin_client=admin_client)
-        
+        self._cluster_default_configs = None
+
     def get(self, show_internal=False, timeout=10):
         """
         Get Kafka Topics.
@@ -36,6 +42,278 @@ class Topic(KafkaResource):
 
         return results
     
+    def get_cluster_default_configs(self, timeout=10):
+        """
+        Get the Kafka cluster default configuration, cached for the lifetime of this instance.
+
+        Args:
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            dict: The Kafka cluster default configuration.
+
+        Raises:
+            KafkaError: If there is an error during the process.
+        """
+        if self._cluster_default_configs is None:
+            self._cluster_default_configs = Cluster(self.admin_client).get_default_configs(timeout=timeout)
+        return self._cluster_default_configs
+
+    def describe_configs(self, topics, batch_size=500, timeout=10):
+        """
+        Describe the configuration entries of many Kafka Topics with batched `describe_configs` requests.
+
+        Args:
+            topics (list[str]): The topic names.
+            batch_size (int, optional): The maximum number of topics per `describe_configs` request.
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            dict: The `confluent_kafka.admin.ConfigEntry` for each config name of each topic.
+
+        Raises:
+            KafkaError: If there is an error during the process.
+        """
+        results = {}
+        for i in range(0, len(topics), batch_size):
+            resources = [ConfigResource("topic", t) for t in topics[i : i + batch_size]]
+            future = self.admin_client.describe_configs(resources, request_timeout=timeout)
+            for resource, f in future.items():
+                results[resource.name] = f.result()
+
+        return results
+
+    def get_min_insync_replicas(self, topics, batch_size=500, timeout=10):
+        """
+        Get the `min.insync.replicas` configuration for many Kafka Topics.
+
+        Args:
+            topics (list[str]): The topic names.
+            batch_size (int, optional): The maximum number of topics per `describe_configs` request.
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            dict: The `min.insync.replicas` for each topic, falling back to the cluster default.
+
+        Raises:
+            KafkaError: If there is an error during the process.
+        """
+        default = int(self.get_cluster_default_configs(timeout=timeout).get("min.insync.replicas") or 1)
+
+        results = {}
+        for topic, configs in self.describe_configs(topics, batch_size=batch_size, timeout=timeout).items():
+            entry = configs.get("min.insync.replicas")
+            results[topic] = int(entry.value) if entry is not None and entry.value else default
+
+        return results
+
+    def get_unhealthy_partitions(self, under_replicated=False, offline=False, under_min_isr=False, show_internal=True, timeout=10):
+        """
+        Get the Kafka Topic partitions that match any of the requested health filters.
+
+        The replica, in-sync replica and leader state is evaluated straight from the topic metadata.
+        The `min.insync.replicas` configuration is only fetched when `under_min_isr` is set.
+
+        Args:
+            under_replicated (bool, optional): Match partitions with fewer in-sync replicas than replicas.
+            offline (bool, optional): Match partitions without a leader.
+            under_min_isr (bool, optional): Match partitions with fewer in-sync replicas than `min.insync.replicas`.
+            show_internal (bool, optional): Whether to include internal topics.
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            list[dict]: The matching partitions and the health issues found for each of them.
+
+        Raises:
+            KafkaError: If there is an error during the process.
+        """
+        topics_metadata = self.admin_client.list_topics(timeout=timeout).topics
+        if not show_internal:
+            topics_metadata = {
+                name: t for name, t in topics_metadata.items() if not (name.startswith("__") or name.startswith("_confluent"))
+            }
+
+        min_isrs = {}
+        if under_min_isr:
+            min_isrs = self.get_min_insync_replicas(list(topics_metadata.keys()), timeout=timeout)
+
+        results = []
+        for topic_name, topic in topics_metadata.items():
+            min_isr = min_isrs.get(topic_name)
+            for partition in topic.partitions.values():
+                issues = []
+                if offline and partition.leader < 0:
+                    issues.append("offline")
+                if under_replicated and len(partition.isrs) < len(partition.replicas):
+                    issues.append("under-replicated")
+                if under_min_isr and len(partition.isrs) < min_isr:
+                    issues.append("under-min-isr")
+
+                if issues:
+                    results.append({
+                        "topic": topic_name,
+                        "partition": partition.id,
+                        "leader": partition.leader,
+                        "replicas": list(partition.replicas),
+                        "isrs": list(partition.isrs),
+                        "issues": issues,
+                    })
+
+        return results
+
+    def list_offsets(self, partitions, offset_spec, leaders=None, batch_size=1000, max_in_flight=4, timeout=10):
+        """
+        List the offsets of many Kafka Topic partitions with batched `list_offsets` requests.
+
+        Args:
+            partitions (list[tuple[str, int]]): The topic and partition pairs.
+            offset_spec (confluent_kafka.admin.OffsetSpec): The offset to list for every partition.
+            leaders (dict, optional): The leader of each topic and partition pair. When set, every
+                request only holds partitions led by the same broker.
+            batch_size (int, optional): The maximum number of partitions per `list_offsets` request.
+            max_in_flight (int, optional): The maximum number of concurrent `list_offsets` requests.
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            dict: The offset for each topic and partition pair. Partitions whose offset cannot be
+                listed, e.g. offline partitions or deleted topics, are left out.
+        """
+        groups = {}
+        for tp in partitions:
+            groups.setdefault(leaders.get(tp) if leaders else None, []).append(tp)
+
+        chunks = [group[i : i + batch_size] for group in groups.values() for i in range(0, len(group), batch_size)]
+
+        results = {}
+        pending = deque()
+
+        def collect(future):
+            for tp, f in future.items():
+                try:
+                    results[(tp.topic, tp.partition)] = f.result().offset
+                except KafkaException:
+                    continue
+
+        for chunk in chunks:
+            request = {TopicPartition(t, p): offset_spec for t, p in chunk}
+            pending.append(self.admin_client.list_offsets(request, request_timeout=timeout))
+            if len(pending) >= max_in_flight:
+                collect(pending.popleft())
+
+        while pending:
+            collect(pending.popleft())
+
+        return results
+
+    def get_offsets(self, topics=None, timestamp=None, max_in_flight=4, timeout=10):
+        """
+        Get the earliest and latest offsets, and optionally the offsets at a timestamp, of Kafka Topics.
+
+        The requests are grouped by partition leader and at most `max_in_flight` are sent at once.
+
+        Args:
+            topics (list, optional): List of topics. If None, all topics are used.
+            timestamp (int, optional): The timestamp (in milliseconds) to look up the offsets for.
+            max_in_flight (int, optional): The maximum number of concurrent `list_offsets` requests.
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            dict: The total message count and the offsets of each partition for each topic.
+
+        Raises:
+            KafkaError: If there is an error during the process.
+        """
+        topics_metadata = self.admin_client.list_topics(timeout=timeout).topics
+        if topics:
+            topics_metadata = {name: t for name, t in topics_metadata.items() if name in topics}
+
+        leaders = {
+            (topic_name, partition.id): partition.leader
+            for topic_name, topic in topics_metadata.items()
+            for partition in topic.partitions.values()
+        }
+        partitions = sorted(leaders.keys())
+
+        def list_offsets(offset_spec):
+            return self.list_offsets(partitions, offset_spec, leaders=leaders, max_in_flight=max_in_flight, timeout=timeout)
+
+        earliest = list_offsets(OffsetSpec.earliest())
+        latest = list_offsets(OffsetSpec.latest())
+        at_timestamp = list_offsets(OffsetSpec.for_timestamp(timestamp)) if timestamp is not None else {}
+
+        results = {}
+        for topic_name, partition in partitions:
+            low, high = earliest.get((topic_name, partition), -1), latest.get((topic_name, partition), -1)
+            offsets = {
+                "partition": partition,
+                "leader": leaders[(topic_name, partition)],
+                "earliest": low,
+                "latest": high,
+                "messages": max(high - low, 0),
+            }
+            if timestamp is not None:
+                offsets["timestamp"] = at_timestamp.get((topic_name, partition), -1)
+
+            topic = results.setdefault(topic_name, {"messages": 0, "partitions": []})
+            topic["messages"] += offsets["messages"]
+            topic["partitions"].append(offsets)
+
+        return results
+
+    def get_rates(self, topics=None, window=30, top=10, timeout=10):
+        """
+        Estimate the ingress rate of Kafka Topics by sampling the high watermarks twice.
+
+        Args:
+            topics (list, optional): List of topics to sample. If None, all topics are sampled.
+            window (float, optional): The time (in seconds) between the two samples.
+            top (int, optional): The number of topics and partitions to return, ordered by rate.
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            dict: The `topics` and `partitions` with the highest rates in messages per second.
+
+        Raises:
+            KafkaError: If there is an error during the process.
+        """
+        partitions = [
+            (topic_name, partition["id"])
+            for topic_name, metadata in self.describe(topics, timeout=timeout).items()
+            for partition in metadata["availability"]
+        ]
+
+        # Each sample is timed at its midpoint so the request latency does not skew the rate.
+        start = time.monotonic()
+        first = self.list_offsets(partitions, OffsetSpec.latest(), timeout=timeout)
+        first_time = (start + time.monotonic()) / 2
+
+        time.sleep(window)
+
+        start = time.monotonic()
+        second = self.list_offsets(partitions, OffsetSpec.latest(), timeout=timeout)
+        second_time = (start + time.monotonic()) / 2
+
+        elapsed = second_time - first_time
+        partition_rates = {}
+        topic_rates = {}
+        for tp in partitions:
+            if tp not in first or tp not in second:
+                continue
+            rate = max(second[tp] - first[tp], 0) / elapsed
+            partition_rates[tp] = rate
+            topic_rates[tp[0]] = topic_rates.get(tp[0], 0) + rate
+
+        return {
+            "topics": [
+                {"topic": t, "rate": round(r, 2)}
+                for t, r in heapq.nlargest(top, topic_rates.items(), key=lambda i: i[1])
+            ],
+            "partitions": [
+                {"topic": tp[0], "partition": tp[1], "rate": round(r, 2)}
+                for tp, r in heapq.nlargest(top, partition_rates.items(), key=lambda i: i[1])
+            ],
+        }
+
     def get_configs(self, topics=None, timeout=10):
         """
         Get configuration for one or many Kafka Topics.
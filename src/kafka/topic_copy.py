@@ -0,0 +1,159 @@
+from confluent_kafka import KafkaError, KafkaException
+from confluent_kafka.admin import ConfigSource
+
+import queue
+import threading
+import time
+
+from .consumer import Consumer
+from .producer import Producer
+from .topic import Topic
+
+
+class TopicCopy():
+    def __init__(self, source_admin_client, source_bootstrap_servers, target_admin_client, target_bootstrap_servers):
+        """
+        The Kafka Topic copy class, which copies the messages of a topic between two clusters.
+
+        Args:
+            source_admin_client (kafka.admin.client.AsyncAdminClient): The source cluster AdminClient instance.
+            source_bootstrap_servers (str): The source cluster bootstrap servers.
+            target_admin_client (kafka.admin.client.AsyncAdminClient): The target cluster AdminClient instance.
+            target_bootstrap_servers (str): The target cluster bootstrap servers.
+        """
+        self.source_admin_client = source_admin_client
+        self.source_bootstrap_servers = source_bootstrap_servers
+        self.target_admin_client = target_admin_client
+        self.target_bootstrap_servers = target_bootstrap_servers
+
+    def create_target(self, topic, target_topic, timeout=10):
+        """
+        Create the target topic with the partition count, replication factor and overridden configs of the source topic.
+
+        The replication factor is capped at the number of brokers in the target cluster.
+
+        Args:
+            topic (str): The source topic name.
+            target_topic (str): The target topic name.
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            int: The number of partitions of the target topic.
+
+        Raises:
+            KafkaError: If there is an error during the process.
+        """
+        source = Topic(self.source_admin_client)
+        metadata = source.describe([topic], timeout=timeout)[topic]
+        entries = source.describe_configs([topic], timeout=timeout)[topic]
+        config_data = {
+            name: entry.value for name, entry in entries.items() if entry.source == ConfigSource.DYNAMIC_TOPIC_CONFIG
+        }
+
+        brokers = len(self.target_admin_client.list_topics(timeout=timeout).brokers)
+        replication_factor = min(metadata["replicas"], brokers)
+        Topic(self.target_admin_client).create(target_topic, metadata["partitions"], replication_factor, config_data)
+
+        return metadata["partitions"]
+
+    def copy(self, topic, target_topic=None, create=False, batch_size=1000, buffer_size=10, timeout=10):
+        """
+        Copy the messages of a Kafka Topic to another cluster.
+
+        The messages up to the latest offsets at the start of the copy are consumed in batches by a
+        background thread and handed to a batching producer through a queue holding at most
+        `buffer_size` batches. Every message keeps its partition, key, headers and timestamp.
+
+        Args:
+            topic (str): The source topic name.
+            target_topic (str, optional): The target topic name. If None, the source topic name is used.
+            create (bool, optional): Whether to create the target topic when it does not exist.
+            batch_size (int, optional): The maximum number of messages per consumed batch.
+            buffer_size (int, optional): The maximum number of batches buffered between the consumer and the producer.
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            dict: The number of `messages` and `bytes` copied, the `elapsed` seconds and the `rate` in messages per second.
+
+        Raises:
+            KafkaError: If there is an error during the process.
+        """
+        target_topic = target_topic or topic
+
+        target_metadata = self.target_admin_client.list_topics(timeout=timeout).topics
+        if target_topic not in target_metadata:
+            if not create:
+                raise KafkaException(KafkaError(KafkaError.UNKNOWN_TOPIC_OR_PART, f"The topic '{target_topic}' does not exist."))
+            target_partitions = self.create_target(topic, target_topic, timeout=timeout)
+        else:
+            target_partitions = len(target_metadata[target_topic].partitions)
+
+        consumer = Consumer(self.source_admin_client, self.source_bootstrap_servers)
+        ranges = consumer.get_ranges(topic, timeout=timeout)
+        if ranges and max(ranges) >= target_partitions:
+            raise KafkaException(KafkaError(
+                KafkaError.INVALID_PARTITIONS,
+                f"The topic '{target_topic}' has {target_partitions} partitions but '{topic}' has more.",
+            ))
+
+        producer = Producer(self.target_admin_client, self.target_bootstrap_servers)
+        batches = queue.Queue(maxsize=buffer_size)
+        stop = threading.Event()
+        done = object()
+
+        def put(item):
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    pass
+
+        def consume():
+            kafka_consumer = consumer._consumer()
+            try:
+                for batch in consumer.read_ranges(kafka_consumer, topic, ranges, batch_size=batch_size, stop=stop):
+                    put(batch)
+            except Exception as e:
+                put(e)
+            finally:
+                kafka_consumer.close()
+                put(done)
+
+        thread = threading.Thread(target=consume, daemon=True)
+        start = time.monotonic()
+        thread.start()
+
+        messages = 0
+        size = 0
+        try:
+            while True:
+                batch = batches.get()
+                if batch is done:
+                    break
+                if isinstance(batch, Exception):
+                    raise batch
+                for m in batch:
+                    _, timestamp = m.timestamp()
+                    producer.produce(
+                        target_topic,
+                        value=m.value(),
+                        key=m.key(),
+                        partition=m.partition(),
+                        timestamp=timestamp if timestamp > 0 else None,
+                        headers=m.headers(),
+                    )
+                    messages += 1
+                    size += len(m.value() or b"") + len(m.key() or b"")
+            producer.flush()
+        finally:
+            stop.set()
+            thread.join()
+
+        elapsed = time.monotonic() - start
+        return {
+            "messages": messages,
+            "bytes": size,
+            "elapsed": round(elapsed, 3),
+            "rate": round(messages / elapsed, 1) if elapsed else 0.0,
+        }
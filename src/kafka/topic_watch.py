@@ -0,0 +1,140 @@
+import time
+
+
+class TopicWatch():
+    def __init__(self, admin_client):
+        """
+        The Kafka Topic metadata watch class.
+
+        The metadata of every topic is kept in memory as a hash and a tuple of `(leader, replicas,
+        isrs)` for each partition. Each refresh only compares the partitions of the topics whose hash
+        changed, so an idle cluster costs one metadata request and a hash lookup per topic.
+
+        Args:
+            admin_client (kafka.admin.client.AsyncAdminClient): The Kafka AdminClient instance.
+        """
+        self.admin_client = admin_client
+
+    def snapshot(self, topics=None, show_internal=True, timeout=10):
+        """
+        Take an in-memory model of the Kafka Topic metadata.
+
+        Args:
+            topics (list[str], optional): The topic names. If None, every topic is included.
+            show_internal (bool, optional): Whether to include the internal topics.
+            timeout (int, optional): The time (in seconds) to wait for the operation to complete before timing out.
+
+        Returns:
+            dict: The `hash` and the `partitions` of each topic, where each partition is a
+                `(leader, replicas, isrs)` tuple.
+
+        Raises:
+            KafkaError: If there is an error during the process.
+        """
+        metadata = self.admin_client.list_topics(timeout=timeout)
+
+        model = {}
+        for topic_name, topic in metadata.topics.items():
+            if topics and topic_name not in topics:
+                continue
+            if not show_internal and (topic_name.startswith("__") or topic_name.startswith("_confluent")):
+                continue
+
+            partitions = {
+                p.id: (p.leader, tuple(p.replicas), tuple(p.isrs)) for p in topic.partitions.values()
+            }
+            model[topic_name] = {"hash": hash(tuple(sorted(partitions.items()))), "partitions": partitions}
+
+        return model
+
+    @staticmethod
+    def diff(old, new):
+        """
+        Compare two metadata models.
+
+        Args:
+            old (dict): The older model.
+            new (dict): The newer model.
+
+        Returns:
+            list[dict]: The change events, each with an `event` name, the `topic` and, for partition
+                events, the `partition` and its `old` and `new` value.
+        """
+        events = []
+
+        for topic_name in sorted(old.keys() - new.keys()):
+            events.append({"event": "topic_deleted", "topic": topic_name, "partitions": len(old[topic_name]["partitions"])})
+
+        for topic_name in sorted(new.keys()):
+            if topic_name not in old:
+                events.append({"event": "topic_created", "topic": topic_name, "partitions": len(new[topic_name]["partitions"])})
+                continue
+            if old[topic_name]["hash"] == new[topic_name]["hash"]:
+                continue
+
+            old_partitions = old[topic_name]["partitions"]
+            new_partitions = new[topic_name]["partitions"]
+            if len(new_partitions) > len(old_partitions):
+                events.append({"event": "partitions_added", "topic": topic_name, "old": len(old_partitions), "new": len(new_partitions)})
+
+            for partition in sorted(old_partitions.keys() & new_partitions.keys()):
+                if old_partitions[partition] == new_partitions[partition]:
+                    continue
+
+                old_leader, old_replicas, old_isrs = old_partitions[partition]
+                new_leader, new_replicas, new_isrs = new_partitions[partition]
+
+                def event(name, old_value, new_value):
+                    events.append({"event": name, "topic": topic_name, "partition": partition, "old": old_value, "new": new_value})
+
+                if old_leader != new_leader:
+                    event("leader_moved", old_leader, new_leader)
+                if old_replicas != new_replicas:
+                    event("replicas_changed", list(old_replicas), list(new_replicas))
+                if set(new_isrs) < set(old_isrs):
+                    event("isr_shrunk", sorted(old_isrs), sorted(new_isrs))
+                elif set(new_isrs) > set(old_isrs):
+                    event("isr_expanded", sorted(old_isrs), sorted(new_isrs))
+                elif set(new_isrs) != set(old_isrs):
+                    event("isr_changed", sorted(old_isrs), sorted(new_isrs))
+
+        return events
+
+    def watch(self, topics=None, show_internal=True, interval=5, timeout=10):
+        """
+        Watch the Kafka Topic metadata for changes.
+
+        The first refresh only builds the model, every later refresh yields the changes since the
+        one before it. A failed refresh yields a `refresh_failed` event with the `error` and keeps
+        the previous model, so the next refresh reports the changes since the last successful one.
+
+        Args:
+            topics (list[str], optional): The topic names. If None, every topic is watched.
+            show_internal (bool, optional): Whether to include the internal topics.
+            interval (float, optional): The time (in seconds) between refreshes.
+            timeout (int, optional): The time (in seconds) to wait for each refresh to complete before timing out.
+
+        Yields:
+            dict: The change events, as returned by `TopicWatch.diff`, with a `timestamp` in milliseconds.
+
+        Raises:
+            KafkaError: If there is an error during the first refresh.
+        """
+        model = self.snapshot(topics=topics, show_internal=show_internal, timeout=timeout)
+        deadline = time.monotonic()
+
+        while True:
+            # Refresh on a fixed schedule, so slow metadata requests do not stretch the interval.
+            deadline += interval
+            time.sleep(max(deadline - time.monotonic(), 0))
+
+            timestamp = int(time.time() * 1000)
+            try:
+                refreshed = self.snapshot(topics=topics, show_internal=show_internal, timeout=timeout)
+            except Exception as e:
+                yield {"timestamp": timestamp, "event": "refresh_failed", "error": str(e)}
+                continue
+
+            for event in self.diff(model, refreshed):
+                yield {"timestamp": timestamp, **event}
+            model = refreshed
@@ -1,4 +1,6 @@
-from kafka import (Cluster, Topic,ConsumerGroup, Acl, Consumer, Producer)
+from tabulate import tabulate
+from kafka import (Cluster, Topic,ConsumerGroup, Acl, Consumer, Producer, PartitionReassignment)
+from .completion import complete_brokers, complete_topics
 
 import click
 import configparser
@@ -28,13 +30,45 @@ def alter_consumer_group(ctx):
     """Alter Kafka Consumer Group."""
     raise NotImplemented
 
+ORDERING_WARNING = (
+    "Warning: adding partitions changes the partition of keyed messages, so the messages of a key "
+    "are no longer ordered across the change."
+)
+
+def add_partitions(ctx, partitions, topics=None, pattern=None, brokers=None, batch_size=50, dry_run=False, timeout=10, output="TABULATE"):
+    """Add partitions to the topics and print the outcome for each topic."""
+    r = PartitionReassignment(ctx.get("admin_client"))
+    results = r.add_partitions(partitions, topics=topics, pattern=pattern, brokers=brokers, batch_size=batch_size, dry_run=dry_run, timeout=timeout)
+
+    if any(result["assignment"] for result in results):
+        click.echo(ORDERING_WARNING, err=True)
+
+    if output.upper() == "TABULATE":
+        rows = [[
+            result["topic"], result["partitions"], result["new_partitions"],
+            " ".join(",".join(str(b) for b in replicas) for replicas in result["assignment"]) or "-", result["result"]
+        ] for result in results]
+        click.echo(tabulate(rows, headers=["TOPIC", "PARTITIONS", "NEW_PARTITIONS", "ASSIGNMENT", "RESULT"], tablefmt="plain", numalign="left"))
+
+    if output.upper() == "JSON":
+        click.echo(json.dumps(results))
+
 @alter.command("topic")
-@click.argument("topic")
+@click.argument("topic", shell_complete=complete_topics)
 @click.option("--filename", "-f", metavar="PATH", type=click.File("r"), help="Path to the properties file containing configs.")
 @click.option("configs", "--config", "-c", metavar="NAME=VALUE", type=str, multiple=True, help="Configuration in NAME=VALUE format.")
+@click.option("--partitions", "-p", default=None, metavar="N", type=int, help="Increase the partition count to N, placing the new replicas on the least loaded brokers.")
+@click.option("--dry-run", is_flag=True, help="Only validate the partition increase.")
+@click.option("--timeout", "-T", default=10, metavar="SECONDS", type=int, help="The timeout in seconds.")
 @click.pass_obj
-def alter_topic(ctx, topic, filename, configs):
+def alter_topic(ctx, topic, filename, configs, partitions, dry_run, timeout):
     """Alter Kafka Topic."""
+    if partitions is not None:
+        add_partitions(ctx, partitions, topics=[topic], dry_run=dry_run, timeout=timeout)
+        # Altering with no configs would reset every config to the cluster default.
+        if not filename and not configs:
+            return
+
     config_data = {}
     parser = configparser.ConfigParser()
 
@@ -53,4 +87,24 @@ def alter_topic(ctx, topic, filename, configs):
     t = Topic(admin_client)
     results = t.alter(topic, config_data)
     if results:
-        click.echo(json.dumps(results, sort_keys=True))
\ No newline at end of file
+        click.echo(json.dumps(results, sort_keys=True))
+
+@alter.command("topics")
+@click.option("--partitions", "-p", required=True, metavar="N", type=int, help="The new partition count of every topic.")
+@click.option("topics", "--topic", "-t", multiple=True, metavar="TOPIC", shell_complete=complete_topics, help="The name of the Kafka Topic. This option can be used multiple times to specify multiple topics.")
+@click.option("--pattern", default=None, metavar="REGEX", help="A regular expression the whole topic name must match, instead of --topic.")
+@click.option("brokers", "--broker", "-B", multiple=True, metavar="BROKER", shell_complete=complete_brokers, type=int, help="The id of a Kafka Broker to place the new replicas on. This option can be used multiple times.")
+@click.option("--batch-size", "-s", default=50, metavar="TOPICS", type=int, help="The maximum number of topics per request.")
+@click.option("--dry-run", is_flag=True, help="Only validate the partition increase.")
+@click.option("--timeout", "-T", default=10, metavar="SECONDS", type=int, help="The timeout in seconds.")
+@click.option("--output", "-o", type=click.Choice(["TABULATE", "JSON"], case_sensitive=False), default="TABULATE", metavar="FORMAT", help="The output format.")
+@click.pass_obj
+def alter_topics(ctx, partitions, topics, pattern, brokers, batch_size, dry_run, timeout, output):
+    """Increase the partition count of many Kafka Topics."""
+    if not topics and pattern is None:
+        raise click.UsageError("Either --topic or --pattern is required.")
+
+    add_partitions(
+        ctx, partitions, topics=list(topics) or None, pattern=pattern, brokers=list(brokers),
+        batch_size=batch_size, dry_run=dry_run, timeout=timeout, output=output,
+    )
@@ -0,0 +1,49 @@
+from tabulate import tabulate
+from kafka import Backup
+from .params import TIMESTAMP
+from .completion import complete_topics
+
+import click
+import json
+
+@click.group("backup")
+@click.pass_obj
+def backup(ctx):
+    """Back up Kafka resources to files."""
+    pass
+
+@backup.command("topic")
+@click.argument("topic", shell_complete=complete_topics)
+@click.argument("path", type=click.Path(file_okay=False, writable=True))
+@click.option("partitions", "--partition", "-p", multiple=True, type=int, metavar="PARTITION", help="The partition to back up. This option can be used multiple times to specify multiple partitions.")
+@click.option("--from", "start", default=None, metavar="TIMESTAMP", type=TIMESTAMP, help="Only back up messages at or after this epoch milliseconds or ISO 8601 timestamp.")
+@click.option("--to", "end", default=None, metavar="TIMESTAMP", type=TIMESTAMP, help="Only back up messages before this epoch milliseconds or ISO 8601 timestamp.")
+@click.option("--segment-bytes", default=64 * 1024 * 1024, metavar="BYTES", type=int, help="The maximum uncompressed size of a segment file.")
+@click.option("--workers", "-w", default=4, metavar="N", type=int, help="The number of partitions backed up in parallel.")
+@click.option("--timeout", "-T", default=10, metavar="SECONDS", type=int, help="The timeout in seconds.")
+@click.option("--output", "-o", type=click.Choice(["TABULATE", "JSON"], case_sensitive=False), default="TABULATE", metavar="FORMAT", help="The output format.")
+@click.pass_obj
+def backup_topic(ctx, topic, path, partitions, start, end, segment_bytes, workers, timeout, output):
+    """Back up the messages of a Kafka Topic to segment files in PATH."""
+    b = Backup(ctx.get("admin_client"), ctx.get("bootstrap_servers"))
+    index = b.backup(
+        topic, path, partitions=list(partitions), start=start, end=end,
+        segment_bytes=segment_bytes, workers=workers, timeout=timeout
+    )
+
+    results = []
+    for partition, segments in index["partitions"].items():
+        results.append({
+            "partition": int(partition),
+            "segments": len(segments),
+            "messages": sum(s["messages"] for s in segments),
+            "bytes": sum(s["bytes"] for s in segments),
+        })
+
+    if output.upper() == "TABULATE":
+        headers=["PARTITION", "SEGMENTS", "MESSAGES", "BYTES"]
+        rows = [[r["partition"], r["segments"], r["messages"], r["bytes"]] for r in results]
+        click.echo(tabulate(rows, headers=headers, tablefmt="plain", numalign="left"))
+
+    if output.upper() == "JSON":
+        click.echo(json.dumps(results))
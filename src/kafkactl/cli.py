@@ -9,9 +9,22 @@ from .delete import delete
 from .exec import exec
 from .produce import produce
 from .consume import consume
+from .plan import plan
+from .snapshot import snapshot
+from .query import query
+from .grep import grep
+from .copy import copy
+from .backup import backup
+from .restore import restore
+from .perf import perf
+from .probe import probe
+from .shell import shell
+from .serve import serve
+from .offsets import offsets
 
 import click
 import json
+import yaml
 
 class CatchAllExceptions(click.Group):
     """A click group that catches all exceptions and displays them as a message.
@@ -36,16 +49,18 @@ class CatchAllExceptions(click.Group):
 def cli(ctx, bootstrap_servers, kafka_config, log_level):
     """A command-line client for Kafka."""
 
-    if kafka_config:
-        config = yaml.safe_load(kafka_config)
-        current_ctx = config.get("current-context", None)
+    config = yaml.safe_load(kafka_config) if kafka_config else {}
+    contexts = config.get("contexts", {})
+    current_ctx = config.get("current-context", None)
 
     if not bootstrap_servers:
-        bootstrap_servers = ",".join(config.get(current_ctx, {}).get("brokers", []))
+        bootstrap_servers = ",".join(contexts.get(current_ctx, {}).get("brokers", []))
 
     ctx.obj = {
         "bootstrap_servers": bootstrap_servers,
         "admin_client": AdminClient({"bootstrap.servers": bootstrap_servers}),
+        "contexts": contexts,
+        "current_context": current_ctx,
         "log_level": log_level,
     }
 
@@ -56,4 +71,16 @@ cli.add_command(alter)
 cli.add_command(delete)
 cli.add_command(exec)
 cli.add_command(produce)
-cli.add_command(consume)
\ No newline at end of file
+cli.add_command(consume)
+cli.add_command(plan)
+cli.add_command(snapshot)
+cli.add_command(query)
+cli.add_command(grep)
+cli.add_command(copy)
+cli.add_command(backup)
+cli.add_command(restore)
+cli.add_command(perf)
+cli.add_command(probe)
+cli.add_command(shell)
+cli.add_command(serve)
+cli.add_command(offsets)
\ No newline at end of file
@@ -0,0 +1,88 @@
+from confluent_kafka.admin import AdminClient
+from kafka import NameIndex
+
+import click
+import hashlib
+import os
+import re
+import subprocess
+import sys
+import time
+import yaml
+
+MAX_AGE = 300
+LOCK_AGE = 120
+
+def resolve_cluster(ctx):
+    """Get the cache name and bootstrap servers of the cluster a command line targets, without connecting."""
+    root = ctx.find_root()
+    bootstrap_servers = root.params.get("bootstrap_servers")
+    if bootstrap_servers:
+        return "servers-" + hashlib.sha1(bootstrap_servers.encode()).hexdigest()[:12], bootstrap_servers
+
+    kafka_config = root.params.get("kafka_config")
+    if kafka_config is None:
+        return None, None
+
+    kafka_config.seek(0)
+    config = yaml.safe_load(kafka_config) or {}
+    current_ctx = config.get("current-context")
+    brokers = config.get("contexts", {}).get(current_ctx, {}).get("brokers", [])
+    if not current_ctx or not brokers:
+        return None, None
+    return re.sub(r"[^\w.-]", "_", current_ctx), ",".join(brokers)
+
+def cache_directory(name):
+    """Get the name index directory of a cluster."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "kafkactl", name)
+
+def refresh_async(directory, bootstrap_servers):
+    """Rebuild the name index in a detached process, unless another refresh is already running."""
+    lock = os.path.join(directory, ".refresh.lock")
+    os.makedirs(directory, exist_ok=True)
+    try:
+        if time.time() - os.path.getmtime(lock) > LOCK_AGE:
+            # The refresh that took the lock has died.
+            os.remove(lock)
+    except OSError:
+        pass
+
+    try:
+        os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+    except FileExistsError:
+        return
+
+    subprocess.Popen(
+        [sys.executable, "-m", "kafkactl.completion", directory, bootstrap_servers],
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+def complete(kind):
+    """Create a click shell completion function for the names of a kind, served from the local name index."""
+
+    def shell_complete(ctx, param, incomplete):
+        name, bootstrap_servers = resolve_cluster(ctx)
+        if name is None:
+            return []
+
+        directory = cache_directory(name)
+        index = NameIndex(directory)
+        age = index.age(kind)
+        if age is None or age > MAX_AGE:
+            refresh_async(directory, bootstrap_servers)
+        return index.search(kind, incomplete)
+
+    return shell_complete
+
+complete_topics = complete("topics")
+complete_groups = complete("groups")
+complete_brokers = complete("brokers")
+
+if __name__ == "__main__":
+    directory, bootstrap_servers = sys.argv[1:3]
+    try:
+        NameIndex(directory).refresh(AdminClient({"bootstrap.servers": bootstrap_servers}), timeout=60)
+    finally:
+        os.remove(os.path.join(directory, ".refresh.lock"))
@@ -1,5 +1,9 @@
 from tabulate import tabulate
 from kafka import (Cluster, Topic, ConsumerGroup, Acl, Consumer, Producer)
+from kafka.columnar import ColumnarWriter
+from kafka.consumer import to_dict
+from .params import TIMESTAMP, decoder_options
+from .completion import complete_topics
 
 import click
 import json
@@ -9,3 +13,43 @@ import json
 def consume(ctx):
     """Consume from one or many Kafka Topics."""
     pass
+
+@consume.command("topic")
+@click.argument("topic", shell_complete=complete_topics)
+@click.option("partitions", "--partition", "-p", multiple=True, type=int, metavar="PARTITION", help="The partition to consume. This option can be used multiple times to specify multiple partitions.")
+@click.option("--from", "start", default=None, metavar="TIMESTAMP", type=TIMESTAMP, help="Only consume messages at or after this epoch milliseconds or ISO 8601 timestamp.")
+@click.option("--to", "end", default=None, metavar="TIMESTAMP", type=TIMESTAMP, help="Only consume messages before this epoch milliseconds or ISO 8601 timestamp.")
+@click.option("--max-messages", "-m", default=None, metavar="N", type=int, help="Stop after this many messages.")
+@click.option("--format", "-F", "file_format", type=click.Choice(["JSON", "PARQUET", "ARROW"], case_sensitive=False), default="JSON", metavar="FORMAT", help="The output format. JSON writes one message per line, PARQUET and ARROW write typed columns decoded from JSON payloads.")
+@click.option("--output-file", "-O", "path", default=None, metavar="PATH", type=click.Path(dir_okay=False, writable=True), help="The output file. Required for the PARQUET and ARROW formats.")
+@click.option("--batch-size", default=10000, metavar="N", type=int, help="The maximum number of messages per batch, which is also the Parquet row group size.")
+@decoder_options
+@click.option("--timeout", "-T", default=10, metavar="SECONDS", type=int, help="The timeout in seconds.")
+@click.pass_obj
+def consume_topic(ctx, topic, partitions, start, end, max_messages, file_format, path, batch_size, decoder, timeout):
+    """Consume the messages of a Kafka Topic."""
+    c = Consumer(ctx.get("admin_client"), ctx.get("bootstrap_servers"))
+    batches = c.consume(
+        topic, partitions=list(partitions), start=start, end=end,
+        max_messages=max_messages, batch_size=batch_size, decoder=decoder, timeout=timeout
+    )
+
+    if file_format.upper() == "JSON":
+        with click.open_file(path or "-", "w") as f:
+            for batch in batches:
+                f.write("".join(json.dumps(to_dict(m)) + "\n" for m in batch))
+        return
+
+    if not path:
+        raise click.UsageError(f"--output-file is required for the {file_format.upper()} format.")
+
+    try:
+        writer = ColumnarWriter(path, format=file_format)
+    except ImportError as e:
+        raise click.ClickException(str(e))
+
+    with writer:
+        for batch in batches:
+            writer.write(batch)
+
+    click.echo(f"Wrote {writer.rows} messages to {', '.join(writer.paths) or path}.", err=True)
@@ -0,0 +1,41 @@
+from confluent_kafka.admin import AdminClient
+from tabulate import tabulate
+from kafka import TopicCopy
+
+import click
+import json
+
+@click.command("copy")
+@click.option("source_context", "--from-context", required=True, metavar="CONTEXT", help="The kafkaconfig context to copy from.")
+@click.option("target_context", "--to-context", required=True, metavar="CONTEXT", help="The kafkaconfig context to copy to.")
+@click.option("--topic", "-t", required=True, metavar="TOPIC", help="The topic to copy.")
+@click.option("--to-topic", "target_topic", default=None, metavar="TOPIC", help="The target topic name. Defaults to the source topic name.")
+@click.option("--create", is_flag=True, help="Create the target topic from the source topic partitions, replication factor and configs when it does not exist.")
+@click.option("--batch-size", default=1000, metavar="N", type=int, help="The maximum number of messages per consumed batch.")
+@click.option("--buffer-size", default=10, metavar="N", type=int, help="The maximum number of batches buffered between the consumer and the producer.")
+@click.option("--timeout", "-T", default=10, metavar="SECONDS", type=int, help="The timeout in seconds.")
+@click.option("--output", "-o", type=click.Choice(["TABULATE", "JSON"], case_sensitive=False), default="TABULATE", metavar="FORMAT", help="The output format.")
+@click.pass_obj
+def copy(ctx, source_context, target_context, topic, target_topic, create, batch_size, buffer_size, timeout, output):
+    """Copy the messages of a Kafka Topic between two kafkaconfig contexts."""
+    contexts = ctx.get("contexts", {})
+
+    servers = {}
+    for name in (source_context, target_context):
+        if name not in contexts:
+            raise click.BadParameter(f"The context {name!r} does not exist in the kafkaconfig.")
+        servers[name] = ",".join(contexts[name].get("brokers", []))
+
+    tc = TopicCopy(
+        AdminClient({"bootstrap.servers": servers[source_context]}), servers[source_context],
+        AdminClient({"bootstrap.servers": servers[target_context]}), servers[target_context],
+    )
+    result = tc.copy(topic, target_topic=target_topic, create=create, batch_size=batch_size, buffer_size=buffer_size, timeout=timeout)
+
+    if output.upper() == "TABULATE":
+        headers=["MESSAGES", "BYTES", "ELAPSED", "RATE"]
+        rows = [[result["messages"], result["bytes"], result["elapsed"], result["rate"]]]
+        click.echo(tabulate(rows, headers=headers, tablefmt="plain", numalign="left"))
+
+    if output.upper() == "JSON":
+        click.echo(json.dumps(result))
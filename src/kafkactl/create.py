@@ -1,8 +1,10 @@
+from tabulate import tabulate
 from kafka import (Topic, Topic, ConsumerGroup, Acl, Consumer, Producer)
 
 import click
 import configparser
 import json
+import yaml
 
 @click.group("create")
 @click.pass_obj
@@ -13,16 +15,56 @@ def create(ctx):
 @create.command("acl")
 @click.argument("resource_type")
 @click.argument("resource_name")
-@click.option("--principal", "-p", metavar="JSON", help="The principal for the ACL.")
-@click.option("--permission-type", "-P", metavar="JSON", help="The permission type for the ACL.")
+@click.option("--principal", "-p", required=True, metavar="PRINCIPAL", help="The principal for the ACL.")
+@click.option("--operation", "-O", required=True, metavar="OPERATION", help="The operation for the ACL.")
+@click.option("--permission-type", "-P", default="ALLOW", metavar="PERMISSION_TYPE", help="The permission type for the ACL.")
+@click.option("--pattern-type", default="LITERAL", metavar="PATTERN_TYPE", help="The resource pattern type for the ACL.")
+@click.option("--host", "-H", default="*", metavar="HOST", help="The host for the ACL.")
 @click.option("--timeout", "-T", default=10, metavar="SECONDS", type=int, help="The timeout in seconds.")
 @click.pass_obj
-def create_acl(ctx, resource_type, resource_name, principal, permission_type, timeout):
+def create_acl(ctx, resource_type, resource_name, principal, operation, permission_type, pattern_type, host, timeout):
     """Create a Kafka ACL."""
-    admin_client = ctx.get("admin_client")
-    a = Acl(admin_client)
-    result = a.create(resource_type, resource_name, principal=principal, permission_type=permission_type, timeout=timeout)
-    click.echo(result)
+    acl = {
+        "resource_type": resource_type,
+        "resource_name": resource_name,
+        "pattern_type": pattern_type,
+        "principal": principal,
+        "host": host,
+        "operation": operation,
+        "permission_type": permission_type,
+    }
+    a = Acl(ctx.get("admin_client"))
+    results = a.create([acl], timeout=timeout)
+    click.echo(results[0]["result"])
+
+@create.command("acls")
+@click.option("--filename", "-f", required=True, metavar="PATH", type=click.File("r"), help="Path to the YAML file containing the ACLs.")
+@click.option("--batch-size", "-B", default=100, metavar="SIZE", type=int, help="The maximum number of ACLs per request.")
+@click.option("--timeout", "-T", default=10, metavar="SECONDS", type=int, help="The timeout in seconds.")
+@click.option("--output", "-o", type=click.Choice(["TABULATE", "JSON"], case_sensitive=False), default="TABULATE", metavar="FORMAT", help="The output format.")
+@click.pass_obj
+def create_acls(ctx, filename, batch_size, timeout, output):
+    """Create many Kafka ACLs from a file."""
+    acls = yaml.safe_load(filename) or []
+    if isinstance(acls, dict):
+        acls = acls.get("acls", [])
+
+    a = Acl(ctx.get("admin_client"))
+    try:
+        results = a.create(acls, batch_size=batch_size, timeout=timeout)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="'--filename'")
+
+    if output.upper() == "TABULATE":
+        headers=["RESOURCE_TYPE", "RESOURCE_NAME", "PATTERN_TYPE", "PRINCIPAL", "HOST", "OPERATION", "PERMISSION_TYPE", "RESULT"]
+        rows = [[
+            r["resource_type"], r["resource_name"], r["pattern_type"], r["principal"],
+            r["host"], r["operation"], r["permission_type"], r["result"]
+        ] for r in results]
+        click.echo(tabulate(rows, headers=headers, tablefmt="plain"))
+
+    if output.upper() == "JSON":
+        click.echo(json.dumps(results))
 
 @create.command("topic")
 @click.argument("topic")
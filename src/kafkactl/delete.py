@@ -1,7 +1,12 @@
+from tabulate import tabulate
 from kafka import (Topic, Cluster, ConsumerGroup, Acl, Consumer, Producer)
+from confluent_kafka import ConsumerGroupState
+from .completion import complete_groups, complete_topics
+from .params import DURATION
 
 import click
 import json
+import yaml
 
 @click.group("delete")
 @click.pass_obj
@@ -10,13 +15,61 @@ def delete(ctx):
     pass
 
 @delete.command("acl")
+@click.argument("resource_type")
+@click.argument("resource_name")
+@click.option("--principal", "-p", required=True, metavar="PRINCIPAL", help="The principal for the ACL.")
+@click.option("--operation", "-O", required=True, metavar="OPERATION", help="The operation for the ACL.")
+@click.option("--permission-type", "-P", default="ALLOW", metavar="PERMISSION_TYPE", help="The permission type for the ACL.")
+@click.option("--pattern-type", default="LITERAL", metavar="PATTERN_TYPE", help="The resource pattern type for the ACL.")
+@click.option("--host", "-H", default="*", metavar="HOST", help="The host for the ACL.")
+@click.option("--timeout", "-T", default=10, metavar="SECONDS", type=int, help="The timeout in seconds.")
 @click.pass_obj
-def delete_acls(ctx):
+def delete_acl(ctx, resource_type, resource_name, principal, operation, permission_type, pattern_type, host, timeout):
     """Delete a Kafka ACL."""
-    raise NotImplemented
+    acl = {
+        "resource_type": resource_type,
+        "resource_name": resource_name,
+        "pattern_type": pattern_type,
+        "principal": principal,
+        "host": host,
+        "operation": operation,
+        "permission_type": permission_type,
+    }
+    a = Acl(ctx.get("admin_client"))
+    results = a.delete([acl], timeout=timeout)
+    click.echo(results[0]["result"])
+
+@delete.command("acls")
+@click.option("--filename", "-f", required=True, metavar="PATH", type=click.File("r"), help="Path to the YAML file containing the ACLs.")
+@click.option("--batch-size", "-B", default=100, metavar="SIZE", type=int, help="The maximum number of ACLs per request.")
+@click.option("--timeout", "-T", default=10, metavar="SECONDS", type=int, help="The timeout in seconds.")
+@click.option("--output", "-o", type=click.Choice(["TABULATE", "JSON"], case_sensitive=False), default="TABULATE", metavar="FORMAT", help="The output format.")
+@click.pass_obj
+def delete_acls(ctx, filename, batch_size, timeout, output):
+    """Delete many Kafka ACLs from a file."""
+    acls = yaml.safe_load(filename) or []
+    if isinstance(acls, dict):
+        acls = acls.get("acls", [])
+
+    a = Acl(ctx.get("admin_client"))
+    try:
+        results = a.delete(acls, batch_size=batch_size, timeout=timeout)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="'--filename'")
+
+    if output.upper() == "TABULATE":
+        headers=["RESOURCE_TYPE", "RESOURCE_NAME", "PATTERN_TYPE", "PRINCIPAL", "HOST", "OPERATION", "PERMISSION_TYPE", "RESULT"]
+        rows = [[
+            r["resource_type"], r["resource_name"], r["pattern_type"], r["principal"],
+            r["host"], r["operation"], r["permission_type"], r["result"]
+        ] for r in results]
+        click.echo(tabulate(rows, headers=headers, tablefmt="plain"))
+
+    if output.upper() == "JSON":
+        click.echo(json.dumps(results))
 
 @delete.command("group")
-@click.argument("group")
+@click.argument("group", shell_complete=complete_groups)
 @click.option("--timeout", "-T", default=30, metavar="SECONDS", type=int, help="The timeout in seconds.")
 @click.pass_obj
 def delete_group(ctx, group, timeout):
@@ -26,8 +79,36 @@ def delete_group(ctx, group, timeout):
     if results:
         click.echo(json.dumps(results))
 
+@delete.command("groups")
+@click.option("--pattern", "-p", default=None, metavar="REGEX", help="A regular expression the whole group name must match.")
+@click.option("--state", "-s", "states", multiple=True, default=["EMPTY"], type=click.Choice([s.name for s in ConsumerGroupState], case_sensitive=False), metavar="STATE", help="Only delete groups in this state, can be repeated.")
+@click.option("--older-than", default=None, metavar="DURATION", type=DURATION, help="Only delete groups that consumed nothing produced in this time, e.g. 7d.")
+@click.option("--dry-run", is_flag=True, help="Only print the groups that would be deleted.")
+@click.option("--batch-size", "-B", default=100, metavar="SIZE", type=int, help="The maximum number of groups per request.")
+@click.option("--timeout", "-T", default=30, metavar="SECONDS", type=int, help="The timeout in seconds.")
+@click.option("--output", "-o", type=click.Choice(["TABULATE", "JSON"], case_sensitive=False), default="TABULATE", metavar="FORMAT", help="The output format.")
+@click.pass_obj
+def delete_groups(ctx, pattern, states, older_than, dry_run, batch_size, timeout, output):
+    """Delete many Kafka Groups by name pattern, state and idle time."""
+    g = ConsumerGroup(ctx.get("admin_client"))
+    results = g.delete_many(
+        pattern=pattern,
+        states=list(states),
+        older_than=older_than,
+        dry_run=dry_run,
+        batch_size=batch_size,
+        timeout=timeout,
+    )
+
+    if output.upper() == "TABULATE":
+        rows = [[r["name"], r["state"], r["result"]] for r in results]
+        click.echo(tabulate(rows, headers=["GROUP", "STATE", "RESULT"], tablefmt="plain"))
+
+    if output.upper() == "JSON":
+        click.echo(json.dumps(results))
+
 @delete.command("topic")
-@click.argument("topic")
+@click.argument("topic", shell_complete=complete_topics)
 @click.option("--timeout", "-T", default=30, metavar="SECONDS", type=int, help="The timeout in seconds.")
 @click.pass_obj
 def delete_topic(ctx, topic, timeout):
@@ -1,5 +1,8 @@
 from tabulate import tabulate
-from kafka import (Cluster, Topic,ConsumerGroup, Acl, Consumer, Producer)
+from kafka import (Cluster, Topic,ConsumerGroup, Acl, Consumer, Producer, TopicWatch)
+from kafka.cluster import IDENTITY_CONFIGS
+from .params import DURATION
+from .completion import complete_brokers, complete_groups, complete_topics
 
 import click
 import json
@@ -16,6 +19,52 @@ def describe_acls(ctx):
     """Describe Kafka ACLs."""
     raise NotImplemented
 
+@describe.command("brokers")
+@click.option("--timeout", "-T", default=10, metavar="SECONDS", type=int, help="The timeout in seconds.")
+@click.option("--output", "-o", type=click.Choice(["TABULATE", "JSON"], case_sensitive=False), default="TABULATE", metavar="FORMAT", help="The output format.")
+@click.pass_obj
+def describe_brokers(ctx, timeout, output):
+    """Describe Kafka Brokers."""
+    cluster = Cluster(ctx.get("admin_client"))
+    results = cluster.describe_brokers(timeout=timeout)
+
+    if output.upper() == "TABULATE":
+        headers=["BROKER", "TYPE", "LEADERS", "REPLICAS", "UNDER-REPLICATED", "OFFLINE", "LEADER-SKEW", "REPLICA-SKEW"]
+        rows = [[
+            r["name"], r["type"].capitalize(), r["leaders"], r["replicas"], r["under_replicated"], r["offline"],
+            f"{r['leader_skew']:+}%", f"{r['replica_skew']:+}%"
+        ] for r in results]
+        click.echo(tabulate(rows, headers=headers, tablefmt="plain", numalign="left"))
+
+    if output.upper() == "JSON":
+        click.echo(json.dumps(results))
+
+@describe.command("broker-configs")
+@click.option("brokers", "--broker", "-B", multiple=True, metavar="BROKER", shell_complete=complete_brokers, type=int, help="The id of the Kafka Broker. This option can be used multiple times to specify multiple brokers.")
+@click.option("--drift", "-d", is_flag=True, help="Only show the configs whose value differs between brokers.")
+@click.option("ignore", "--ignore", "-i", multiple=True, metavar="CONFIG", help="A config to leave out of the drift report, in addition to the per-broker identity configs. This option can be used multiple times.")
+@click.option("--timeout", "-T", default=10, metavar="SECONDS", type=int, help="The timeout in seconds.")
+@click.option("--output", "-o", type=click.Choice(["TABULATE", "JSON"], case_sensitive=False), default="TABULATE", metavar="FORMAT", help="The output format.")
+@click.pass_obj
+def describe_broker_configs(ctx, brokers, drift, ignore, timeout, output):
+    """Describe Kafka Broker configurations."""
+    cluster = Cluster(ctx.get("admin_client"))
+    results = cluster.describe_configs(list(brokers), drift=drift, ignore=IDENTITY_CONFIGS + ignore, timeout=timeout)
+
+    if output.upper() == "TABULATE":
+        headers=["NAME", "BROKER", "VALUE", "SOURCE"]
+        rows = []
+        for name, values in sorted(results["configs"].items()):
+            for broker_id, config in sorted(values.items()):
+                value = config["value"] if config["value"] != "" and config["value"] != None else "-"
+                rows.append([name, broker_id, value, config["source"]])
+        click.echo(tabulate(rows, headers=headers, tablefmt="plain", numalign="left"))
+        for broker_id, error in sorted(results["errors"].items()):
+            click.echo(f"Cannot describe the configs of broker {broker_id}: {error}", err=True)
+
+    if output.upper() == "JSON":
+        click.echo(json.dumps(results))
+
 @describe.command("cluster")
 @click.option("--timeout", "-T", default=10, metavar="SECONDS", type=int, help="The timeout in seconds.")
 @click.option("--output", "-o", type=click.Choice(["TABULATE", "JSON"], case_sensitive=False), default="TABULATE", metavar="FORMAT", help="The output format.")
@@ -36,7 +85,7 @@ def describe_cluster(ctx, timeout, output):
         click.echo(json.dumps(results))
 
 @describe.command("groups")
-@click.option("groups", "--group", "-g", multiple=True, metavar="GROUP", help="The name of the Kafka Consumer Group. This option can be used multiple times to specify multiple groups.")
+@click.option("groups", "--group", "-g", multiple=True, metavar="GROUP", shell_complete=complete_groups, help="The name of the Kafka Consumer Group. This option can be used multiple times to specify multiple groups.")
 @click.option("--timeout", "-T", default=10, metavar="SECONDS", type=int, help="The timeout in seconds.")
 @click.option("--output", "-o", type=click.Choice(["TABULATE", "JSON"], case_sensitive=False), default="TABULATE", metavar="FORMAT", help="The output format.")
 @click.pass_obj
@@ -63,12 +112,22 @@ def describe_consumer_groups(ctx, groups, timeout, output):
         click.echo(json.dumps(results))
 
 @describe.command("topics")
-@click.option("topics", "--topic", "-t", multiple=True, metavar="TOPIC", help="The name of the Kafka Topic. This option can be used multiple times to specify multiple topics.")
+@click.option("topics", "--topic", "-t", multiple=True, metavar="TOPIC", shell_complete=complete_topics, help="The name of the Kafka Topic. This option can be used multiple times to specify multiple topics.")
+@click.option("--watch", "-w", is_flag=True, help="Watch the topics and print every leader, replica, in-sync replica and partition count change as a JSON line.")
+@click.option("--interval", "-i", default=5, metavar="DURATION", type=DURATION, help="The time between metadata refreshes when watching.")
 @click.option("--timeout", "-T", default=10, metavar="SECONDS", type=int, help="The timeout in seconds.")
 @click.option("--output", "-o", type=click.Choice(["TABULATE", "JSON"], case_sensitive=False), default="TABULATE", metavar="FORMAT", help="The output format.")
 @click.pass_obj
-def describe_topics(ctx, topics, timeout, output):
+def describe_topics(ctx, topics, watch, interval, timeout, output):
     """Describe Kafka topics."""
+    if watch:
+        try:
+            for event in TopicWatch(ctx.get("admin_client")).watch(topics=list(topics), interval=interval, timeout=timeout):
+                click.echo(json.dumps(event))
+        except KeyboardInterrupt:
+            pass
+        return
+
     topic = Topic(ctx.get("admin_client"))
     topics = topic.describe(topics, timeout=timeout)
 
@@ -1,4 +1,5 @@
 from kafka import (Cluster, Topic,ConsumerGroup, Acl, Consumer, Producer)
+from .completion import complete_groups
 
 import click
 import json
@@ -10,7 +11,7 @@ def exec(ctx):
     pass
 
 @exec.command("group")
-@click.argument("group")
+@click.argument("group", shell_complete=complete_groups)
 @click.pass_obj
 def execute_consumer_group_offsets(ctx, group):
     """Execute on Kafka Consumer Groups Offsets."""
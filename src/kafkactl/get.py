@@ -1,5 +1,7 @@
 from tabulate import tabulate
-from kafka import (Acl, Cluster, ConsumerGroup, Consumer, Producer, Topic)
+from kafka import (Acl, Cluster, ConsumerGroup, Consumer, Producer, Topic, TopicWatch)
+from .params import DURATION, TIMESTAMP
+from .completion import complete_topics
 
 import click
 import json
@@ -69,26 +71,132 @@ def get_consumer_groups(ctx, states, topics, timeout, output):
     if output.upper() == "JSON":
         click.echo(json.dumps(results))
 
+@get.command("lag")
+@click.option("--top", "-n", default=10, metavar="N", type=int, help="The number of entries to show.")
+@click.option("--by", type=click.Choice(["GROUP", "PARTITION"], case_sensitive=False), default="GROUP", metavar="KIND", help="Whether to rank whole groups or single group partitions.")
+@click.option("--batch-size", "-B", default=100, metavar="GROUPS", type=int, help="The maximum number of groups per batch of requests.")
+@click.option("--timeout", "-T", default=10, metavar="SECONDS", type=int, help="The timeout in seconds.")
+@click.option("--output", "-o", type=click.Choice(["TABULATE", "JSON"], case_sensitive=False), default="TABULATE", metavar="FORMAT", help="The output format.")
+@click.pass_obj
+def get_lag(ctx, top, by, batch_size, timeout, output):
+    """Get the Kafka Consumer Groups with the highest lag."""
+    group = ConsumerGroup(ctx.get("admin_client"))
+    results = group.get_lag(top=top, by=by.lower(), batch_size=batch_size, timeout=timeout)
+
+    if output.upper() == "TABULATE":
+        if by.upper() == "GROUP":
+            headers=["GROUP", "PARTITIONS", "LAG"]
+            rows = [[r["group"], r["partitions"], r["lag"]] for r in results]
+        else:
+            headers=["GROUP", "TOPIC", "PARTITION", "CURRENT-OFFSET", "LOG-END-OFFSET", "LAG"]
+            rows = [[
+                r["group"], r["topic"], r["partition"], r["current_offset"], r["log_end_offset"], r["lag"]
+            ] for r in results]
+        click.echo(tabulate(rows, headers=headers, tablefmt="plain", numalign="left"))
+
+    if output.upper() == "JSON":
+        click.echo(json.dumps(results))
+
 @get.command("topics")
 @click.option("--show-internal/--hide-internal", "-s/-h", default=True, is_flag=True, help="Whether to show internal topics.")
+@click.option("--under-replicated", is_flag=True, help="Only get partitions with fewer in-sync replicas than replicas.")
+@click.option("--offline", is_flag=True, help="Only get partitions without a leader.")
+@click.option("--under-min-isr", is_flag=True, help="Only get partitions with fewer in-sync replicas than min.insync.replicas.")
+@click.option("--watch", "-w", is_flag=True, help="Watch the topics and print every metadata change as a JSON line.")
+@click.option("--interval", "-i", default=5, metavar="DURATION", type=DURATION, help="The time between metadata refreshes when watching.")
 @click.option("--timeout", "-T", default=10, metavar="SECONDS", type=int, help="The timeout in seconds.")
 @click.option("--output", "-o", type=click.Choice(["TABULATE", "JSON"], case_sensitive=False), default="TABULATE", metavar="FORMAT", help="The output format.")
 @click.pass_obj
-def get_topics(ctx, show_internal, timeout, output):
+def get_topics(ctx, show_internal, under_replicated, offline, under_min_isr, watch, interval, timeout, output):
     """Get Kafka topics."""
+    if watch:
+        if under_replicated or offline or under_min_isr:
+            raise click.UsageError("--watch cannot be combined with --under-replicated, --offline or --under-min-isr.")
+        try:
+            for event in TopicWatch(ctx.get("admin_client")).watch(show_internal=show_internal, interval=interval, timeout=timeout):
+                click.echo(json.dumps(event))
+        except KeyboardInterrupt:
+            pass
+        return
+
     topic = Topic(ctx.get("admin_client"))
-    results = topic.get(show_internal=show_internal, timeout=timeout)
-    
-    if output.upper() == "TABULATE":
+
+    if under_replicated or offline or under_min_isr:
+        results = topic.get_unhealthy_partitions(
+            under_replicated=under_replicated, offline=offline, under_min_isr=under_min_isr,
+            show_internal=show_internal, timeout=timeout
+        )
+        headers=["TOPIC", "PARTITION", "LEADER", "REPLICAS", "IN-SYNC-REPLICAS", "ISSUES"]
+        rows = [[
+            r["topic"], r["partition"], r["leader"],
+            ",".join([str(i) for i in r["replicas"]]),
+            ",".join([str(i) for i in r["isrs"]]),
+            ",".join(r["issues"]),
+        ] for r in results]
+    else:
+        results = topic.get(show_internal=show_internal, timeout=timeout)
         headers=["TOPIC", "PARTITION"]
         rows = [[r["name"], r["partitions"]] for r in results]
+
+    if output.upper() == "TABULATE":
         click.echo(tabulate(rows, headers=headers, tablefmt="plain", numalign="left"))
     
     if output.upper() == "JSON":
         click.echo(json.dumps(results))
 
+@get.command("topic-offsets")
+@click.option("topics", "--topic", "-t", multiple=True, metavar="TOPIC", shell_complete=complete_topics, help="The name of the Kafka Topic. This option can be used multiple times to specify multiple topics.")
+@click.option("--timestamp", "-s", default=None, metavar="TIMESTAMP", type=TIMESTAMP, help="Also get the offsets at this epoch milliseconds or ISO 8601 timestamp.")
+@click.option("--max-in-flight", "-m", default=4, metavar="REQUESTS", type=int, help="The maximum number of concurrent requests.")
+@click.option("--timeout", "-T", default=10, metavar="SECONDS", type=int, help="The timeout in seconds.")
+@click.option("--output", "-o", type=click.Choice(["TABULATE", "JSON"], case_sensitive=False), default="TABULATE", metavar="FORMAT", help="The output format.")
+@click.pass_obj
+def get_topic_offsets(ctx, topics, timestamp, max_in_flight, timeout, output):
+    """Get Kafka Topic offsets."""
+    topic = Topic(ctx.get("admin_client"))
+    results = topic.get_offsets(topics, timestamp=timestamp, max_in_flight=max_in_flight, timeout=timeout)
+
+    if output.upper() == "TABULATE":
+        headers=["TOPIC", "PARTITION", "LEADER", "EARLIEST", "LATEST", "MESSAGES"]
+        if timestamp is not None:
+            headers.insert(5, "AT-TIMESTAMP")
+        rows = []
+        for topic_name, metadata in results.items():
+            for p in metadata["partitions"]:
+                row = [topic_name, p["partition"], p["leader"], p["earliest"], p["latest"], p["messages"]]
+                if timestamp is not None:
+                    row.insert(5, p["timestamp"])
+                rows.append(row)
+            rows.append([topic_name, "*"] + [""] * (len(headers) - 3) + [metadata["messages"]])
+        click.echo(tabulate(rows, headers=headers, tablefmt="plain", numalign="left"))
+
+    if output.upper() == "JSON":
+        click.echo(json.dumps(results))
+
+@get.command("topic-rates")
+@click.option("topics", "--topic", "-t", multiple=True, metavar="TOPIC", shell_complete=complete_topics, help="The name of the Kafka Topic. This option can be used multiple times to specify multiple topics.")
+@click.option("--window", "-w", default="30s", metavar="DURATION", type=DURATION, help="The time between the two high watermark samples.")
+@click.option("--top", "-n", default=10, metavar="N", type=int, help="The number of topics and partitions to show.")
+@click.option("--timeout", "-T", default=10, metavar="SECONDS", type=int, help="The timeout in seconds.")
+@click.option("--output", "-o", type=click.Choice(["TABULATE", "JSON"], case_sensitive=False), default="TABULATE", metavar="FORMAT", help="The output format.")
+@click.pass_obj
+def get_topic_rates(ctx, topics, window, top, timeout, output):
+    """Get the ingress rate of Kafka Topics in messages per second."""
+    topic = Topic(ctx.get("admin_client"))
+    results = topic.get_rates(topics, window=window, top=top, timeout=timeout)
+
+    if output.upper() == "TABULATE":
+        rows = [[r["topic"], r["rate"]] for r in results["topics"]]
+        click.echo(tabulate(rows, headers=["TOPIC", "MSG/S"], tablefmt="plain", numalign="left"))
+        click.echo()
+        rows = [[r["topic"], r["partition"], r["rate"]] for r in results["partitions"]]
+        click.echo(tabulate(rows, headers=["TOPIC", "PARTITION", "MSG/S"], tablefmt="plain", numalign="left"))
+
+    if output.upper() == "JSON":
+        click.echo(json.dumps(results))
+
 @get.command("topic-configs")
-@click.option("topics", "--topic", "-t", multiple=True, metavar="TOPIC", help="The name of the Kafka Consumer Topic. This option can be used multiple times to specify multiple topics.")
+@click.option("topics", "--topic", "-t", multiple=True, metavar="TOPIC", shell_complete=complete_topics, help="The name of the Kafka Consumer Topic. This option can be used multiple times to specify multiple topics.")
 @click.option("--show-cluster-defaults/--hide-cluster-defaults", "-s/-h", default=False, is_flag=True, help="Whether to additionally show cluster default configuration.")
 @click.option("--timeout", "-T", default=10, metavar="SECONDS", type=int, help="The timeout in seconds.")
 @click.option("--output", "-o", type=click.Choice(["TABULATE", "JSON"], case_sensitive=False), default="TABULATE", metavar="FORMAT", help="The output format.")
@@ -0,0 +1,51 @@
+from tabulate import tabulate
+from kafka import Consumer
+from kafka.consumer import compile_matcher
+from .params import TIMESTAMP, decoder_options
+from .completion import complete_topics
+
+import click
+import json
+
+@click.command("grep")
+@click.argument("topic", shell_complete=complete_topics)
+@click.argument("pattern", required=False)
+@click.option("--key", "-k", "key_pattern", default=None, metavar="PATTERN", help="The pattern for the message key.")
+@click.option("header_options", "--header", "-H", multiple=True, metavar="NAME=PATTERN", help="The pattern for a message header. This option can be used multiple times to specify multiple headers.")
+@click.option("--fixed-strings", "-F", is_flag=True, help="Interpret the patterns as literal strings instead of regular expressions.")
+@click.option("partitions", "--partition", "-p", multiple=True, type=int, metavar="PARTITION", help="The partition to search. This option can be used multiple times to specify multiple partitions.")
+@click.option("--from", "start", default=None, metavar="TIMESTAMP", type=TIMESTAMP, help="Only search messages at or after this epoch milliseconds or ISO 8601 timestamp.")
+@click.option("--to", "end", default=None, metavar="TIMESTAMP", type=TIMESTAMP, help="Only search messages before this epoch milliseconds or ISO 8601 timestamp.")
+@click.option("--max-matches", "-m", default=None, metavar="N", type=int, help="Stop after this many matches.")
+@click.option("--workers", "-w", default=4, metavar="N", type=int, help="The number of partitions searched in parallel.")
+@decoder_options
+@click.option("--timeout", "-T", default=10, metavar="SECONDS", type=int, help="The timeout in seconds.")
+@click.option("--output", "-o", type=click.Choice(["TABULATE", "JSON"], case_sensitive=False), default="TABULATE", metavar="FORMAT", help="The output format.")
+@click.pass_obj
+def grep(ctx, topic, pattern, key_pattern, header_options, fixed_strings, partitions, start, end, max_matches, workers, decoder, timeout, output):
+    """Search the messages of a Kafka Topic.
+
+    PATTERN is matched against the message value, or against its JSON encoding when a schema is given.
+    """
+    header_patterns = {}
+    for header in header_options:
+        name, sep, header_pattern = header.partition("=")
+        if not sep:
+            raise click.BadParameter(f"{header!r} is not in NAME=PATTERN format.", param_hint="--header")
+        header_patterns[name] = header_pattern
+
+    matcher = compile_matcher(key=key_pattern, value=pattern, headers=header_patterns, fixed_strings=fixed_strings)
+
+    c = Consumer(ctx.get("admin_client"), ctx.get("bootstrap_servers"))
+    results = list(c.grep(
+        topic, matcher, partitions=list(partitions), start=start, end=end,
+        max_matches=max_matches, workers=workers, decoder=decoder, timeout=timeout
+    ))
+
+    if output.upper() == "TABULATE":
+        headers=["PARTITION", "OFFSET", "TIMESTAMP", "KEY", "VALUE"]
+        rows = [[r["partition"], r["offset"], r["timestamp"], r["key"] if r["key"] is not None else "-", r["value"] if isinstance(r["value"], str) else json.dumps(r["value"])] for r in results]
+        click.echo(tabulate(rows, headers=headers, tablefmt="plain", numalign="left"))
+
+    if output.upper() == "JSON":
+        click.echo(json.dumps(results))
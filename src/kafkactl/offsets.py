@@ -0,0 +1,56 @@
+from tabulate import tabulate
+from kafka import GroupOffsets
+from .completion import complete_groups
+
+import click
+import json
+
+@click.group("offsets")
+@click.pass_obj
+def offsets(ctx):
+    """Export and import Kafka Consumer Group offsets."""
+    pass
+
+@offsets.command("export")
+@click.argument("path", type=click.Path(dir_okay=False, writable=True))
+@click.option("groups", "--group", "-g", multiple=True, metavar="GROUP", shell_complete=complete_groups, help="The group to export. This option can be used multiple times. Defaults to every group.")
+@click.option("--pattern", "-p", default=None, metavar="REGEX", help="A regular expression the whole group name must match.")
+@click.option("--timestamps/--no-timestamps", default=True, help="Store the timestamps needed to import the offsets into another cluster.")
+@click.option("--batch-size", "-B", default=100, metavar="SIZE", type=int, help="The maximum number of concurrent requests.")
+@click.option("--timeout", "-T", default=10, metavar="SECONDS", type=int, help="The timeout in seconds.")
+@click.option("--output", "-o", type=click.Choice(["TABULATE", "JSON"], case_sensitive=False), default="TABULATE", metavar="FORMAT", help="The output format.")
+@click.pass_obj
+def export_offsets(ctx, path, groups, pattern, timestamps, batch_size, timeout, output):
+    """Export the committed offsets of Kafka Groups to a file."""
+    g = GroupOffsets(ctx.get("admin_client"), ctx.get("bootstrap_servers"))
+    results = g.export(path, groups=list(groups) or None, pattern=pattern, timestamps=timestamps, batch_size=batch_size, timeout=timeout)
+
+    if output.upper() == "TABULATE":
+        rows = [[results["groups"], results["partitions"]]]
+        click.echo(tabulate(rows, headers=["GROUPS", "PARTITIONS"], tablefmt="plain", numalign="left"))
+
+    if output.upper() == "JSON":
+        click.echo(json.dumps(results))
+
+@offsets.command("import")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option("groups", "--group", "-g", multiple=True, metavar="GROUP", help="The group to import. This option can be used multiple times. Defaults to every group in the file.")
+@click.option("--translate", is_flag=True, help="Look up the offsets by the exported timestamps, when importing into another cluster.")
+@click.option("--dry-run", is_flag=True, help="Only print the offsets that would be committed.")
+@click.option("--timeout", "-T", default=10, metavar="SECONDS", type=int, help="The timeout in seconds.")
+@click.option("--output", "-o", type=click.Choice(["TABULATE", "JSON"], case_sensitive=False), default="TABULATE", metavar="FORMAT", help="The output format.")
+@click.pass_obj
+def import_offsets(ctx, path, groups, translate, dry_run, timeout, output):
+    """Import the committed offsets of Kafka Groups from a file."""
+    g = GroupOffsets(ctx.get("admin_client"), ctx.get("bootstrap_servers"))
+    try:
+        results = g.restore(path, groups=list(groups) or None, translate=translate, dry_run=dry_run, timeout=timeout)
+    except ValueError as e:
+        raise click.UsageError(str(e))
+
+    if output.upper() == "TABULATE":
+        rows = [[r["group"], r["partitions"], r["skipped"], r["result"]] for r in results]
+        click.echo(tabulate(rows, headers=["GROUP", "PARTITIONS", "SKIPPED", "RESULT"], tablefmt="plain", numalign="left"))
+
+    if output.upper() == "JSON":
+        click.echo(json.dumps(results))
@@ -0,0 +1,67 @@
+from datetime import datetime
+from kafka.decoder import Decoder
+
+import click
+import functools
+import re
+
+class DurationParamType(click.ParamType):
+    """A click parameter type for durations like `30s`, `5m`, `2h` or `1d`, converted to seconds."""
+
+    name = "duration"
+    units = {"ms": 0.001, "s": 1, "m": 60, "h": 3600, "d": 86400}
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, (int, float)):
+            return float(value)
+
+        match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*(ms|s|m|h|d)?\s*", str(value))
+        if not match:
+            self.fail(f"{value!r} is not a valid duration, e.g. 30s, 5m, 2h or 1d.", param, ctx)
+
+        return float(match.group(1)) * self.units[match.group(2) or "s"]
+
+DURATION = DurationParamType()
+
+class TimestampParamType(click.ParamType):
+    """A click parameter type for an epoch timestamp in milliseconds or an ISO 8601 date and time,
+    converted to epoch milliseconds. A date and time without an offset is in local time."""
+
+    name = "timestamp"
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, int):
+            return value
+
+        if str(value).strip().isdigit():
+            return int(value)
+
+        try:
+            return int(datetime.fromisoformat(str(value).strip()).timestamp() * 1000)
+        except ValueError:
+            self.fail(f"{value!r} is not an epoch timestamp in milliseconds or an ISO 8601 date and time.", param, ctx)
+
+TIMESTAMP = TimestampParamType()
+
+def decoder_options(f):
+    """Add the value decoding options to a command, which are passed as a `decoder` argument."""
+    options = [
+        click.option("--value-schema", default=None, metavar="PATH", type=click.Path(exists=True, dir_okay=False), help="A local schema for the message values, an Avro .avsc, Protobuf .proto or .desc descriptor set, or a JSON Schema .json file."),
+        click.option("--schema-type", type=click.Choice(["AVRO", "PROTOBUF", "JSON"], case_sensitive=False), default=None, metavar="TYPE", help="The type of --value-schema, when it cannot be inferred from the file extension."),
+        click.option("--message-type", default=None, metavar="NAME", help="The full Protobuf message type name of --value-schema."),
+        click.option("--registry-cache", default=None, metavar="PATH", type=click.Path(exists=True, dir_okay=False), help="A schema registry cache file, e.g. the output of GET /schemas, to decode values by the schema id in their header."),
+    ]
+    for option in reversed(options):
+        f = option(f)
+
+    @functools.wraps(f)
+    def wrapper(*args, value_schema, schema_type, message_type, registry_cache, **kwargs):
+        decoder = None
+        if value_schema or registry_cache:
+            try:
+                decoder = Decoder(schema_type=schema_type, schema_file=value_schema, registry_cache=registry_cache, message_type=message_type)
+            except (ImportError, ValueError) as e:
+                raise click.ClickException(str(e))
+        return f(*args, decoder=decoder, **kwargs)
+
+    return wrapper
@@ -0,0 +1,75 @@
+from tabulate import tabulate
+from kafka import Perf
+from .params import DURATION
+from .completion import complete_topics
+
+import click
+import json
+
+HEADERS = ["ELAPSED", "MESSAGES", "MSG/S", "MB/S", "P50 MS", "P99 MS", "P999 MS", "MAX MS"]
+
+def echo_report(result, output):
+    """Echo an interval report as it arrives and a summary table for the final one."""
+    if output.upper() == "JSON":
+        click.echo(json.dumps(result))
+        return
+
+    row = [result["elapsed"], result["count"], result["rate"], result["mb_per_sec"]]
+    row += ["-" if result[k] is None else result[k] for k in ("p50", "p99", "p999", "max")]
+    if result["final"]:
+        click.echo(tabulate([row], headers=HEADERS, tablefmt="plain", numalign="left"))
+    else:
+        click.echo("  ".join(f"{h.lower()}={v}" for h, v in zip(HEADERS, row)), err=True)
+
+@click.group("perf")
+@click.pass_obj
+def perf(ctx):
+    """Generate load and measure the latency of a Kafka Cluster."""
+    pass
+
+@perf.command("produce")
+@click.argument("topic", shell_complete=complete_topics)
+@click.option("--messages", "-n", default=None, metavar="N", type=int, help="The number of messages to produce.")
+@click.option("--duration", "-d", default=None, metavar="DURATION", type=DURATION, help="How long to produce for, e.g. 30s or 5m. Defaults to 30s when --messages is not set.")
+@click.option("--record-size", "-s", default=100, metavar="BYTES", type=int, help="The message value size in bytes.")
+@click.option("--key-cardinality", "-k", default=0, metavar="N", type=int, help="The number of distinct message keys. 0 produces messages without keys.")
+@click.option("--rate", "-r", default=None, metavar="N", type=float, help="The target number of messages per second. Defaults to as fast as possible.")
+@click.option("producer_configs", "--producer-config", "-X", multiple=True, metavar="KEY=VALUE", help="A producer configuration, e.g. acks=all. This option can be used multiple times.")
+@click.option("--interval", "-i", default=5, metavar="DURATION", type=DURATION, help="The time between interval reports.")
+@click.option("--output", "-o", type=click.Choice(["TABULATE", "JSON"], case_sensitive=False), default="TABULATE", metavar="FORMAT", help="The output format.")
+@click.pass_obj
+def perf_produce(ctx, topic, messages, duration, record_size, key_cardinality, rate, producer_configs, interval, output):
+    """Produce synthetic messages and report the throughput and delivery latency."""
+    config = {}
+    for producer_config in producer_configs:
+        key, sep, value = producer_config.partition("=")
+        if not sep:
+            raise click.BadParameter(f"{producer_config!r} is not in KEY=VALUE format.", param_hint="--producer-config")
+        config[key] = value
+
+    if messages is None and duration is None:
+        duration = 30
+
+    p = Perf(ctx.get("admin_client"), ctx.get("bootstrap_servers"))
+    for result in p.produce(
+        topic, messages=messages, duration=duration, record_size=record_size,
+        key_cardinality=key_cardinality, rate=rate, interval=interval, producer_config=config
+    ):
+        echo_report(result, output)
+
+@perf.command("consume")
+@click.argument("topic", shell_complete=complete_topics)
+@click.option("--messages", "-n", default=None, metavar="N", type=int, help="The number of messages to consume.")
+@click.option("--duration", "-d", default=None, metavar="DURATION", type=DURATION, help="How long to consume for, e.g. 30s or 5m. Defaults to 30s when --messages is not set.")
+@click.option("--from-beginning", is_flag=True, help="Start from the earliest offsets instead of the latest.")
+@click.option("--interval", "-i", default=5, metavar="DURATION", type=DURATION, help="The time between interval reports.")
+@click.option("--output", "-o", type=click.Choice(["TABULATE", "JSON"], case_sensitive=False), default="TABULATE", metavar="FORMAT", help="The output format.")
+@click.pass_obj
+def perf_consume(ctx, topic, messages, duration, from_beginning, interval, output):
+    """Consume messages and report the throughput and end-to-end latency."""
+    if messages is None and duration is None:
+        duration = 30
+
+    p = Perf(ctx.get("admin_client"), ctx.get("bootstrap_servers"))
+    for result in p.consume(topic, messages=messages, duration=duration, from_beginning=from_beginning, interval=interval):
+        echo_report(result, output)
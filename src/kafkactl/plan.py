@@ -0,0 +1,39 @@
+from kafka import PartitionReassignment
+from .completion import complete_brokers, complete_topics
+
+import click
+import json
+import os
+
+@click.group("plan")
+@click.pass_obj
+def plan(ctx):
+    """Plan an operation on one or many resources."""
+    pass
+
+@plan.command("reassignment")
+@click.option("topics", "--topic", "-t", multiple=True, metavar="TOPIC", shell_complete=complete_topics, help="The name of the Kafka Topic. This option can be used multiple times to specify multiple topics.")
+@click.option("brokers", "--broker", "-B", multiple=True, metavar="BROKER", shell_complete=complete_brokers, type=int, help="The id of a Kafka Broker to balance across. This option can be used multiple times to specify multiple brokers.")
+@click.option("--leaders/--no-leaders", default=True, is_flag=True, help="Whether to also balance the preferred leaders.")
+@click.option("--batch-size", "-s", default=0, metavar="PARTITIONS", type=int, help="The maximum number of partitions per reassignment.")
+@click.option("--output-dir", "-d", default=None, metavar="PATH", type=click.Path(file_okay=False), help="Write each reassignment and the rollback to files in this directory.")
+@click.option("--timeout", "-T", default=10, metavar="SECONDS", type=int, help="The timeout in seconds.")
+@click.pass_obj
+def plan_reassignment(ctx, topics, brokers, leaders, batch_size, output_dir, timeout):
+    """Plan a balanced Kafka Partition reassignment."""
+    r = PartitionReassignment(ctx.get("admin_client"))
+    try:
+        results = r.plan(list(topics), brokers=list(brokers), leaders=leaders, batch_size=batch_size, timeout=timeout)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+        with open(os.path.join(output_dir, "rollback.json"), "w") as f:
+            json.dump(results["current"], f)
+        for i, reassignment in enumerate(results["reassignments"]):
+            with open(os.path.join(output_dir, f"reassignment-{i}.json"), "w") as f:
+                json.dump(reassignment, f)
+    else:
+        for reassignment in results["reassignments"]:
+            click.echo(json.dumps(reassignment))
@@ -0,0 +1,39 @@
+from tabulate import tabulate
+from kafka import Probe
+from .params import DURATION
+from .completion import complete_topics
+
+import click
+import json
+
+@click.group("probe")
+@click.pass_obj
+def probe(ctx):
+    """Probe the latency of a Kafka Cluster."""
+    pass
+
+@probe.command("e2e")
+@click.option("--topic", "-t", required=True, metavar="TOPIC", shell_complete=complete_topics, help="The topic to probe.")
+@click.option("--count", "-n", default=10, metavar="N", type=int, help="The number of probes per partition.")
+@click.option("--interval", "-i", default=0.1, metavar="DURATION", type=DURATION, help="The time between probe rounds.")
+@click.option("--by", type=click.Choice(["PARTITION", "BROKER"], case_sensitive=False), default="BROKER", metavar="KEY", help="Report the latency per leader broker or per partition.")
+@click.option("--timeout", "-T", default=10, metavar="SECONDS", type=int, help="The timeout in seconds.")
+@click.option("--output", "-o", type=click.Choice(["TABULATE", "JSON"], case_sensitive=False), default="TABULATE", metavar="FORMAT", help="The output format.")
+@click.pass_obj
+def probe_e2e(ctx, topic, count, interval, by, timeout, output):
+    """Measure the produce to consume latency of every partition of a Kafka Topic."""
+    p = Probe(ctx.get("admin_client"), ctx.get("bootstrap_servers"))
+    results = p.e2e(topic, count=count, interval=interval, timeout=timeout)
+
+    if output.upper() == "TABULATE":
+        latency = ("p50", "p99", "max")
+        if by.upper() == "BROKER":
+            headers=["BROKER", "PARTITIONS", "SENT", "FAILED", "RECEIVED", "P50 MS", "P99 MS", "MAX MS"]
+            rows = [[r["broker"], r["partitions"], r["sent"], r["failed"], r["received"], *[r[k] if r[k] is not None else "-" for k in latency]] for r in results["brokers"]]
+        else:
+            headers=["PARTITION", "LEADER", "SENT", "FAILED", "RECEIVED", "P50 MS", "P99 MS", "MAX MS"]
+            rows = [[r["partition"], r["leader"], r["sent"], r["failed"], r["received"], *[r[k] if r[k] is not None else "-" for k in latency]] for r in results["partitions"]]
+        click.echo(tabulate(rows, headers=headers, tablefmt="plain", numalign="left"))
+
+    if output.upper() == "JSON":
+        click.echo(json.dumps(results))
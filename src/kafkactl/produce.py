@@ -1,5 +1,6 @@
 from tabulate import tabulate
 from kafka import (Cluster, Topic, ConsumerGroup, Acl, Consumer, Producer)
+from .completion import complete_topics
 
 import click
 import json
@@ -9,3 +10,40 @@ import json
 def produce(ctx):
     """Produce to a Kafka Topic."""
     pass
+
+@produce.command("topic")
+@click.argument("topic", shell_complete=complete_topics)
+@click.option("--replay", "replay_file", default=None, metavar="FILE", type=click.File("r"), help="Replay the JSON lines records of FILE, as written by 'consume topic', keeping their inter-arrival times.")
+@click.option("--speed", default=1.0, metavar="X", type=float, help="The replay speed factor, e.g. 10 for ten times faster. 0 replays as fast as possible.")
+@click.option("--max-rate", default=None, metavar="N", type=float, help="The maximum number of messages per second.")
+@click.option("--keep-partitions", is_flag=True, help="Produce every replayed message to its recorded partition.")
+@click.option("--keep-timestamps", is_flag=True, help="Keep the recorded timestamps instead of the send time.")
+@click.option("--output", "-o", type=click.Choice(["TABULATE", "JSON"], case_sensitive=False), default="TABULATE", metavar="FORMAT", help="The output format.")
+@click.pass_obj
+def produce_topic(ctx, topic, replay_file, speed, max_rate, keep_partitions, keep_timestamps, output):
+    """Produce messages to a Kafka Topic.
+
+    Without --replay, every line of standard input is produced as a message value.
+    """
+    if replay_file is not None:
+        records = (json.loads(line) for line in replay_file if line.strip())
+    else:
+        records = ({"value": line.rstrip("\n")} for line in click.get_text_stream("stdin"))
+        speed = 0
+
+    p = Producer(ctx.get("admin_client"), ctx.get("bootstrap_servers"), config={"linger.ms": 5})
+    results = p.replay(
+        topic, records, speed=speed, max_rate=max_rate,
+        keep_partitions=keep_partitions, keep_timestamps=keep_timestamps
+    )
+
+    if output.upper() == "TABULATE":
+        headers=["MESSAGES", "ELAPSED", "TARGET RATE", "RATE", "DRIFT %", "MEAN LAG MS", "MAX LAG MS"]
+        rows = [[
+            results["messages"], results["elapsed"],
+            *["-" if results[k] is None else results[k] for k in ("target_rate", "rate", "drift", "mean_lag_ms", "max_lag_ms")],
+        ]]
+        click.echo(tabulate(rows, headers=headers, tablefmt="plain", numalign="left"))
+
+    if output.upper() == "JSON":
+        click.echo(json.dumps(results))
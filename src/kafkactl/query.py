@@ -0,0 +1,37 @@
+from tabulate import tabulate
+from kafka import Query, Snapshot
+
+import click
+import json
+
+@click.command("query")
+@click.argument("query")
+@click.option("--snapshot", "-s", "snapshot_path", default=None, metavar="PATH", type=click.Path(exists=True, dir_okay=False), help="Query a snapshot saved with 'snapshot save' instead of the cluster.")
+@click.option("--timeout", "-T", default=10, metavar="SECONDS", type=int, help="The timeout in seconds.")
+@click.option("--output", "-o", type=click.Choice(["TABULATE", "JSON"], case_sensitive=False), default="TABULATE", metavar="FORMAT", help="The output format.")
+@click.pass_obj
+def query(ctx, query, snapshot_path, timeout, output):
+    """Query Kafka Topics, Partitions and Consumer Groups.
+
+    QUERY has the form 'TABLE [where EXPR] [select COLUMN,...] [sort [-]COLUMN,...] [limit N]' where
+    TABLE is one of topics, partitions or groups. For example:
+
+        topics where replication_factor < 3 and cleanup.policy = delete and partitions > 100 sort -partitions
+    """
+    if snapshot_path:
+        q = Query(snapshot=Snapshot.load(snapshot_path))
+    else:
+        q = Query(admin_client=ctx.get("admin_client"))
+
+    try:
+        columns, rows = q.execute(query, timeout=timeout)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="QUERY")
+
+    if output.upper() == "TABULATE":
+        headers = [c.upper() for c in columns]
+        rows = [[",".join(str(i) for i in v) if isinstance(v, list) else ("-" if v is None else v) for v in r] for r in rows]
+        click.echo(tabulate(rows, headers=headers, tablefmt="plain", numalign="left"))
+
+    if output.upper() == "JSON":
+        click.echo(json.dumps([dict(zip(columns, r)) for r in rows]))
@@ -0,0 +1,38 @@
+from tabulate import tabulate
+from kafka import Backup
+from .params import TIMESTAMP
+
+import click
+import json
+
+@click.group("restore")
+@click.pass_obj
+def restore(ctx):
+    """Restore Kafka resources from backup files."""
+    pass
+
+@restore.command("topic")
+@click.argument("path", type=click.Path(exists=True, file_okay=False))
+@click.option("--topic", "-t", default=None, metavar="TOPIC", help="The target topic name. Defaults to the backed up topic name.")
+@click.option("partitions", "--partition", "-p", multiple=True, type=int, metavar="PARTITION", help="The partition to restore. This option can be used multiple times to specify multiple partitions.")
+@click.option("--from", "start", default=None, metavar="TIMESTAMP", type=TIMESTAMP, help="Only restore messages at or after this epoch milliseconds or ISO 8601 timestamp.")
+@click.option("--to", "end", default=None, metavar="TIMESTAMP", type=TIMESTAMP, help="Only restore messages before this epoch milliseconds or ISO 8601 timestamp.")
+@click.option("--repartition", is_flag=True, help="Let the partitioner pick the partition from the key instead of keeping the original partition.")
+@click.option("--timeout", "-T", default=10, metavar="SECONDS", type=int, help="The timeout in seconds.")
+@click.option("--output", "-o", type=click.Choice(["TABULATE", "JSON"], case_sensitive=False), default="TABULATE", metavar="FORMAT", help="The output format.")
+@click.pass_obj
+def restore_topic(ctx, path, topic, partitions, start, end, repartition, timeout, output):
+    """Restore the messages of a Kafka Topic from the backup in PATH."""
+    b = Backup(ctx.get("admin_client"), ctx.get("bootstrap_servers"))
+    results = b.restore(
+        path, topic=topic, partitions=list(partitions), start=start, end=end,
+        keep_partitions=not repartition, timeout=timeout
+    )
+
+    if output.upper() == "TABULATE":
+        headers=["SEGMENTS", "MESSAGES"]
+        rows = [[results["segments"], results["messages"]]]
+        click.echo(tabulate(rows, headers=headers, tablefmt="plain", numalign="left"))
+
+    if output.upper() == "JSON":
+        click.echo(json.dumps(results))
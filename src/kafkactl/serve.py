@@ -0,0 +1,150 @@
+from confluent_kafka import KafkaException
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+from kafka import Cluster, ConsumerGroup, Topic
+from kafka.cache import CachedAdminClient, TTLCache
+
+import click
+import json
+import re
+
+class NotFound(Exception):
+    """A requested resource does not exist."""
+
+class Api():
+    """The HTTP/JSON API routes over the Topic, ConsumerGroup and Cluster operations.
+
+    Every route result is kept in a coalescing TTL cache, so identical concurrent requests share
+    one broker call and frequently read routes are refreshed in the background.
+    """
+
+    def __init__(self, admin_client, bootstrap_servers, metadata_ttl=10, config_ttl=60, timeout=10):
+        self.admin_client = CachedAdminClient(admin_client, ttl=metadata_ttl)
+        self.bootstrap_servers = bootstrap_servers
+        self.cache = TTLCache(ttl=metadata_ttl)
+        self.config_ttl = config_ttl
+        self.timeout = timeout
+
+        topic = Topic(self.admin_client)
+        group = ConsumerGroup(self.admin_client)
+        cluster = Cluster(self.admin_client)
+
+        # (pattern, handler, uses config ttl, query parameters)
+        self.routes = [
+            (r"/cluster", lambda q: cluster.get(timeout=timeout), False, ()),
+            (r"/cluster/describe", lambda q: cluster.describe(timeout=timeout), False, ()),
+            (r"/brokers", lambda q: cluster.describe_brokers(timeout=timeout), False, ()),
+            (r"/brokers/configs", lambda q: cluster.describe_configs(drift=self.flag(q, "drift"), timeout=timeout), True, ("drift",)),
+            (r"/topics", lambda q: topic.get(show_internal=self.flag(q, "internal"), timeout=timeout), False, ("internal",)),
+            (r"/topics/(?P<name>[^/]+)", lambda q, name: self.found(topic.describe([name], timeout=timeout), name), False, ()),
+            (r"/topics/(?P<name>[^/]+)/configs", lambda q, name: topic.get_configs([name], timeout=timeout)[name], True, ()),
+            (r"/topics/(?P<name>[^/]+)/offsets", lambda q, name: self.found(topic.get_offsets([name], timeout=timeout), name), False, ()),
+            (r"/groups", lambda q: group.get(states=q.get("state", ["STABLE", "EMPTY"]), timeout=timeout), False, ("state",)),
+            (r"/groups/(?P<name>[^/]+)", lambda q, name: self.found(group.describe([name], bootstrap_servers=bootstrap_servers, timeout=timeout), name), False, ()),
+            (r"/lag", lambda q: group.get_lag(top=int(self.param(q, "top", 10)), by=self.param(q, "by", "group"), timeout=timeout), False, ("top", "by")),
+        ]
+        self.routes = [(re.compile(pattern), handler, config, params) for pattern, handler, config, params in self.routes]
+
+    @staticmethod
+    def param(query, name, default=None):
+        return query.get(name, [default])[-1]
+
+    @staticmethod
+    def flag(query, name):
+        return Api.param(query, name, "false").lower() in ("1", "true", "yes")
+
+    @staticmethod
+    def found(results, name):
+        if name not in results:
+            raise NotFound(f"'{name}' does not exist.")
+        return results[name]
+
+    def handle(self, method, url):
+        """Handle a request and return the status code and the JSON serializable body."""
+        parts = urlsplit(url)
+        path = parts.path.rstrip("/") or "/"
+        query = parse_qs(parts.query)
+
+        if method == "POST" and path == "/cache/invalidate":
+            self.cache.invalidate()
+            self.admin_client.invalidate()
+            return 200, {"invalidated": True}
+
+        if method != "GET":
+            return 405, {"error": f"The method {method} is not allowed."}
+
+        for pattern, handler, config, params in self.routes:
+            match = pattern.fullmatch(path)
+            if not match:
+                continue
+
+            # Only the parameters the route uses are part of the key, so unknown ones cannot grow the cache.
+            query = {name: query[name] for name in params if name in query}
+            key = (path, tuple((name, tuple(values)) for name, values in sorted(query.items())))
+            # The path is matched before unquoting, so an encoded "/" stays within its name.
+            names = {name: unquote(value) for name, value in match.groupdict().items()}
+            try:
+                result = self.cache.get(key, lambda: handler(query, **names), ttl=self.config_ttl if config else None)
+            except NotFound as e:
+                return 404, {"error": str(e)}
+            except (KeyError, ValueError) as e:
+                return 400, {"error": str(e)}
+            except KafkaException as e:
+                return 502, {"error": str(e)}
+            except Exception as e:
+                return 500, {"error": str(e)}
+            return 200, result
+
+        return 404, {"error": f"The path {path} does not exist."}
+
+def make_handler(api):
+    """Create the request handler class for an API."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def respond(self):
+            status, body = api.handle(self.command, self.path)
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        do_GET = respond
+        do_POST = respond
+
+        def log_message(self, format, *args):
+            click.echo(f"{self.address_string()} - {format % args}", err=True)
+
+    return Handler
+
+@click.command("serve")
+@click.option("--host", default="127.0.0.1", metavar="HOST", help="The address to listen on.")
+@click.option("--port", "-p", default=8080, metavar="PORT", type=int, help="The port to listen on.")
+@click.option("--metadata-ttl", default=10, metavar="SECONDS", type=float, help="How long metadata results are cached.")
+@click.option("--config-ttl", default=60, metavar="SECONDS", type=float, help="How long config results are cached.")
+@click.option("--timeout", "-T", default=10, metavar="SECONDS", type=int, help="The timeout in seconds.")
+@click.pass_obj
+def serve(ctx, host, port, metadata_ttl, config_ttl, timeout):
+    """Serve the Kafka Cluster state over a local HTTP/JSON API.
+
+    \b
+    GET  /cluster, /cluster/describe
+    GET  /brokers, /brokers/configs?drift=true
+    GET  /topics?internal=true, /topics/NAME, /topics/NAME/configs, /topics/NAME/offsets
+    GET  /groups?state=STABLE, /groups/NAME
+    GET  /lag?top=10&by=partition
+    POST /cache/invalidate
+    """
+    api = Api(ctx.get("admin_client"), ctx.get("bootstrap_servers"), metadata_ttl=metadata_ttl, config_ttl=config_ttl, timeout=timeout)
+    server = ThreadingHTTPServer((host, port), make_handler(api))
+    server.daemon_threads = True
+    click.echo(f"Serving on http://{host}:{port}", err=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
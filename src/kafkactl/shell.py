@@ -0,0 +1,108 @@
+from confluent_kafka import KafkaException
+from confluent_kafka.admin import AdminClient
+from kafka.cache import CachedAdminClient
+
+import click
+import os
+import shlex
+import time
+
+try:
+    import readline
+except ImportError:
+    readline = None
+
+HISTORY_FILE = os.path.expanduser("~/.kafkactl_history")
+
+def run_line(ctx, line):
+    """Run one shell line as a kafkactl command in the shell context, so the clients are reused."""
+    args = shlex.split(line)
+    root = ctx.find_root().command
+    name, command, rest = root.resolve_command(ctx, args)
+    if name == "shell":
+        raise click.UsageError("The shell is already running.")
+
+    with command.make_context(name, rest, parent=ctx) as sub_ctx:
+        command.invoke(sub_ctx)
+
+def use_context(ctx, name, ttl):
+    """Switch the shell to another kafkaconfig context."""
+    contexts = ctx.obj.get("contexts", {})
+    if name not in contexts:
+        raise click.BadParameter(f"The context {name!r} does not exist in the kafkaconfig.")
+
+    bootstrap_servers = ",".join(contexts[name].get("brokers", []))
+    # The context is switched together with the client so later commands see the same cluster.
+    ctx.obj["bootstrap_servers"] = bootstrap_servers
+    ctx.obj["admin_client"] = CachedAdminClient(AdminClient({"bootstrap.servers": bootstrap_servers}), ttl=ttl)
+    ctx.obj["current_context"] = name
+    return name
+
+@click.command("shell")
+@click.option("--metadata-ttl", default=5, metavar="SECONDS", type=float, help="How long the metadata of one command is reused by the next.")
+@click.option("--timing", is_flag=True, help="Print the duration of every command.")
+@click.pass_context
+def shell(ctx, metadata_ttl, timing):
+    """Run kafkactl commands in an interactive shell.
+
+    The commands are typed without the 'kafkactl' prefix and share one admin client and its
+    metadata cache. Use 'use CONTEXT' to switch the kafkaconfig context, 'refresh' to clear the
+    metadata cache and 'exit' to leave.
+    """
+    ctx.obj["admin_client"] = CachedAdminClient(ctx.obj["admin_client"], ttl=metadata_ttl)
+    current = ctx.obj.get("current_context") or ctx.obj.get("bootstrap_servers")
+
+    if readline is not None:
+        try:
+            readline.read_history_file(HISTORY_FILE)
+        except OSError:
+            pass
+
+    try:
+        while True:
+            try:
+                line = input(f"kafkactl ({current})> ").strip()
+            except EOFError:
+                click.echo()
+                break
+            except KeyboardInterrupt:
+                click.echo()
+                continue
+
+            if not line:
+                continue
+            if line in ("exit", "quit"):
+                break
+
+            start = time.perf_counter()
+            try:
+                if line == "refresh":
+                    ctx.obj["admin_client"].invalidate()
+                elif line.startswith("use "):
+                    current = use_context(ctx, line[4:].strip(), metadata_ttl)
+                elif line == "help":
+                    click.echo(ctx.find_root().get_help())
+                else:
+                    run_line(ctx, line)
+            except click.exceptions.Exit:
+                pass
+            except click.ClickException as e:
+                e.show()
+            except click.Abort:
+                click.echo("Aborted!", err=True)
+            except KafkaException as e:
+                click.echo(e)
+            except KeyboardInterrupt:
+                click.echo()
+            except Exception as e:
+                # Any other failure ends the command, not the shell.
+                click.echo(f"Error: {e}", err=True)
+
+            if timing:
+                click.echo(f"({(time.perf_counter() - start) * 1000:.1f} ms)", err=True)
+    finally:
+        if readline is not None:
+            try:
+                readline.write_history_file(HISTORY_FILE)
+            except OSError:
+                pass
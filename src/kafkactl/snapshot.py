@@ -0,0 +1,51 @@
+from tabulate import tabulate
+from kafka import Snapshot
+
+import click
+import json
+
+@click.group("snapshot")
+@click.pass_obj
+def snapshot(ctx):
+    """Save and compare Kafka Cluster state snapshots."""
+    pass
+
+@snapshot.command("save")
+@click.argument("path", type=click.Path(dir_okay=False, writable=True))
+@click.option("--timeout", "-T", default=10, metavar="SECONDS", type=int, help="The timeout in seconds.")
+@click.option("--output", "-o", type=click.Choice(["TABULATE", "JSON"], case_sensitive=False), default="TABULATE", metavar="FORMAT", help="The output format.")
+@click.pass_obj
+def save_snapshot(ctx, path, timeout, output):
+    """Save a Kafka Cluster state snapshot to a file."""
+    s = Snapshot(ctx.get("admin_client"))
+    results = s.save(path, timeout=timeout)
+
+    if output.upper() == "TABULATE":
+        headers=["TOPICS", "PARTITIONS", "CONFIGS", "GROUPS"]
+        rows = [[results["topics"], results["partitions"], results["configs"], results["groups"]]]
+        click.echo(tabulate(rows, headers=headers, tablefmt="plain", numalign="left"))
+
+    if output.upper() == "JSON":
+        click.echo(json.dumps(results))
+
+@snapshot.command("diff")
+@click.argument("old", type=click.Path(exists=True, dir_okay=False))
+@click.argument("new", type=click.Path(exists=True, dir_okay=False))
+@click.option("--output", "-o", type=click.Choice(["TABULATE", "JSON"], case_sensitive=False), default="TABULATE", metavar="FORMAT", help="The output format.")
+def diff_snapshots(old, new, output):
+    """Compare two Kafka Cluster state snapshots."""
+    results = Snapshot.diff(Snapshot.load(old), Snapshot.load(new))
+
+    if output.upper() == "TABULATE":
+        headers=["SECTION", "NAME", "CHANGE", "DETAILS"]
+        rows = []
+        for r in results:
+            for i, detail in enumerate(r["details"] or ["-"]):
+                if i == 0:
+                    rows.append([r["section"], r["name"], r["change"], detail])
+                else:
+                    rows.append(["", "", "", detail])
+        click.echo(tabulate(rows, headers=headers, tablefmt="plain"))
+
+    if output.upper() == "JSON":
+        click.echo(json.dumps(results))
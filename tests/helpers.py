@@ -0,0 +1,14 @@
+from unittest.mock import MagicMock
+
+
+def message(offset, key=None, value=None, headers=None, partition=0, topic="topic1"):
+    return MagicMock(**{
+        "error.return_value": None,
+        "topic.return_value": topic,
+        "partition.return_value": partition,
+        "offset.return_value": offset,
+        "timestamp.return_value": (1, 1000 + offset),
+        "key.return_value": key,
+        "value.return_value": value,
+        "headers.return_value": headers,
+    })
@@ -0,0 +1,68 @@
+import unittest
+from unittest.mock import MagicMock
+from kafka.acl import Acl
+
+
+class TestAcl(unittest.TestCase):
+
+    def setUp(self):
+        self.admin_client = MagicMock()
+        self.acl = Acl(admin_client=self.admin_client)
+        self.acls = [
+            {
+                "resource_type": "topic",
+                "resource_name": f"topic{i}",
+                "principal": "User:service1",
+                "operation": "read",
+                "permission_type": "allow",
+            }
+            for i in range(5)
+        ]
+
+        # topic0 already exists in the cluster
+        self.admin_client.describe_acls().result.return_value = [Acl.to_binding(self.acls[0])]
+        self.admin_client.reset_mock()
+
+        def futures(items, request_timeout):
+            return {item: MagicMock() for item in items}
+
+        self.admin_client.create_acls.side_effect = futures
+        self.admin_client.delete_acls.side_effect = futures
+
+    def test_create(self):
+        results = self.acl.create(self.acls + self.acls[:1], batch_size=2, timeout=1)
+
+        # the 4 missing bindings are sent in chunks of 2 and the existing binding is skipped
+        self.assertEqual(self.admin_client.create_acls.call_count, 2)
+        for c in self.admin_client.create_acls.call_args_list:
+            self.assertEqual(len(c.args[0]), 2)
+
+        self.assertEqual([r["result"] for r in results], ["unchanged"] + ["created"] * 4)
+        self.assertEqual(results[1]["resource_name"], "topic1")
+        self.assertEqual(results[1]["pattern_type"], "LITERAL")
+        self.assertEqual(results[1]["host"], "*")
+
+    def test_delete(self):
+        results = self.acl.delete(self.acls[:2], batch_size=2, timeout=1)
+
+        # only the existing binding is deleted
+        self.assertEqual(self.admin_client.delete_acls.call_count, 1)
+        self.assertEqual(len(self.admin_client.delete_acls.call_args.args[0]), 1)
+        self.assertEqual([r["result"] for r in results], ["deleted", "absent"])
+
+    def test_malformed(self):
+        missing = dict(self.acls[1])
+        del missing["principal"]
+        with self.assertRaisesRegex(ValueError, "ACL entry 1: missing 'principal'"):
+            self.acl.create([self.acls[0], missing], timeout=1)
+
+        with self.assertRaisesRegex(ValueError, "ACL entry 0: invalid 'operation' 'REED'"):
+            self.acl.delete([dict(self.acls[0], operation="reed")], timeout=1)
+
+        # nothing is sent when any entry is malformed
+        self.admin_client.describe_acls.assert_not_called()
+        self.admin_client.create_acls.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+from kafka.backup import Backup, read_records
+from kafka.consumer import Consumer
+from helpers import message
+
+
+class TestBackup(unittest.TestCase):
+
+    def setUp(self):
+        self.admin_client = MagicMock()
+        self.backup = Backup(admin_client=self.admin_client, bootstrap_servers="kafka:9092")
+        self.path = tempfile.mkdtemp()
+
+    @patch("kafka.backup.Consumer")
+    def test_backup(self, consumer):
+        consumer.return_value.get_ranges.return_value = {0: (0, 4)}
+        consumer.return_value.read_ranges.side_effect = Consumer(self.admin_client).read_ranges
+        consumer.return_value._consumer.return_value.consume.side_effect = [
+            [message(0, key=b"k", value=b"a" * 10, headers=[("h", b"v"), ("n", None)]), message(1, value=b"b" * 10)],
+            [message(2, value=None), message(3, value=b"d"), message(4, value=b"past the end")],
+        ]
+
+        index = self.backup.backup("topic1", self.path, segment_bytes=70, workers=1, timeout=1)
+
+        segments = index["partitions"]["0"]
+        self.assertEqual([(s["start_offset"], s["end_offset"]) for s in segments], [(0, 1), (2, 3)])
+        self.assertEqual(segments[1]["start_timestamp"], 1002)
+        self.assertEqual(Backup.load_index(self.path), index)
+
+        records = list(read_records(os.path.join(self.path, segments[0]["file"])))
+        self.assertEqual(records[0], (0, 1000, b"k", b"a" * 10, [("h", b"v"), ("n", None)]))
+        records = list(read_records(os.path.join(self.path, segments[1]["file"])))
+        self.assertEqual(records, [(2, 1002, None, None, None), (3, 1003, None, b"d", None)])
+
+        # Only the second segment overlaps the time range, so the first is never opened.
+        self.admin_client.list_topics.return_value.topics = {"topic1": MagicMock(partitions={0: None})}
+        with patch("kafka.backup.Producer") as producer, patch("kafka.backup.read_records", wraps=read_records) as reader:
+            results = self.backup.restore(self.path, start=1003, timeout=1)
+
+        self.assertEqual(results, {"segments": 1, "messages": 1})
+        reader.assert_called_once()
+        producer.return_value.produce.assert_called_once_with(
+            "topic1", value=b"d", key=None, partition=0, timestamp=1003, headers=None
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
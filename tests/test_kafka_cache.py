@@ -0,0 +1,124 @@
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+from kafka.cache import CachedAdminClient, TTLCache
+
+
+class TestCachedAdminClient(unittest.TestCase):
+
+    def setUp(self):
+        self.admin_client = MagicMock()
+        self.cached = CachedAdminClient(self.admin_client, ttl=5)
+
+    @patch("kafka.cache.time")
+    def test_list_topics(self, time):
+        time.monotonic.return_value = 100
+        self.assertIs(self.cached.list_topics(timeout=1), self.cached.list_topics(timeout=10))
+        self.cached.list_topics("topic1", timeout=1)
+        self.assertEqual(self.admin_client.list_topics.call_count, 2)
+
+        time.monotonic.return_value = 106
+        self.cached.list_topics(timeout=1)
+        self.assertEqual(self.admin_client.list_topics.call_count, 3)
+
+    def test_mutations_invalidate(self):
+        self.cached.list_topics()
+        self.cached.describe_configs(["topic1"])
+        self.cached.list_topics()
+        self.assertEqual(self.admin_client.list_topics.call_count, 1)
+
+        self.cached.create_topics(["topic2"])
+        self.admin_client.create_topics.assert_called_once_with(["topic2"])
+        self.cached.list_topics()
+        self.assertEqual(self.admin_client.list_topics.call_count, 2)
+
+        # operations that are not known reads, such as deleting groups or records, also invalidate
+        self.cached.delete_consumer_groups(["group1"])
+        self.cached.list_topics()
+        self.assertEqual(self.admin_client.list_topics.call_count, 3)
+
+
+class TestTTLCache(unittest.TestCase):
+
+    def test_coalescing(self):
+        cache = TTLCache(ttl=10)
+        calls = []
+        release = threading.Event()
+
+        def loader():
+            calls.append(1)
+            release.wait(1)
+            return "value"
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get("key", loader))) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ["value"] * 5)
+
+    def test_refresh_ahead_and_errors(self):
+        cache = TTLCache(ttl=0.1, refresh_ahead=0.5)
+        values = iter(range(10))
+        loader = lambda: next(values)
+
+        self.assertEqual(cache.get("key", loader), 0)
+        time.sleep(0.06)
+        # The stale value is returned while it is refreshed in the background.
+        self.assertEqual(cache.get("key", loader), 0)
+        time.sleep(0.02)
+        self.assertEqual(cache.get("key", loader), 1)
+
+        def fail():
+            raise ValueError("broker down")
+
+        with self.assertRaises(ValueError):
+            cache.get("other", fail)
+        cache.invalidate()
+        self.assertEqual(cache.get("key", loader), 2)
+
+    def test_eviction(self):
+        cache = TTLCache(ttl=0.01, idle=0.05, max_size=2)
+
+        cache.get("a", lambda: 1)
+        cache.get("b", lambda: 2)
+        cache.get("a", lambda: 1)
+        cache.get("c", lambda: 3)
+        # "b" is the least recently read entry.
+        self.assertEqual(list(cache.entries), ["a", "c"])
+
+        time.sleep(0.06)
+        cache.get("d", lambda: 4)
+        # The idle entries are dropped without being read again.
+        self.assertEqual(list(cache.entries), ["d"])
+
+    def test_invalidate_discards_loads_in_flight(self):
+        cache = TTLCache(ttl=10)
+        started = threading.Event()
+        release = threading.Event()
+
+        def stale():
+            started.set()
+            release.wait(1)
+            return "stale"
+
+        thread = threading.Thread(target=lambda: cache.get("key", stale))
+        thread.start()
+        started.wait(1)
+        cache.invalidate()
+        # A caller after the invalidation does not wait for the stale load.
+        self.assertEqual(cache.get("key", lambda: "fresh"), "fresh")
+        release.set()
+        thread.join()
+
+        self.assertEqual(cache.get("key", lambda: "reloaded"), "fresh")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+from unittest.mock import MagicMock
+from kafka.cluster import Cluster
+from confluent_kafka import KafkaError, KafkaException
+from confluent_kafka.admin import ConfigEntry, ConfigSource
+
+
+class TestCluster(unittest.TestCase):
+
+    def setUp(self):
+        self.admin_client = MagicMock()
+        self.cluster = Cluster(admin_client=self.admin_client)
+
+        def partition(leader, replicas, isrs):
+            return MagicMock(leader=leader, replicas=replicas, isrs=isrs)
+
+        metadata = self.admin_client.list_topics.return_value
+        metadata.controller_id = 0
+        metadata.brokers = {0: MagicMock(host="kafka-0", port=9092), 1: MagicMock(host="kafka-1", port=9092)}
+        metadata.topics = {
+            "topic1": MagicMock(partitions={
+                0: partition(0, [0, 1], [0, 1]),
+                1: partition(1, [1, 2], [1]),
+                2: partition(-1, [2], []),
+            }),
+        }
+
+    def test_describe_brokers(self):
+        results = {r["name"]: r for r in self.cluster.describe_brokers(timeout=1)}
+
+        self.admin_client.list_topics.assert_called_once_with(timeout=1)
+        self.assertEqual(results[0]["type"], "controller")
+        self.assertEqual(results[0]["endpoint"], "kafka-0:9092")
+        self.assertEqual(results[1]["leaders"], 1)
+        self.assertEqual(results[1]["replicas"], 2)
+        self.assertEqual(results[1]["under_replicated"], 1)
+        self.assertEqual(results[2]["type"], "offline")
+        self.assertEqual(results[2]["under_replicated"], 2)
+        self.assertEqual(results[2]["offline"], 1)
+        self.assertEqual(results[2]["leader_skew"], -100.0)
+        self.assertEqual(results[0]["replica_skew"], -40.0)
+
+    def test_describe_configs(self):
+        def config(name, value):
+            return ConfigEntry(name, value, source=ConfigSource.STATIC_BROKER_CONFIG)
+
+        def describe_configs(resources, request_timeout):
+            # librdkafka rejects more than one broker resource per request.
+            self.assertEqual(len(resources), 1)
+            configs = {
+                "0": [config("num.io.threads", "8"), config("log.retention.hours", "168"), config("broker.id", "0")],
+                "1": [config("num.io.threads", "16"), config("log.retention.hours", "168"), config("broker.id", "1")],
+                "2": [config("log.retention.hours", "168"), config("broker.id", "2")],
+            }
+            f = MagicMock()
+            if resources[0].name == "3":
+                f.result.side_effect = KafkaException(KafkaError(KafkaError._TIMED_OUT, "timed out"))
+            else:
+                f.result.return_value = {c.name: c for c in configs[resources[0].name]}
+            return {resources[0]: f}
+
+        self.admin_client.describe_configs.side_effect = describe_configs
+
+        results = self.cluster.describe_configs(brokers=[0, 1], drift=True, timeout=1)
+        self.assertEqual(list(results["configs"].keys()), ["num.io.threads"])
+        self.assertEqual(results["configs"]["num.io.threads"][1]["value"], "16")
+        self.assertEqual(results["errors"], {})
+        self.assertEqual(self.admin_client.describe_configs.call_count, 2)
+
+        results = self.cluster.describe_configs(brokers=[1, 2], drift=True, timeout=1)
+        self.assertEqual(list(results["configs"].keys()), ["num.io.threads"])
+
+        results = self.cluster.describe_configs(brokers=[0, 1], drift=True, ignore=(), timeout=1)
+        self.assertEqual(sorted(results["configs"].keys()), ["broker.id", "num.io.threads"])
+
+        results = self.cluster.describe_configs(brokers=[0, 1, 2], timeout=1)
+        self.assertEqual(len(results["configs"]["log.retention.hours"]), 3)
+
+        # A broker that fails is reported without aborting the others or counting as drift.
+        results = self.cluster.describe_configs(brokers=[0, 2, 3], drift=True, timeout=1)
+        self.assertEqual(list(results["configs"].keys()), ["num.io.threads"])
+        self.assertEqual(list(results["errors"].keys()), [3])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import os
+import tempfile
+import unittest
+from kafka.columnar import ColumnarWriter, to_columns
+from kafka.decoder import DecodedMessage
+from helpers import message
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+class TestColumnar(unittest.TestCase):
+
+    def test_to_columns(self):
+        messages = [
+            message(0, b"k", b'{"id": 1, "name": "a"}'),
+            message(1, None, b'{"id": 2, "tags": ["x"]}'),
+            message(2, None, b"not json"),
+        ]
+
+        columns = to_columns(messages)
+        self.assertEqual(list(columns), ["_partition", "_offset", "_timestamp", "_key", "id", "name", "tags", "value"])
+        self.assertEqual(columns["_key"], ["k", None, None])
+        self.assertEqual(columns["id"], [1, 2, None])
+        self.assertEqual(columns["value"], [None, None, "not json"])
+
+        decoded = DecodedMessage(message(3), ["not", "an", "object"])
+        self.assertEqual(to_columns([decoded, message(4, None, b"\xff")])["value"], ['["not", "an", "object"]', "\ufffd"])
+
+        columns = to_columns(messages, fields=["name"])
+        self.assertEqual(list(columns), ["_partition", "_offset", "_timestamp", "_key", "name"])
+
+    def read(self, writer):
+        import pyarrow.dataset as ds
+        return [ds.dataset(path, format="parquet" if writer.format == "parquet" else "arrow").to_table() for path in writer.paths]
+
+    @unittest.skipUnless(pyarrow, "pyarrow is not installed")
+    def test_writer(self):
+        import pyarrow.parquet as pq
+
+        directory = tempfile.mkdtemp()
+        for file_format in ("parquet", "arrow"):
+            path = os.path.join(directory, f"out.{file_format}")
+            with ColumnarWriter(path, format=file_format) as writer:
+                writer.write([message(0, b"k", b'{"id": 1, "note": "a"}'), message(1, None, b'{"id": 2}')])
+                writer.write([message(2, None, b'{"id": 3, "note": "x"}')])
+
+            if file_format == "parquet":
+                self.assertEqual(pq.ParquetFile(path).num_row_groups, 2)
+
+            self.assertEqual(writer.rows, 3)
+            self.assertEqual(writer.paths, [path])
+            table = self.read(writer)[0]
+            self.assertEqual(table.column_names, ["_partition", "_offset", "_timestamp", "_key", "id", "note"])
+            self.assertEqual(table.column("id").to_pylist(), [1, 2, 3])
+            self.assertEqual(table.column("note").to_pylist(), ["a", None, "x"])
+            self.assertEqual(str(table.schema.field("_timestamp").type), "timestamp[ms]")
+
+    def write(self, *batches):
+        path = os.path.join(tempfile.mkdtemp(), "out.parquet")
+        with ColumnarWriter(path) as writer:
+            for i, batch in enumerate(batches):
+                writer.write([message(i * 10 + j, None, value) for j, value in enumerate(batch)])
+        return writer
+
+    @unittest.skipUnless(pyarrow, "pyarrow is not installed")
+    def test_writer_null_then_typed(self):
+        writer = self.write([b'{"n": null}'], [b'{"n": 5}'], [b'{"n": null}'])
+
+        # The promotion from null to int64 starts a new part, the later null batch fits it.
+        self.assertEqual(len(writer.paths), 2)
+        self.assertTrue(writer.paths[1].endswith("out-1.parquet"))
+        tables = self.read(writer)
+        self.assertEqual(str(tables[1].schema.field("n").type), "int64")
+        self.assertEqual(tables[1].column("n").to_pylist(), [5, None])
+
+    @unittest.skipUnless(pyarrow, "pyarrow is not installed")
+    def test_writer_mixed_types_in_batch(self):
+        writer = self.write([b'{"n": 1}', b'{"n": "a"}'], [b'{"n": 2}'])
+
+        tables = self.read(writer)
+        self.assertEqual(len(tables), 1)
+        self.assertEqual(tables[0].column("n").to_pylist(), ["1", '"a"', "2"])
+
+    @unittest.skipUnless(pyarrow, "pyarrow is not installed")
+    def test_writer_promotes_int_to_double(self):
+        writer = self.write([b'{"n": 1}'], [b'{"n": 1.5}'], [b'{"n": 2}'])
+
+        tables = self.read(writer)
+        self.assertEqual([str(t.schema.field("n").type) for t in tables], ["int64", "double"])
+        self.assertEqual(tables[1].column("n").to_pylist(), [1.5, 2.0])
+
+    @unittest.skipUnless(pyarrow, "pyarrow is not installed")
+    def test_writer_new_struct_subfield(self):
+        writer = self.write([b'{"s": {"b": 1}}'], [b'{"s": {"c": 2}}'])
+
+        tables = self.read(writer)
+        self.assertEqual(tables[1].column("s").to_pylist(), [{"b": None, "c": 2}])
+
+    @unittest.skipUnless(pyarrow, "pyarrow is not installed")
+    def test_writer_new_field(self):
+        writer = self.write([b'{"a": 1}'], [b'{"a": 2, "b": "x"}'], [b'{"a": 3}'])
+
+        # The new field starts a new part, the later batch without it fills it with nulls.
+        tables = self.read(writer)
+        self.assertEqual([t.column_names[4:] for t in tables], [["a"], ["a", "b"]])
+        self.assertEqual(tables[1].column("b").to_pylist(), ["x", None])
+
+    @unittest.skipUnless(pyarrow, "pyarrow is not installed")
+    def test_writer_conflicting_types_across_batches(self):
+        writer = self.write([b'{"n": 1}'], [b'{"n": "a"}'], [b'{"n": 3}'])
+
+        tables = self.read(writer)
+        self.assertEqual([str(t.schema.field("n").type) for t in tables], ["int64", "string"])
+        self.assertEqual(tables[1].column("n").to_pylist(), ['"a"', "3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
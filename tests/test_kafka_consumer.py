@@ -0,0 +1,76 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from kafka.consumer import Consumer, compile_matcher
+from helpers import message
+
+
+class TestConsumer(unittest.TestCase):
+
+    def setUp(self):
+        self.admin_client = MagicMock()
+        self.consumer = Consumer(admin_client=self.admin_client, bootstrap_servers="kafka:9092")
+
+    def test_compile_matcher(self):
+        matcher = compile_matcher(key="^order-", value=r"\"id\": ?42", headers={"source": "web"})
+
+        self.assertTrue(matcher(message(0, b"order-1", b'{"id": 42}', [("source", b"web")])))
+        self.assertFalse(matcher(message(0, b"order-1", b'{"id": 42}', [("source", b"app")])))
+        self.assertFalse(matcher(message(0, None, b'{"id": 42}', [("source", b"web")])))
+        self.assertFalse(matcher(message(0, b"order-1", b'{"id": 43}', [("source", b"web")])))
+
+        matcher = compile_matcher(value="a.b", fixed_strings=True)
+        self.assertTrue(matcher(message(0, value=b"xa.bx")))
+        self.assertFalse(matcher(message(0, value=b"xaxbx")))
+
+    @patch("kafka.consumer.KafkaConsumer")
+    def test_grep(self, kafka_consumer):
+        self.consumer.get_ranges = MagicMock(return_value={0: (0, 3), 1: (5, 6)})
+        batches = {
+            0: [[message(0, value=b"foo"), message(1, value=b"bar")], [message(2, value=b"foo"), message(3, value=b"foo")]],
+            1: [[message(5, value=b"foo", partition=1)]],
+        }
+
+        def assign(tps):
+            kafka_consumer.return_value.consume.side_effect = batches[tps[0].partition]
+
+        kafka_consumer.return_value.assign.side_effect = assign
+        matcher = compile_matcher(value="foo")
+
+        results = list(self.consumer.grep("topic1", matcher, workers=1, timeout=1))
+        self.assertEqual([(r["partition"], r["offset"]) for r in results], [(0, 0), (0, 2), (1, 5)])
+        self.assertEqual(results[0]["value"], "foo")
+
+        kafka_consumer.return_value.assign.side_effect = assign
+        results = list(self.consumer.grep("topic1", matcher, max_matches=1, workers=1, timeout=1))
+        self.assertEqual(len(results), 1)
+        kafka_consumer.return_value.close.assert_called()
+
+    @patch("kafka.consumer.KafkaConsumer")
+    def test_consume(self, kafka_consumer):
+        self.consumer.get_ranges = MagicMock(return_value={0: (0, 2), 1: (5, 6)})
+        kafka_consumer.return_value.consume.side_effect = [
+            [message(0), message(5, partition=1)],
+            [message(1), message(2)],
+        ]
+
+        batches = list(self.consumer.consume("topic1", timeout=1))
+        self.assertEqual([[(m.partition(), m.offset()) for m in b] for b in batches], [[(0, 0), (1, 5)], [(0, 1)]])
+        kafka_consumer.return_value.close.assert_called_once()
+
+        kafka_consumer.return_value.consume.side_effect = [[message(0), message(5, partition=1)]]
+        batches = list(self.consumer.consume("topic1", max_messages=1, timeout=1))
+        self.assertEqual(sum(len(b) for b in batches), 1)
+
+    def test_read_ranges(self):
+        kafka_consumer = MagicMock()
+        # partition 1 ends in a transaction marker, so no message reaches its end offset
+        kafka_consumer.consume.side_effect = [[message(0), message(5, partition=1)], [], [message(1)]]
+        kafka_consumer.position.return_value = [MagicMock(partition=0, offset=1), MagicMock(partition=1, offset=7)]
+
+        batches = list(self.consumer.read_ranges(kafka_consumer, "topic1", {0: (0, 2), 1: (5, 7)}))
+        self.assertEqual([[(m.partition(), m.offset()) for m in b] for b in batches], [[(0, 0), (1, 5)], [(0, 1)]])
+        kafka_consumer.unassign.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from confluent_kafka import KafkaError, KafkaException, TopicPartition
+from kafka.consumer_group import ConsumerGroup
+
+
+class TestConsumerGroup(unittest.TestCase):
+
+    def setUp(self):
+        self.admin_client = MagicMock()
+        self.group = ConsumerGroup(admin_client=self.admin_client)
+
+        self.committed = {
+            "group1": [TopicPartition("topic1", 0, 10), TopicPartition("topic1", 1, 90)],
+            "group2": [TopicPartition("topic1", 0, 50), TopicPartition("topic1", 1, -1001)],
+            "group3": [TopicPartition("topic2", 0, 0)],
+        }
+
+        def list_consumer_group_offsets(request, request_timeout):
+            group_id = request[0].group_id
+            result = MagicMock(topic_partitions=self.committed[group_id])
+            return {group_id: MagicMock(**{"result.return_value": result})}
+
+        self.admin_client.list_consumer_group_offsets.side_effect = list_consumer_group_offsets
+
+    def test_get_committed_offsets(self):
+        results = self.group.get_committed_offsets(["group1", "group2"], batch_size=1, timeout=1)
+
+        self.assertEqual(self.admin_client.list_consumer_group_offsets.call_count, 2)
+        self.assertEqual(results["group1"], {("topic1", 0): 10, ("topic1", 1): 90})
+        self.assertEqual(results["group2"], {("topic1", 0): 50})
+
+    def test_get_committed_offsets_errors(self):
+        list_consumer_group_offsets = self.admin_client.list_consumer_group_offsets.side_effect
+
+        def failing(request, request_timeout):
+            if request[0].group_id == "group2":
+                return {"group2": MagicMock(**{"result.side_effect": KafkaException(KafkaError(KafkaError.COORDINATOR_NOT_AVAILABLE))})}
+            return list_consumer_group_offsets(request, request_timeout)
+
+        self.admin_client.list_consumer_group_offsets.side_effect = failing
+        self.committed["group1"][1] = MagicMock(topic="topic1", partition=1, offset=90, error=KafkaError(KafkaError.UNKNOWN_TOPIC_OR_PART))
+        results = self.group.get_committed_offsets(["group1", "group2", "group3"], timeout=1)
+
+        # the failed group and the deleted topic's partition are left out
+        self.assertEqual(results, {"group1": {("topic1", 0): 10}, "group3": {("topic2", 0): 0}})
+
+    @patch("kafka.topic.Topic.list_offsets")
+    def test_get_lag(self, list_offsets):
+        self.group.get = MagicMock(return_value=[{"name": g} for g in self.committed])
+        list_offsets.side_effect = lambda partitions, spec, timeout: {
+            tp: {("topic1", 0): 100, ("topic1", 1): 100, ("topic2", 0): 5}[tp] for tp in partitions
+        }
+
+        results = self.group.get_lag(top=2, batch_size=2, timeout=1)
+        self.assertEqual(results, [
+            {"group": "group1", "partitions": 2, "lag": 100},
+            {"group": "group2", "partitions": 1, "lag": 50},
+        ])
+
+        # every partition's log end offset is only listed once across all groups
+        listed = [tp for c in list_offsets.call_args_list for tp in c.args[0]]
+        self.assertEqual(sorted(listed), [("topic1", 0), ("topic1", 1), ("topic2", 0)])
+
+        results = self.group.get_lag(top=1, by="partition", timeout=1)
+        self.assertEqual(results[0]["lag"], 90)
+        self.assertEqual(results[0]["group"], "group1")
+
+    def list_groups(self, states):
+        groups = [MagicMock(group_id=name, state=MagicMock()) for name in states]
+        for group, state in zip(groups, states.values()):
+            group.state.name = state
+        self.admin_client.list_consumer_groups.return_value.result.return_value = MagicMock(valid=groups)
+
+    def test_delete_many(self):
+        self.list_groups({"test-1": "EMPTY", "test-2": "EMPTY", "test-3": "STABLE", "prod-1": "EMPTY", "test-4": "EMPTY"})
+
+        def delete_consumer_groups(groups, request_timeout):
+            futures = {}
+            for group in groups:
+                f = MagicMock()
+                if group == "test-2":
+                    f.result.side_effect = Exception("GROUP_AUTHORIZATION_FAILED")
+                futures[group] = f
+            return futures
+
+        self.admin_client.delete_consumer_groups.side_effect = delete_consumer_groups
+
+        results = self.group.delete_many(pattern="test-.*", dry_run=True, timeout=1)
+        self.assertEqual([r["result"] for r in results], ["would delete"] * 3)
+        self.admin_client.delete_consumer_groups.assert_not_called()
+
+        results = self.group.delete_many(pattern="test-.*", batch_size=2, max_in_flight=1, timeout=1)
+        self.assertEqual(self.admin_client.list_consumer_groups.call_count, 2)
+        self.assertEqual(self.admin_client.delete_consumer_groups.call_count, 2)
+        self.assertEqual(results, [
+            {"name": "test-1", "state": "EMPTY", "result": "deleted"},
+            {"name": "test-2", "state": "EMPTY", "result": "GROUP_AUTHORIZATION_FAILED"},
+            {"name": "test-4", "state": "EMPTY", "result": "deleted"},
+        ])
+
+    @patch("kafka.topic.Topic.list_offsets")
+    def test_delete_many_older_than(self, list_offsets):
+        self.list_groups({"group1": "EMPTY", "group2": "EMPTY", "group3": "EMPTY"})
+        # topic1:0 got messages after the cutoff from offset 40, the other partitions did not.
+        list_offsets.side_effect = lambda partitions, spec, timeout: {
+            tp: {("topic1", 0): 40}.get(tp, -1) for tp in partitions
+        }
+
+        results = self.group.delete_many(older_than=3600, dry_run=True, timeout=1)
+        # group2 committed offset 50 on topic1:0, past the first offset after the cutoff.
+        self.assertEqual([r["name"] for r in results], ["group1", "group3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
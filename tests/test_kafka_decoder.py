@@ -0,0 +1,100 @@
+import io
+import json
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+import warnings
+from unittest.mock import MagicMock
+from kafka.consumer import to_dict
+from kafka.decoder import DecodedMessage, Decoder, decode_protobuf_fields
+
+try:
+    import fastavro
+except ImportError:
+    fastavro = None
+
+AVRO_SCHEMA = {"type": "record", "name": "Order", "fields": [{"name": "id", "type": "long"}, {"name": "status", "type": "string"}]}
+
+
+def wire(schema_id, payload, indexes=b""):
+    return b"\x00" + struct.pack(">I", schema_id) + indexes + payload
+
+
+class TestDecoder(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def write(self, name, data):
+        path = os.path.join(self.directory, name)
+        with open(path, "wb" if isinstance(data, bytes) else "w") as f:
+            f.write(data)
+        return path
+
+    @unittest.skipUnless(fastavro, "fastavro is not installed")
+    def test_registry_cache(self):
+        registry_cache = self.write("schemas.json", json.dumps([
+            {"id": 1, "schema": json.dumps(AVRO_SCHEMA)},
+            {"id": 2, "schemaType": "JSON", "schema": "{}"},
+            {"id": 3, "schemaType": "PROTOBUF", "schema": "syntax = \"proto3\"; import \"missing.proto\";"},
+        ]))
+        decoder = Decoder(registry_cache=registry_cache, cache_size=2)
+
+        buffer = io.BytesIO()
+        fastavro.schemaless_writer(buffer, fastavro.parse_schema(AVRO_SCHEMA), {"id": 42, "status": "shipped"})
+        self.assertEqual(decoder.decode(wire(1, buffer.getvalue())), {"id": 42, "status": "shipped"})
+        self.assertEqual(decoder.decode(wire(2, b'{"id": 1}')), {"id": 1})
+        # field 1 varint 150, without the schema since its import cannot be resolved
+        self.assertEqual(decoder.decode(wire(3, b"\x08\x96\x01", indexes=b"\x00")), {"1": 150})
+
+        # schema 1 is the least recently used
+        self.assertEqual(list(decoder.decoders), [2, 3])
+        with self.assertRaises(ValueError):
+            decoder.decode(wire(4, b"{}"))
+
+    def test_local_schema(self):
+        decoder = Decoder(schema_file=self.write("order.json", "{}"))
+        messages = [
+            MagicMock(**{"value.return_value": b'{"id": 1}', "topic.return_value": "topic1"}),
+            MagicMock(**{"value.return_value": b"not json"}),
+        ]
+
+        with self.assertWarns(UserWarning):
+            decoded = decoder.decode_batch(messages)
+        self.assertEqual(decoder.failures, 1)
+        self.assertIsInstance(decoded[0], DecodedMessage)
+        self.assertIs(decoded[1], messages[1])
+        self.assertEqual(decoded[0].value(), b'{"id": 1}')
+        self.assertEqual(to_dict(decoded[0])["value"], {"id": 1})
+        self.assertEqual(to_dict(decoded[0])["topic"], "topic1")
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            decoder.decode_batch(messages[1:] * 2)
+        # only the first failure is reported
+        self.assertEqual(len(caught), 0)
+        self.assertEqual(decoder.failures, 3)
+
+        # programming errors are not mistaken for undecodable messages
+        decoder.local = MagicMock(side_effect=TypeError("bug"))
+        with self.assertRaises(TypeError):
+            decoder.decode_batch(messages[:1])
+
+        with self.assertRaises(ValueError):
+            Decoder(schema_file=self.write("order.txt", ""))
+
+    @unittest.skipUnless(shutil.which("protoc"), "protoc is not installed")
+    def test_local_protobuf_schema(self):
+        path = self.write("order.proto", 'syntax = "proto3"; message Order { int64 id = 1; string status = 2; }')
+        decoder = Decoder(schema_file=path)
+        self.assertEqual(decoder.decode(wire(9, b"\x08\x2a\x12\x07shipped", indexes=b"\x00")), {"id": "42", "status": "shipped"})
+
+    def test_decode_protobuf_fields(self):
+        data = b"\x08\x96\x01" + b"\x12\x03abc" + b"\x1a\x02\x08\x01" + b"\x20\x01\x20\x02"
+        self.assertEqual(decode_protobuf_fields(data), {"1": 150, "2": "abc", "3": {"1": 1}, "4": [1, 2]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import gzip
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+from confluent_kafka import TopicPartition
+from kafka.group_offsets import GroupOffsets, rounds
+
+
+def message(topic, partition, offset, timestamp):
+    return MagicMock(**{
+        "error.return_value": None,
+        "topic.return_value": topic,
+        "partition.return_value": partition,
+        "offset.return_value": offset,
+        "timestamp.return_value": (1, timestamp),
+    })
+
+
+class TestGroupOffsets(unittest.TestCase):
+
+    def setUp(self):
+        self.admin_client = MagicMock()
+        self.offsets = GroupOffsets(admin_client=self.admin_client, bootstrap_servers="kafka:9092")
+        self.path = os.path.join(tempfile.mkdtemp(), "offsets.json.gz")
+
+    def test_rounds(self):
+        results = rounds([("t", 0, 5), ("t", 0, 7), ("t", 1, 5), ("t", 0, 5)])
+        self.assertEqual(results, [{("t", 0): 5, ("t", 1): 5}, {("t", 0): 7}])
+
+    @patch("kafka.group_offsets.Topic.list_offsets")
+    @patch("kafka.group_offsets.ConsumerGroup.get_committed_offsets")
+    @patch("kafka.group_offsets.Consumer")
+    def test_export(self, consumer, get_committed_offsets, list_offsets):
+        groups = [MagicMock(group_id=g) for g in ("app-1", "app-2", "other")]
+        self.admin_client.list_consumer_groups.return_value.result.return_value = MagicMock(valid=groups)
+        get_committed_offsets.return_value = {
+            "app-1": {("topic1", 0): 5, ("topic1", 1): 20},
+            "app-2": {("topic1", 0): 8},
+        }
+        list_offsets.return_value = {("topic1", 0): 10, ("topic1", 1): 20}
+        # Both groups are behind on topic1:0, so its offsets are read in two rounds.
+        consumer.return_value._consumer.return_value.consume.side_effect = [
+            [message("topic1", 0, 5, 1005)],
+            [message("topic1", 0, 8, 1008)],
+        ]
+
+        results = self.offsets.export(self.path, pattern="app-.*", timeout=1)
+
+        self.assertEqual(results, {"groups": 2, "partitions": 3})
+        self.assertEqual(get_committed_offsets.call_args.args[0], ["app-1", "app-2"])
+        self.assertEqual(GroupOffsets.load(self.path)["groups"], {
+            "app-1": {"topic1": [[0, 5, 1005], [1, 20, None]]},
+            "app-2": {"topic1": [[0, 8, 1008]]},
+        })
+
+    def write(self, groups):
+        with patch("kafka.group_offsets.ConsumerGroup.get_committed_offsets", return_value=groups):
+            self.offsets.export(self.path, groups=list(groups), timestamps=False, timeout=1)
+
+    def test_restore(self):
+        self.write({"app-1": {("topic1", 0): 5, ("gone", 0): 1}, "app-2": {("topic1", 0): 8}})
+        self.admin_client.list_topics.return_value.topics = {"topic1": MagicMock(partitions={0: None})}
+
+        def alter_consumer_group_offsets(requests, request_timeout):
+            f = MagicMock()
+            if requests[0].group_id == "app-2":
+                f.result.side_effect = Exception("Group is not empty")
+            return {requests[0].group_id: f}
+
+        self.admin_client.alter_consumer_group_offsets.side_effect = alter_consumer_group_offsets
+
+        results = self.offsets.restore(self.path, timeout=1)
+
+        self.assertEqual(self.admin_client.alter_consumer_group_offsets.call_count, 2)
+        request = self.admin_client.alter_consumer_group_offsets.call_args_list[0].args[0][0]
+        self.assertEqual(request.topic_partitions, [TopicPartition("topic1", 0, 5)])
+        self.assertEqual([(r["group"], r["skipped"], r["result"]) for r in results], [
+            ("app-1", 1, "altered"),
+            ("app-2", 0, "Group is not empty"),
+        ])
+
+        # Offsets without timestamps cannot be translated.
+        with self.assertRaises(ValueError):
+            self.offsets.restore(self.path, translate=True, timeout=1)
+
+    @patch("kafka.group_offsets.Topic.list_offsets")
+    @patch("kafka.group_offsets.Consumer")
+    def test_restore_translate(self, consumer, list_offsets):
+        with gzip.open(self.path, "wt") as f:
+            json.dump({"version": 1, "groups": {
+                "app-1": {"topic1": [[0, 5, 1005], [1, 20, None]]},
+                "app-2": {"topic1": [[0, 8, 9999]]},
+            }}, f)
+
+        self.admin_client.list_topics.return_value.topics = {"topic1": MagicMock(partitions={0: None, 1: None})}
+        list_offsets.return_value = {("topic1", 0): 50, ("topic1", 1): 70}
+        consumer.return_value._consumer.return_value.offsets_for_times.side_effect = lambda request, timeout: [
+            TopicPartition(tp.topic, tp.partition, {1005: 42}.get(tp.offset, -1)) for tp in request
+        ]
+
+        results = self.offsets.restore(self.path, translate=True, dry_run=True, timeout=1)
+
+        self.admin_client.alter_consumer_group_offsets.assert_not_called()
+        # The end of a partition and a timestamp past the last message both translate to the log end offset.
+        self.assertEqual({r["group"]: r["offsets"] for r in results}, {
+            "app-1": {"topic1:0": 42, "topic1:1": 70},
+            "app-2": {"topic1:0": 50},
+        })
+        self.assertEqual({r["result"] for r in results}, {"would alter"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+from kafka.name_index import NameIndex
+
+
+class TestNameIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = NameIndex(tempfile.mkdtemp())
+
+    def test_search(self):
+        self.assertIsNone(self.index.age("topics"))
+        self.assertEqual(self.index.search("topics", "a"), [])
+
+        self.index.write("topics", ["orders", "payments", "orders-dlq", "order", "orders"])
+
+        self.assertLess(self.index.age("topics"), 5)
+        self.assertEqual(self.index.search("topics", "orders"), ["orders", "orders-dlq"])
+        self.assertEqual(self.index.search("topics", "order", limit=2), ["order", "orders"])
+        self.assertEqual(self.index.search("topics", "x"), [])
+        self.assertEqual(len(self.index.search("topics")), 4)
+
+    def test_search_large_index(self):
+        names = sorted({f"topic-{i * 7919 % 100000:05d}" for i in range(20000)} | {"a", "é-topic", "zz"})
+        self.index.write("topics", names)
+
+        for prefix in ("", "a", "topic-0", "topic-12", "topic-99999", "topic-999999", "é", "z", "zzz", "0"):
+            expected = [n for n in names if n.startswith(prefix)][:50]
+            self.assertEqual(self.index.search("topics", prefix, limit=50), expected, prefix)
+
+    def test_refresh(self):
+        admin_client = MagicMock()
+        admin_client.list_topics.return_value.topics = {"topic1": None, "topic2": None}
+        admin_client.list_topics.return_value.brokers = {1: None, 2: None}
+        admin_client.list_consumer_groups.return_value.result.return_value.valid = [MagicMock(group_id="group1")]
+
+        self.assertEqual(self.index.refresh(admin_client, timeout=1), {"topics": 2, "groups": 1, "brokers": 2})
+        self.assertEqual(self.index.search("groups", "g"), ["group1"])
+        self.assertEqual(self.index.search("brokers", "2"), ["2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
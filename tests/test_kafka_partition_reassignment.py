@@ -0,0 +1,113 @@
+import unittest
+from collections import Counter
+from unittest.mock import MagicMock, patch
+from kafka.partition_reassignment import PartitionReassignment, balance_leaders, balance_replicas, place_partitions
+
+
+class TestPartitionReassignment(unittest.TestCase):
+
+    def setUp(self):
+        self.admin_client = MagicMock()
+        self.reassignment = PartitionReassignment(admin_client=self.admin_client)
+
+    def test_balance_replicas(self):
+        # broker 3 was just added and hosts nothing
+        replicas = [[0, 1, 2] for _ in range(8)]
+        moves = balance_replicas(replicas, [0, 1, 2, 3])
+
+        self.assertEqual(moves, 6)
+        counts = Counter(b for r in replicas for b in r)
+        self.assertEqual(sorted(counts.values()), [6, 6, 6, 6])
+        self.assertTrue(all(len(set(r)) == 3 for r in replicas))
+
+    def test_balance_replicas_evicts_and_respects_racks(self):
+        replicas = [[0, 1], [0, 1], [1, 0]]
+        racks = {1: "a", 2: "a", 3: "b"}
+        balance_replicas(replicas, [1, 2, 3], racks=racks)
+
+        self.assertTrue(all(0 not in r for r in replicas))
+        self.assertTrue(all(len({racks[b] for b in r}) == 2 for r in replicas))
+
+    def test_balance_replicas_unplaced_evictions(self):
+        # broker 0 is removed, and the only broker left in rack "b" already hosts the partition
+        with self.assertRaises(ValueError) as e:
+            balance_replicas([[0, 1]], [1, 2], racks={0: "a", 1: "b", 2: "b"}, names=["topic1:0"])
+        self.assertIn("topic1:0", str(e.exception))
+
+    def test_balance_leaders(self):
+        replicas = [[0, 1, 2] for _ in range(6)]
+        changes = balance_leaders(replicas, [0, 1, 2])
+
+        self.assertEqual(changes, 4)
+        self.assertEqual(sorted(Counter(r[0] for r in replicas).values()), [2, 2, 2])
+        self.assertTrue(all(sorted(r) == [0, 1, 2] for r in replicas))
+
+        # the partition skipped on the first pass over broker 2 moves once broker 3 leads less
+        replicas = [[2, 1], [1, 0], [2, 3], [2, 3], [3, 1]]
+        balance_leaders(replicas, [0, 1, 2, 3])
+        counts = Counter(r[0] for r in replicas)
+        self.assertLessEqual(max(counts.values()) - min(counts.get(b, 0) for b in range(4)), 1)
+
+    @patch("kafka.partition_reassignment.Topic")
+    @patch("kafka.partition_reassignment.Cluster")
+    def test_plan(self, cluster, topic):
+        cluster().get.return_value = [{"name": 0}, {"name": 1}, {"name": 2}]
+        cluster().get_racks.return_value = {}
+        topic().describe.return_value = {
+            "topic1": {"availability": [{"id": i, "replicas": [0, 1]} for i in range(3)]}
+        }
+
+        results = self.reassignment.plan(batch_size=1, timeout=1)
+
+        topic().describe.assert_called_with(None, timeout=1)
+        self.assertTrue(all(len(r["partitions"]) == 1 for r in results["reassignments"]))
+        self.assertEqual(len(results["current"]["partitions"]), len(results["reassignments"]))
+        partition = results["reassignments"][0]["partitions"][0]
+        self.assertEqual(partition["topic"], "topic1")
+        self.assertEqual(partition["log_dirs"], ["any", "any"])
+
+    def test_place_partitions(self):
+        # broker 2 hosts nothing of the topic and less of the cluster
+        replica_counts = {0: 10, 1: 10, 2: 4, 3: 8}
+        leader_counts = {0: 5, 1: 5, 2: 2, 3: 4}
+        replicas = [[0, 1], [1, 0]]
+        racks = {0: "a", 1: "a", 2: "a", 3: "b"}
+
+        results = place_partitions(replicas, 2, [0, 1, 2, 3], replica_counts, leader_counts, racks=racks)
+
+        self.assertEqual(results[0], [2, 3])
+        self.assertEqual(results[1][0], 3)
+        self.assertTrue(all(len({racks[b] for b in r}) == 2 for r in results))
+        self.assertEqual(replica_counts, {0: 10, 1: 10, 2: 6, 3: 10})
+        self.assertEqual(leader_counts[3], 5)
+
+        with self.assertRaises(ValueError):
+            place_partitions([[0, 1, 2]], 1, [0, 1], {}, {})
+
+    @patch("kafka.partition_reassignment.Topic")
+    @patch("kafka.partition_reassignment.Cluster")
+    def test_add_partitions(self, cluster, topic):
+        cluster().get.return_value = [{"name": 0}, {"name": 1}, {"name": 2}]
+        cluster().get_racks.return_value = {}
+        topic().describe.return_value = {
+            "orders-1": {"availability": [{"id": 0, "replicas": [0, 1]}, {"id": 1, "replicas": [1, 0]}]},
+            "orders-2": {"availability": [{"id": i, "replicas": [0, 1]} for i in range(4)]},
+            "other": {"availability": [{"id": 0, "replicas": [2, 0]}]},
+        }
+        self.admin_client.create_partitions.side_effect = lambda requests, **kwargs: {r.topic: MagicMock() for r in requests}
+
+        results = self.reassignment.add_partitions(4, pattern="orders-.*", batch_size=1, timeout=1)
+
+        self.assertEqual(self.admin_client.create_partitions.call_count, 1)
+        request = self.admin_client.create_partitions.call_args.args[0][0]
+        self.assertEqual((request.topic, request.new_total_count), ("orders-1", 4))
+        # broker 2 leads nothing of the topic, then broker 1 leads the fewest partitions of the cluster
+        self.assertEqual(request.replica_assignment, [[2, 1], [1, 2]])
+        self.assertEqual([(r["topic"], r["result"]) for r in results], [("orders-1", "created"), ("orders-2", "unchanged")])
+
+        results = self.reassignment.add_partitions(2, topics=["missing"], timeout=1)
+        self.assertEqual(results[0]["result"], "does not exist")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import random
+import unittest
+from unittest.mock import MagicMock, patch
+from kafka.perf import Histogram, Perf
+
+
+class TestPerf(unittest.TestCase):
+
+    def setUp(self):
+        self.admin_client = MagicMock()
+        self.perf = Perf(admin_client=self.admin_client, bootstrap_servers="kafka:9092")
+
+    def test_histogram(self):
+        histogram = Histogram()
+        values = [random.uniform(100, 100000) for _ in range(10000)]
+        for value in values:
+            histogram.record(value)
+
+        values.sort()
+        for p in (50, 99, 99.9):
+            exact = values[int(p / 100 * len(values)) - 1]
+            self.assertAlmostEqual(histogram.percentile(p) / exact, 1, delta=0.02)
+
+        other = Histogram()
+        other.record(0.5)
+        other.record(10 ** 12)
+        histogram.merge(other)
+        self.assertEqual(histogram.count, 10002)
+        self.assertEqual(histogram.percentile(0), 0.5)
+        self.assertEqual(histogram.percentile(100), 10 ** 12)
+        self.assertEqual(len(histogram.counts), len(other.counts))
+
+        histogram.reset()
+        self.assertIsNone(histogram.summary()["p99"])
+
+    @patch("kafka.perf.Producer")
+    def test_produce(self, producer):
+        def produce(topic, value, key, on_delivery):
+            on_delivery(None, MagicMock(**{"latency.return_value": 0.002, "value.return_value": value}))
+
+        producer.return_value.produce.side_effect = produce
+
+        results = list(self.perf.produce("topic1", messages=100, record_size=10, key_cardinality=3, interval=60))
+
+        self.assertEqual(len(results), 1)
+        self.assertTrue(results[0]["final"])
+        self.assertEqual(results[0]["count"], 100)
+        self.assertAlmostEqual(results[0]["p99"], 2, delta=0.02)
+        keys = {c.kwargs["key"] for c in producer.return_value.produce.call_args_list}
+        self.assertEqual(keys, {b"key-0", b"key-1", b"key-2"})
+        producer.return_value.flush.assert_called_once()
+
+        with self.assertRaises(ValueError):
+            next(self.perf.produce("topic1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
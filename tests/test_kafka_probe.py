@@ -0,0 +1,48 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from kafka.probe import Probe
+
+
+class TestProbe(unittest.TestCase):
+
+    def setUp(self):
+        self.admin_client = MagicMock()
+        self.probe = Probe(admin_client=self.admin_client, bootstrap_servers="kafka:9092")
+
+    @patch("kafka.probe.Producer")
+    @patch("kafka.probe.Consumer")
+    @patch("kafka.probe.Topic")
+    def test_e2e(self, topic, consumer, producer):
+        topic.return_value.describe.return_value = {"topic1": {"availability": [
+            {"id": 0, "leader": 1}, {"id": 1, "leader": 2}, {"id": 2, "leader": 1}, {"id": 3, "leader": -1},
+        ]}}
+        topic.return_value.list_offsets.return_value = {("topic1", p): 100 for p in range(4)}
+
+        # Echo every produced probe back to the consumer, except those of partition 2.
+        messages = []
+
+        def produce(topic, value, partition, on_delivery):
+            if partition != 2:
+                messages.append(MagicMock(**{"error.return_value": None, "value.return_value": value, "partition.return_value": partition}))
+
+        def consume(n, timeout):
+            batch = messages[:]
+            del messages[:len(batch)]
+            other = MagicMock(**{"error.return_value": None, "value.return_value": b"other", "partition.return_value": 0})
+            return batch + [other]
+
+        producer.return_value.produce.side_effect = produce
+        consumer.return_value._consumer.return_value.consume.side_effect = consume
+
+        results = self.probe.e2e("topic1", count=3, interval=0, timeout=0.5)
+
+        assigned = consumer.return_value._consumer.return_value.assign.call_args[0][0]
+        self.assertEqual([(tp.partition, tp.offset) for tp in assigned], [(0, 100), (1, 100), (2, 100)])
+        self.assertEqual([(r["partition"], r["sent"], r["received"]) for r in results["partitions"]], [(0, 3, 3), (1, 3, 3), (2, 3, 0), (3, 0, 0)])
+        self.assertEqual([(r["broker"], r["partitions"], r["sent"], r["received"]) for r in results["brokers"]], [(-1, 1, 0, 0), (1, 2, 6, 3), (2, 1, 3, 3)])
+        self.assertIsNotNone(results["brokers"][1]["p99"])
+        consumer.return_value._consumer.return_value.close.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import json
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+from confluent_kafka import KafkaException
+from kafka.consumer import to_dict
+from kafka.decoder import DecodedMessage
+from kafka.producer import Producer, TokenBucket
+from helpers import message
+
+
+class TestProducer(unittest.TestCase):
+
+    def setUp(self):
+        self.admin_client = MagicMock()
+        self.producer = Producer(admin_client=self.admin_client, bootstrap_servers="kafka:9092")
+
+    @patch("kafka.producer.KafkaProducer")
+    def test_produce(self, kafka_producer):
+        kafka_producer.return_value.produce.side_effect = [BufferError(), None]
+        kafka_producer.return_value.flush.return_value = 0
+
+        self.producer.produce("topic1", value=b"a", key=b"k", partition=1, timestamp=1000)
+
+        self.assertEqual(kafka_producer.return_value.produce.call_count, 2)
+        kafka_producer.return_value.poll.assert_any_call(0.1)
+        _, kwargs = kafka_producer.return_value.produce.call_args
+        self.assertEqual((kwargs["partition"], kwargs["timestamp"]), (1, 1000))
+
+        kwargs["on_delivery"](None, MagicMock())
+        self.assertEqual(self.producer.flush(), 1)
+        kwargs["on_delivery"]("broker down", MagicMock())
+        with self.assertRaises(KafkaException):
+            self.producer.flush()
+
+    def test_token_bucket(self):
+        bucket = TokenBucket(1000, burst=10)
+        start = time.perf_counter()
+        for _ in range(60):
+            bucket.take()
+        # The first 10 tokens are free, the other 50 take 50ms at 1000/s.
+        self.assertGreaterEqual(time.perf_counter() - start, 0.045)
+
+    def test_replay(self):
+        self.producer.produce = MagicMock()
+        self.producer.flush = MagicMock()
+        records = [
+            {"timestamp": 1000, "key": "a", "value": "1", "partition": 2, "headers": {"h": "v"}},
+            {"timestamp": 1050, "key": "b", "value": "2", "partition": 0, "headers": {}},
+            {"timestamp": 1100, "key": None, "value": "3", "partition": 1, "headers": {}},
+        ]
+
+        results = self.producer.replay("topic1", records, speed=2, keep_partitions=True)
+
+        self.assertEqual(results["messages"], 3)
+        # 100ms of recorded traffic at 2x speed is replayed in about 50ms.
+        self.assertGreaterEqual(results["elapsed"], 0.05)
+        self.assertLess(results["elapsed"], 0.5)
+        self.assertEqual(results["target_rate"], 60.0)
+        self.assertIsNotNone(results["drift"])
+        self.producer.produce.assert_any_call(
+            "topic1", value=b"1", key=b"a", partition=2, timestamp=None, headers=[("h", b"v")]
+        )
+        self.producer.flush.assert_called_once()
+
+        results = self.producer.replay("topic1", records, speed=0)
+        self.assertIsNone(results["target_rate"])
+        self.assertIsNone(results["max_lag_ms"])
+
+    def test_replay_decoded_values(self):
+        self.producer.produce = MagicMock()
+        self.producer.flush = MagicMock()
+        decoded = DecodedMessage(message(0, key=b"k"), {"id": 42, "tags": ["a"]})
+        # the record as written by consume topic --value-schema and read back
+        records = [json.loads(json.dumps(to_dict(decoded)))]
+
+        self.producer.replay("topic1", records, speed=0)
+
+        self.producer.produce.assert_called_once_with(
+            "topic1", value=b'{"id": 42, "tags": ["a"]}', key=b"k", partition=None, timestamp=None, headers=None
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from kafka.query import Query, parse
+
+
+class TestQuery(unittest.TestCase):
+
+    def setUp(self):
+        self.snapshot = {
+            "topics": {
+                "topic1": [[0, 0, [0, 1, 2], [0, 1, 2]], [1, 1, [1, 2, 0], [1]]],
+                "topic2": [[0, 0, [0, 1], [0, 1]]],
+                "__consumer_offsets": [[0, -1, [0, 1, 2], []]],
+            },
+            "topic_defaults": {"cleanup.policy": "delete", "retention.ms": "604800000"},
+            "configs": {"topic2": {"retention.ms": "-1"}, "__consumer_offsets": {"cleanup.policy": "compact"}},
+            "groups": {"group1": {"state": "STABLE", "offsets": {"topic1:0": 1, "topic1:1": 2}}},
+        }
+        self.query = Query(snapshot=self.snapshot)
+
+    def test_parse(self):
+        query = parse("topics where (partitions > 1 or name ~ '^_') and not internal = true select name sort -partitions limit 5")
+
+        self.assertEqual(query["table"], "topics")
+        self.assertEqual(query["select"], ["name"])
+        self.assertEqual(query["sort"], ["-partitions"])
+        self.assertEqual(query["limit"], 5)
+        self.assertEqual(query["columns"], {"partitions", "name", "internal"})
+
+        for text in ["brokers", "topics where", "topics where partitions >", "topics partitions", "topics where (a = 1"]:
+            with self.assertRaises(ValueError):
+                parse(text)
+
+        with self.assertRaisesRegex(ValueError, "Invalid regular expression '\\[a' after 'name'"):
+            parse("topics where name ~ '[a'")
+        for text in ["topics limit ten", "topics limit -1", "topics limit 5 6"]:
+            with self.assertRaisesRegex(ValueError, "The limit must be a non-negative integer"):
+                parse(text)
+
+    def test_execute_topics(self):
+        columns, rows = self.query.execute(
+            "topics where replication_factor < 3 or cleanup.policy = compact select name, retention.ms sort name"
+        )
+        self.assertEqual(columns, ["name", "retention.ms"])
+        self.assertEqual(rows, [["__consumer_offsets", 604800000], ["topic2", -1]])
+
+        columns, rows = self.query.execute("topics select name,under_replicated,offline sort -under_replicated,name limit 2")
+        self.assertEqual(rows, [["__consumer_offsets", 1, 1], ["topic1", 1, 0]])
+
+    def test_execute_partitions_and_groups(self):
+        columns, rows = self.query.execute("partitions where in_sync < replication_factor select topic,partition")
+        self.assertEqual(rows, [["topic1", 1], ["__consumer_offsets", 0]])
+
+        columns, rows = self.query.execute("groups where state = STABLE")
+        self.assertEqual(rows, [["group1", "STABLE", None, 2]])
+
+    @patch("kafka.query.Topic")
+    def test_execute_live(self, topic):
+        topic().describe.return_value = {
+            "topic1": {"availability": [{"id": 0, "leader": 0, "replicas": [0, 1], "isrs": [0, 1]}]},
+        }
+        topic().get_configs.return_value = {"topic1": {"cleanup.policy": "delete", "flush.ms": "-"}}
+        q = Query(admin_client=MagicMock())
+
+        columns, rows = q.execute("topics select name,partitions")
+        self.assertEqual(rows, [["topic1", 1]])
+        topic().get_configs.assert_not_called()
+
+        columns, rows = q.execute("topics where cleanup.policy = delete select name,flush.ms")
+        self.assertEqual(rows, [["topic1", None]])
+        topic().get_configs.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+from kafka.snapshot import Snapshot
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.admin_client = MagicMock()
+        self.snapshot = Snapshot(admin_client=self.admin_client)
+
+        metadata = self.admin_client.list_topics.return_value
+        metadata.brokers = {0: MagicMock(), 1: MagicMock()}
+        metadata.topics = {
+            "topic1": MagicMock(partitions={
+                1: MagicMock(id=1, leader=1, replicas=[1, 0], isrs=[1, 0]),
+                0: MagicMock(id=0, leader=0, replicas=[0, 1], isrs=[0, 1]),
+            }),
+        }
+
+    @patch("kafka.snapshot.ConsumerGroup")
+    @patch("kafka.snapshot.Topic")
+    def test_save_and_load(self, topic, consumer_group):
+        topic().describe_configs.return_value = {
+            "topic1": {
+                "cleanup.policy": MagicMock(value="compact", is_default=False),
+                "retention.ms": MagicMock(value="604800000", is_default=True),
+            }
+        }
+        consumer_group().get.return_value = [{"name": "group1", "state": "STABLE"}]
+        consumer_group().get_committed_offsets.return_value = {"group1": {("topic1", 0): 42}}
+
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "snapshot.json.gz")
+            results = self.snapshot.save(path, timeout=1)
+            snapshot = Snapshot.load(path)
+
+        self.assertEqual(results, {"topics": 1, "partitions": 2, "configs": 1, "groups": 1})
+        self.assertEqual(snapshot["topics"]["topic1"][0], [0, 0, [0, 1], [0, 1]])
+        self.assertEqual(snapshot["configs"]["topic1"], {"cleanup.policy": "compact"})
+        self.assertEqual(snapshot["topic_defaults"], {"retention.ms": "604800000"})
+        self.assertEqual(snapshot["groups"]["group1"]["offsets"], {"topic1:0": 42})
+        self.assertEqual(set(snapshot["hashes"]), {"topics", "configs", "groups"})
+        consumer_group().get_committed_offsets.assert_called_once_with(["group1"], timeout=1)
+        states = consumer_group().get.call_args.kwargs["states"]
+        self.assertIn("PREPARING_REBALANCING", states)
+        self.assertIn("DEAD", states)
+        self.assertNotIn("UNKNOWN", states)
+
+    @patch("kafka.snapshot.ConsumerGroup")
+    @patch("kafka.snapshot.Topic")
+    def test_diff(self, topic, consumer_group):
+        topic().describe_configs.return_value = {}
+        consumer_group().get.return_value = []
+        consumer_group().get_committed_offsets.return_value = {}
+        old = self.snapshot.take()
+
+        self.admin_client.list_topics.return_value.topics["topic1"].partitions[0].leader = 1
+        self.admin_client.list_topics.return_value.topics["topic2"] = MagicMock(partitions={})
+        new = self.snapshot.take()
+
+        self.assertEqual(Snapshot.diff(old, old), [])
+        self.assertEqual(Snapshot.diff(old, new), [
+            {"section": "topics", "name": "topic1", "change": "changed", "details": ["partition 0 leader 0 -> 1"]},
+            {"section": "topics", "name": "topic2", "change": "added", "details": []},
+        ])
+
+    @patch("kafka.snapshot.ConsumerGroup")
+    @patch("kafka.snapshot.Topic")
+    def test_diff_brokers(self, topic, consumer_group):
+        topic().describe_configs.return_value = {}
+        consumer_group().get.return_value = []
+        old = self.snapshot.take()
+
+        self.admin_client.list_topics.return_value.brokers = {1: MagicMock(), 2: MagicMock()}
+        new = self.snapshot.take()
+
+        self.assertEqual(Snapshot.diff(old, new), [
+            {"section": "brokers", "name": "0", "change": "removed", "details": []},
+            {"section": "brokers", "name": "2", "change": "added", "details": []},
+        ])
+
+    @patch("kafka.snapshot.ConsumerGroup")
+    @patch("kafka.snapshot.Topic")
+    def test_diff_topic_defaults(self, topic, consumer_group):
+        consumer_group().get.return_value = []
+        topic().describe_configs.return_value = {"topic1": {"retention.ms": MagicMock(value="604800000", is_default=True)}}
+        old = self.snapshot.take()
+
+        topic().describe_configs.return_value = {"topic1": {"retention.ms": MagicMock(value="86400000", is_default=True)}}
+        new = self.snapshot.take()
+
+        self.assertEqual(Snapshot.diff(old, new), [
+            {"section": "topic_defaults", "name": "retention.ms", "change": "changed", "details": ["604800000 -> 86400000"]},
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
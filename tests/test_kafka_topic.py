@@ -1,7 +1,7 @@
 import unittest
-from unittest.mock import MagicMock, call
+from unittest.mock import MagicMock, call, patch
 from kafka.topic import Topic
-from confluent_kafka import TopicPartition
+from confluent_kafka import KafkaError, KafkaException, TopicPartition
 from confluent_kafka.admin import NewTopic, ConfigResource, ResourceType
 
 
@@ -81,6 +81,115 @@ class TestTopic(unittest.TestCase):
             call.describe_configs().items().__iter__()
         ])
     
+    def test_get_unhealthy_partitions(self):
+        metadata = self.admin_client.list_topics.return_value
+        metadata.topics = {
+            "topic1": MagicMock(partitions={
+                0: MagicMock(id=0, leader=0, replicas=[0, 1, 2], isrs=[0, 1, 2]),
+                1: MagicMock(id=1, leader=1, replicas=[1, 2, 0], isrs=[1]),
+                2: MagicMock(id=2, leader=-1, replicas=[2, 0, 1], isrs=[]),
+            }),
+            "topic2": MagicMock(partitions={
+                0: MagicMock(id=0, leader=0, replicas=[0, 1, 2], isrs=[0, 1]),
+            }),
+        }
+        min_isr = MagicMock(value="3")
+        self.admin_client.describe_configs.return_value = {
+            ConfigResource(ResourceType.TOPIC, "topic1"): MagicMock(**{"result.return_value": {}}),
+            ConfigResource(ResourceType.TOPIC, "topic2"): MagicMock(**{
+                "result.return_value": {"min.insync.replicas": min_isr}
+            }),
+        }
+        self.topic._cluster_default_configs = {"min.insync.replicas": "2"}
+
+        results = self.topic.get_unhealthy_partitions(offline=True, timeout=1)
+        self.assertEqual([(r["topic"], r["partition"]) for r in results], [("topic1", 2)])
+        self.admin_client.describe_configs.assert_not_called()
+
+        results = self.topic.get_unhealthy_partitions(under_replicated=True, under_min_isr=True, timeout=1)
+        self.assertEqual(
+            [(r["topic"], r["partition"], r["issues"]) for r in results],
+            [
+                ("topic1", 1, ["under-replicated", "under-min-isr"]),
+                ("topic1", 2, ["under-replicated", "under-min-isr"]),
+                ("topic2", 0, ["under-replicated", "under-min-isr"]),
+            ],
+        )
+        self.admin_client.describe_configs.assert_called_once()
+
+    @patch("kafka.topic.time")
+    def test_get_rates(self, mock_time):
+        mock_time.monotonic.side_effect = [0, 0, 10, 10]
+        self.topic.describe = MagicMock(return_value={
+            "topic1": {"availability": [{"id": 0}, {"id": 1}]},
+            "topic2": {"availability": [{"id": 0}]},
+        })
+        samples = iter([
+            {("topic1", 0): 100, ("topic1", 1): 100, ("topic2", 0): 0},
+            {("topic1", 0): 200, ("topic1", 1): 150, ("topic2", 0): 500},
+        ])
+
+        def list_offsets(request, request_timeout):
+            offsets = next(samples)
+            return {tp: MagicMock(**{"result.return_value.offset": offsets[(tp.topic, tp.partition)]}) for tp in request}
+
+        self.admin_client.list_offsets.side_effect = list_offsets
+        results = self.topic.get_rates(window=10, top=2, timeout=1)
+
+        mock_time.sleep.assert_called_once_with(10)
+        self.assertEqual(self.admin_client.list_offsets.call_count, 2)
+        self.assertEqual(results["topics"], [{"topic": "topic2", "rate": 50.0}, {"topic": "topic1", "rate": 15.0}])
+        self.assertEqual(results["partitions"][1], {"topic": "topic1", "partition": 0, "rate": 10.0})
+
+    def test_list_offsets_errors(self):
+        def list_offsets(request, request_timeout):
+            return {
+                tp: MagicMock(**{"result.side_effect": KafkaException(KafkaError(KafkaError.LEADER_NOT_AVAILABLE))})
+                if tp.partition == 1 else MagicMock(**{"result.return_value.offset": 100})
+                for tp in request
+            }
+
+        self.admin_client.list_offsets.side_effect = list_offsets
+        results = self.topic.list_offsets([("topic1", 0), ("topic1", 1)], "latest", timeout=1)
+
+        # the offline partition is left out instead of failing the whole listing
+        self.assertEqual(results, {("topic1", 0): 100})
+
+    def test_get_offsets(self):
+        metadata = self.admin_client.list_topics.return_value
+        metadata.topics = {
+            "topic1": MagicMock(partitions={
+                0: MagicMock(id=0, leader=0),
+                1: MagicMock(id=1, leader=1),
+                2: MagicMock(id=2, leader=0),
+            }),
+            "topic2": MagicMock(partitions={0: MagicMock(id=0, leader=1)}),
+        }
+        offsets = {"earliest": 10, "latest": 100}
+
+        def list_offsets(request, request_timeout):
+            # each request only holds partitions led by the same broker
+            self.assertEqual(len({metadata.topics[tp.topic].partitions[tp.partition].leader for tp in request}), 1)
+            return {
+                tp: MagicMock(**{"result.return_value.offset": offsets.get(str(spec), 50)}) for tp, spec in request.items()
+            }
+
+        self.admin_client.list_offsets.side_effect = list_offsets
+        with patch("kafka.topic.OffsetSpec") as offset_spec:
+            offset_spec.earliest.return_value = "earliest"
+            offset_spec.latest.return_value = "latest"
+            offset_spec.for_timestamp.return_value = "timestamp"
+            results = self.topic.get_offsets(topics=["topic1"], timestamp=1000, timeout=1)
+
+        offset_spec.for_timestamp.assert_called_once_with(1000)
+        self.assertEqual(self.admin_client.list_offsets.call_count, 6)
+        self.assertEqual(list(results.keys()), ["topic1"])
+        self.assertEqual(results["topic1"]["messages"], 270)
+        self.assertEqual(
+            results["topic1"]["partitions"][1],
+            {"partition": 1, "leader": 1, "earliest": 10, "latest": 100, "messages": 90, "timestamp": 50},
+        )
+
     def test_alter(self):
         topic = "topic1"
         config = {"cleanup.policy": "compact"}
@@ -0,0 +1,66 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from confluent_kafka import KafkaException
+from confluent_kafka.admin import ConfigSource
+from kafka.topic_copy import TopicCopy
+from kafka.consumer import Consumer
+from helpers import message
+
+
+class TestTopicCopy(unittest.TestCase):
+
+    def setUp(self):
+        self.source = MagicMock()
+        self.target = MagicMock()
+        self.topic_copy = TopicCopy(self.source, "source:9092", self.target, "target:9092")
+
+    @patch("kafka.topic_copy.Producer")
+    @patch("kafka.topic_copy.Consumer")
+    def test_copy(self, consumer, producer):
+        self.target.list_topics.return_value.topics = {"topic1": MagicMock(partitions={0: None, 1: None})}
+        consumer.return_value.get_ranges.return_value = {0: (0, 2), 1: (5, 6)}
+        consumer.return_value.read_ranges.side_effect = Consumer(self.source).read_ranges
+        consumer.return_value._consumer.return_value.consume.side_effect = [
+            [message(0, value=b"a", key=b"k", headers=[("h", b"v")]), message(5, partition=1, value=b"b")],
+            [message(1, value=b"c"), message(2, value=b"past the end")],
+        ]
+
+        result = self.topic_copy.copy("topic1", timeout=1)
+
+        self.assertEqual(result["messages"], 3)
+        self.assertEqual(result["bytes"], 4)
+        producer.return_value.produce.assert_any_call(
+            "topic1", value=b"a", key=b"k", partition=0, timestamp=1000, headers=[("h", b"v")]
+        )
+        producer.return_value.produce.assert_any_call(
+            "topic1", value=b"b", key=None, partition=1, timestamp=1005, headers=None
+        )
+        producer.return_value.flush.assert_called_once()
+        consumer.return_value._consumer.return_value.close.assert_called_once()
+
+    @patch("kafka.topic_copy.Consumer")
+    def test_copy_checks_target(self, consumer):
+        self.target.list_topics.return_value.topics = {}
+        with self.assertRaises(KafkaException):
+            self.topic_copy.copy("topic1", timeout=1)
+
+        self.target.list_topics.return_value.topics = {"topic1": MagicMock(partitions={0: None})}
+        consumer.return_value.get_ranges.return_value = {0: (0, 2), 1: (5, 6)}
+        with self.assertRaises(KafkaException):
+            self.topic_copy.copy("topic1", timeout=1)
+
+    @patch("kafka.topic_copy.Topic")
+    def test_create_target(self, topic):
+        topic.return_value.describe.return_value = {"topic1": {"partitions": 6, "replicas": 3}}
+        topic.return_value.describe_configs.return_value = {"topic1": {
+            "retention.ms": MagicMock(value="1000", source=ConfigSource.DYNAMIC_TOPIC_CONFIG),
+            "cleanup.policy": MagicMock(value="delete", source=ConfigSource.DEFAULT_CONFIG),
+        }}
+        self.target.list_topics.return_value.brokers = {1: None, 2: None}
+
+        self.assertEqual(self.topic_copy.create_target("topic1", "topic2", timeout=1), 6)
+        topic.return_value.create.assert_called_with("topic2", 6, 2, {"retention.ms": "1000"})
+
+
+if __name__ == "__main__":
+    unittest.main()
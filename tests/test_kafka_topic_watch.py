@@ -0,0 +1,87 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from kafka.topic_watch import TopicWatch
+
+
+def metadata(topics):
+    return MagicMock(topics={
+        name: MagicMock(partitions={
+            i: MagicMock(id=i, leader=leader, replicas=replicas, isrs=isrs) for i, (leader, replicas, isrs) in enumerate(partitions)
+        })
+        for name, partitions in topics.items()
+    })
+
+
+class TestTopicWatch(unittest.TestCase):
+
+    def setUp(self):
+        self.admin_client = MagicMock()
+        self.watch = TopicWatch(admin_client=self.admin_client)
+
+    def test_diff(self):
+        self.admin_client.list_topics.side_effect = [
+            metadata({
+                "topic1": [(0, [0, 1], [0, 1]), (1, [1, 0], [1, 0])],
+                "topic2": [(1, [1, 2], [1])],
+                "topic3": [(0, [0], [0])],
+                "__consumer_offsets": [(0, [0], [0])],
+            }),
+            metadata({
+                "topic1": [(1, [0, 1], [1]), (1, [1, 0], [1, 0])],
+                "topic2": [(1, [1, 2], [1, 2]), (2, [2, 0], [2, 0])],
+                "topic4": [(0, [0], [0])],
+                "__consumer_offsets": [(1, [0], [0])],
+            }),
+        ]
+
+        old = self.watch.snapshot(show_internal=False, timeout=1)
+        new = self.watch.snapshot(show_internal=False, timeout=1)
+        events = TopicWatch.diff(old, new)
+
+        self.assertEqual(events, [
+            {"event": "topic_deleted", "topic": "topic3", "partitions": 1},
+            {"event": "leader_moved", "topic": "topic1", "partition": 0, "old": 0, "new": 1},
+            {"event": "isr_shrunk", "topic": "topic1", "partition": 0, "old": [0, 1], "new": [1]},
+            {"event": "partitions_added", "topic": "topic2", "old": 1, "new": 2},
+            {"event": "isr_expanded", "topic": "topic2", "partition": 0, "old": [1], "new": [1, 2]},
+            {"event": "topic_created", "topic": "topic4", "partitions": 1},
+        ])
+        self.assertEqual(TopicWatch.diff(new, new), [])
+
+    @patch("kafka.topic_watch.time.sleep")
+    def test_watch(self, sleep):
+        self.admin_client.list_topics.side_effect = [
+            metadata({"topic1": [(0, [0, 1], [0, 1])]}),
+            metadata({"topic1": [(0, [0, 1], [0, 1])]}),
+            metadata({"topic1": [(1, [0, 1], [0, 1])]}),
+        ]
+
+        events = self.watch.watch(topics=["topic1"], interval=1, timeout=1)
+        event = next(events)
+
+        # the unchanged refresh yields nothing
+        self.assertEqual(self.admin_client.list_topics.call_count, 3)
+        self.assertEqual(event["event"], "leader_moved")
+        self.assertIn("timestamp", event)
+
+    @patch("kafka.topic_watch.time.sleep")
+    def test_watch_refresh_failed(self, sleep):
+        self.admin_client.list_topics.side_effect = [
+            metadata({"topic1": [(0, [0, 1], [0, 1])]}),
+            Exception("timed out"),
+            metadata({"topic1": [(1, [0, 1], [0, 1])]}),
+        ]
+
+        events = self.watch.watch(topics=["topic1"], interval=1, timeout=1)
+        failed = next(events)
+        event = next(events)
+
+        self.assertEqual(failed["event"], "refresh_failed")
+        self.assertEqual(failed["error"], "timed out")
+        # the change is reported against the model from before the failure
+        self.assertEqual(event["event"], "leader_moved")
+        self.assertEqual((event["old"], event["new"]), (0, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()